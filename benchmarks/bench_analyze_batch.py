@@ -0,0 +1,78 @@
+"""
+Mock-mode throughput of PainAnalyzer.analyze_batch: the original
+iterrows/df.at loop vs the columnar implementation.
+
+    python benchmarks/bench_analyze_batch.py [rows]
+"""
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from painscout.analyzer import PainAnalyzer
+
+
+def make_posts(rows: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    phrases = [
+        "Need a tool that syncs HubSpot and Salesforce",
+        "Zapier is too expensive for our small team",
+        "Our dashboard is so slow and buggy lately",
+        "Wish there was a way to connect Notion to Linear",
+        "lol",
+    ]
+    return pd.DataFrame({
+        "title": [rng.choice(phrases) for _ in range(rows)],
+        "text": [rng.choice(phrases) * rng.randint(0, 5) for _ in range(rows)],
+        "score": [rng.randint(0, 500) for _ in range(rows)],
+        "comments": [rng.randint(0, 100) for _ in range(rows)],
+    })
+
+
+def legacy_analyze_batch(analyzer: PainAnalyzer, df: pd.DataFrame) -> pd.DataFrame:
+    """The pre-columnar mock path: per-row content string and per-cell df.at writes."""
+    df['pain_point'] = None
+    df['sentiment_score'] = 0
+    df['category'] = None
+    df['target_audience'] = None
+    df['urgency'] = 'Low'
+
+    for index, row in df.iterrows():
+        content = f"Title: {row['title']}\nBody: {row['text'][:500]}"
+        if len(content) < 20:
+            continue
+        analysis = analyzer._mock_analyze(content)
+        if analysis:
+            df.at[index, 'pain_point'] = analysis.get('pain_point')
+            df.at[index, 'sentiment_score'] = analysis.get('frustration_score', 0)
+            df.at[index, 'category'] = analysis.get('category')
+            df.at[index, 'target_audience'] = analysis.get('target_audience')
+            df.at[index, 'urgency'] = analysis.get('urgency')
+    return df
+
+
+def timed(label: str, fn, rows: int):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {rows:>8} rows  {elapsed:8.2f}s  {rows / elapsed:12,.0f} rows/s")
+    return elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    analyzer = PainAnalyzer()
+    analyzer.mock_mode = True
+    posts = make_posts(rows)
+
+    before = timed("before", lambda: legacy_analyze_batch(analyzer, posts.copy()), rows)
+    after = timed("after", lambda: analyzer.analyze_batch(posts), rows)
+    print(f"speedup    {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
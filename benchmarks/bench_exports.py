@@ -0,0 +1,59 @@
+"""
+Export cost per format: the old in-memory CSV (to_csv() then encode) vs the
+streaming writers in painscout.exports, to a file on disk. Reports output
+size, write time and peak traced memory (Arrow's own buffers, used by the
+Parquet writer, are not visible to tracemalloc).
+
+    python benchmarks/bench_exports.py [rows]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bench_schema_memory import make_records
+from painscout.exports import EXPORT_FORMATS, export
+from painscout.schema import apply_schema
+
+
+def legacy_csv(df: pd.DataFrame, path: str) -> dict:
+    data = df.to_csv(index=False).encode('utf-8')
+    with open(path, "wb") as f:
+        f.write(data)
+    return {"bytes": len(data)}
+
+
+def measure(label: str, write) -> dict:
+    start = time.perf_counter()
+    result = write()
+    elapsed = time.perf_counter() - start
+    # Separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    write()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"export": label, "mb": result["bytes"] / 2 ** 20, "seconds": elapsed, "peak_mb": peak / 2 ** 20}
+
+
+def main(rows: int = 200_000):
+    df = apply_schema(pd.DataFrame(make_records(rows)))
+    print(f"{rows} rows, {df.memory_usage(deep=True).sum() / 2 ** 20:.1f} MB in memory\n")
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        results.append(measure("csv (in-memory)", lambda: legacy_csv(df, os.path.join(directory, "legacy.csv"))))
+        for fmt, (extension, _) in EXPORT_FORMATS.items():
+            path = os.path.join(directory, f"export{extension}")
+            results.append(measure(fmt, lambda: export(df, path, fmt)))
+
+    print(pd.DataFrame(results).to_string(index=False, float_format=lambda v: f"{v:,.2f}"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,75 @@
+"""
+Reporter.generate_full_report (complete ranked list by category) at growing
+row counts: wall time, time per row (should stay flat), peak traced memory,
+page count and file size. Also times the 10-row generate_pdf for reference.
+
+    python benchmarks/bench_full_report.py --sizes 1000,10000,100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bench_schema_memory import make_records
+from painscout.reporter import Reporter
+from painscout.schema import apply_schema
+
+
+def summary_stats(df: pd.DataFrame) -> dict:
+    return {
+        'total_posts': len(df),
+        'top_category': df['category'].mode()[0],
+        'high_urgency_count': int((df['urgency'] == 'High').sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            df = apply_schema(pd.DataFrame(make_records(size)))
+            stats = summary_stats(df)
+            path = os.path.join(directory, f"report_{size}.pdf")
+
+            start = time.perf_counter()
+            Reporter.generate_pdf(df, stats)
+            top10 = time.perf_counter() - start
+
+            start = time.perf_counter()
+            Reporter.generate_full_report(df, stats, path=path)
+            elapsed = time.perf_counter() - start
+
+            # Separate pass: tracemalloc slows allocation-heavy code down
+            tracemalloc.start()
+            Reporter.generate_full_report(df, stats, path=path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            with open(path, "rb") as f:
+                pages = f.read().count(b"/Type /Page\n")
+            rows.append({
+                "rows": size,
+                "top10_s": top10,
+                "full_s": elapsed,
+                "us_per_row": elapsed / size * 1e6,
+                "peak_mb": peak / 2 ** 20,
+                "pages": pages,
+                "pdf_mb": os.path.getsize(path) / 2 ** 20,
+            })
+
+    print(pd.DataFrame(rows).to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+
+
+if __name__ == "__main__":
+    main()
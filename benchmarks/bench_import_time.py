@@ -0,0 +1,84 @@
+"""
+Cold import cost of the painscout modules, measured with `python -X importtime`
+in a fresh interpreter per run. Fails (exit 1) when a module exceeds its
+budget or drags in a heavy dependency that should only load on first use.
+
+    python benchmarks/bench_import_time.py [runs]
+"""
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Cumulative import time budgets in milliseconds (best of `runs`)
+BUDGETS_MS = {
+    "painscout.config": 60,
+    "painscout.transport": 100,
+    "painscout.store": 100,
+    "painscout.scraper": 150,
+    "painscout.cli": 100,
+    "painscout.analyzer": 900,
+    "painscout.pipeline": 900,
+}
+
+# Dependencies each module must not import eagerly
+DEFERRED = {
+    "painscout.transport": ["requests"],
+    "painscout.scraper": ["streamlit", "tweepy", "requests", "pandas"],
+    "painscout.cli": ["streamlit", "pandas", "google.generativeai"],
+    "painscout.analyzer": ["google.generativeai", "streamlit"],
+    "painscout.pipeline": ["google.generativeai", "tweepy", "streamlit", "sklearn", "scipy"],
+}
+
+
+def import_profile(module: str) -> Tuple[int, Dict[str, int]]:
+    """(cumulative µs of `module`, self µs of every module it imported)."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    total = 0
+    self_times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[0].isdigit():
+            continue  # header
+        name = parts[2]
+        self_times[name.strip()] = int(parts[0])
+        if name.strip() == module:
+            total = int(parts[1])
+    return total, self_times
+
+
+def main(runs: int = 3) -> int:
+    failures: List[str] = []
+    print(f"{'module':<24}{'best ms':>10}{'budget':>10}  heaviest imports")
+    for module, budget in BUDGETS_MS.items():
+        best, profile = None, {}
+        for _ in range(runs):
+            total, self_times = import_profile(module)
+            if best is None or total < best:
+                best, profile = total, self_times
+        best_ms = best / 1000
+        heaviest = sorted(profile.items(), key=lambda item: item[1], reverse=True)[:3]
+        summary = ", ".join(f"{name} {us / 1000:.0f}ms" for name, us in heaviest)
+        print(f"{module:<24}{best_ms:>10.1f}{budget:>10}  {summary}")
+
+        if best_ms > budget:
+            failures.append(f"{module} took {best_ms:.1f}ms (budget {budget}ms)")
+        leaked = [dep for dep in DEFERRED.get(module, []) if dep in profile]
+        if leaked:
+            failures.append(f"{module} eagerly imports {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 3))
@@ -0,0 +1,149 @@
+"""
+Offline throughput/latency benchmark of RedditScraper.run_scan (Reddit deep
+scan and X search) and PainAnalyzer.analyze_batch against the local stand-ins
+in benchmarks/standins.py. Reports rows/s, p50/p95/p99 per-request latency,
+stand-in failures served and peak traced memory for several dataset sizes.
+
+    python benchmarks/bench_offline.py --sizes 200,1000,5000 --latency-ms 50 --error-rate 0.02 --throttle-rate 0.02
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from standins import Behavior, StandInServer
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+class LatencyProbe:
+    """Wraps a bound method and records the wall time of every call (thread-safe)."""
+
+    def __init__(self, owner, name: str):
+        self.samples: List[float] = []
+        self._lock = threading.Lock()
+        original = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.samples.append(time.perf_counter() - start)
+
+        setattr(owner, name, timed)
+
+
+def measure(label: str, size: int, rows_of: Callable, run: Callable, probe: LatencyProbe, server: StandInServer, api: str) -> Dict:
+    server.reset_counters()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rows = rows_of(result)
+    latencies = [s * 1000 for s in probe.samples]
+    probe.samples.clear()
+    return {
+        "stage": label,
+        "size": size,
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_s": rows / elapsed if elapsed else 0.0,
+        "calls": len(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "failures": server.failures[api],
+        "peak_mb": peak / 2 ** 20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="200,1000,5000", help="posts per subreddit / rows analyzed")
+    parser.add_argument("--subreddits", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=50, help="Pushshift and X latency")
+    parser.add_argument("--llm-latency-ms", type=float, default=400, help="Gemini latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on 429s")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    def behavior(latency):
+        return Behavior(latency_ms=latency, error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=args.retry_after)
+
+    server = StandInServer(pushshift=behavior(args.latency_ms), x=behavior(args.latency_ms),
+                           gemini=behavior(args.llm_latency_ms), posts_per_subreddit=max(sizes)).start()
+
+    # Must be in place before painscout.config is imported
+    os.environ.update({
+        "PUSHSHIFT_BASE_URL": f"{server.url}/reddit/search/submission/",
+        "X_API_BASE_URL": server.url,
+        "GEMINI_API_ENDPOINT": server.url,
+        "REDDIT_CLIENT_ID": "bench", "GEMINI_API_KEY": "bench", "TWITTER_BEARER_TOKEN": "bench",
+        "MOCK_MODE": "False", "POST_STORE_ENABLED": "False", "ANALYSIS_CACHE_ENABLED": "False",
+    })
+    os.environ.setdefault("HTTP_RATE_LIMIT", "50")
+    os.environ.setdefault("HTTP_BURST", "20")
+
+    import pandas as pd
+    from painscout.analyzer import PainAnalyzer
+    from painscout.scraper import RedditScraper
+
+    subreddits = [f"Bench{i}" for i in range(args.subreddits)]
+    for subreddit in subreddits:
+        server._subreddit_posts(subreddit)
+    # Client creation and lazy imports are start-up costs, not per-request latency
+    PainAnalyzer().model
+    RedditScraper().transport.get(f"{server.url}/reddit/search/submission/", params={"size": 1})
+
+    rows = []
+    for size in sizes:
+        scraper = RedditScraper()
+        probe = LatencyProbe(scraper.transport, "get")
+        rows.append(measure(
+            "reddit deep scan", size * len(subreddits), len,
+            lambda: scraper.run_scan(subreddits, ["need"], days=30, deep=True, max_posts=size),
+            probe, server, "pushshift",
+        ))
+
+        server.tweets_per_query = size
+        x_probe = LatencyProbe(scraper.twitter_client, "search_recent_tweets")
+        rows.append(measure(
+            "x search", size, len,
+            lambda: scraper.run_scan(["crm"], [], days=7, source="X (Twitter)"),
+            x_probe, server, "x",
+        ))
+
+        posts = pd.DataFrame([scraper._reddit_record(p, "Bench0") for p in server._subreddit_posts("Bench0")[:size]])
+        analyzer = PainAnalyzer()
+        analyzer.model
+        llm_probe = LatencyProbe(analyzer, "_generate")
+        rows.append(measure(
+            "analyze_batch", size, lambda df: int(df['pain_point'].notna().sum()),
+            lambda: analyzer.analyze_batch(posts),
+            llm_probe, server, "gemini",
+        ))
+
+    server.stop()
+    report = pd.DataFrame(rows)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Memory footprint and sort/group-by speed of analyzed results as the scraper
+builds them (DataFrame of dicts) vs after painscout.schema.apply_schema.
+
+    python benchmarks/bench_schema_memory.py [rows]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from painscout.schema import apply_schema, memory_report
+
+
+def make_records(rows: int) -> list:
+    rng = np.random.default_rng(42)
+    subreddits = ["SaaS", "Entrepreneur", "startups", "sales", "marketing", "smallbusiness"]
+    categories = ["CRM", "Marketing Automation", "Sales Tools", "Productivity", "AI Writing", "Integrations"]
+    urgencies = ["Low", "Medium", "High"]
+    scores = rng.integers(0, 2000, rows)
+    comments = rng.integers(0, 300, rows)
+    sentiment = rng.integers(1, 11, rows)
+    days = rng.integers(1, 28, rows)
+    return [
+        {
+            "source": "Reddit",
+            "sub_source": f"r/{subreddits[i % 6]}",
+            "id": f"t3_{i:08x}",
+            "title": f"Need a tool that syncs HubSpot and Salesforce #{i}",
+            "text": "Every week we waste hours copying records between tools manually. " * 2,
+            "url": f"https://reddit.com/r/{subreddits[i % 6]}/comments/{i:08x}",
+            "score": int(scores[i]),
+            "comments": int(comments[i]),
+            "created_at": f"2026-01-{days[i]:02d}T12:00:00",
+            "author": f"user_{i % 5000}",
+            "pain_point": f"Manual CRM sync between HubSpot and Salesforce ({i % 1000})",
+            "sentiment_score": int(sentiment[i]),
+            "category": categories[i % 6],
+            "target_audience": "Sales ops teams",
+            "urgency": urgencies[i % 3],
+        }
+        for i in range(rows)
+    ]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def workload(df: pd.DataFrame) -> dict:
+    return {
+        "sort": timed(lambda: df.sort_values(["urgency", "sentiment_score", "comments"], ascending=False)),
+        "groupby": timed(lambda: df.groupby(["category", "sub_source"], observed=True)["score"].agg(["sum", "mean", "size"])),
+    }
+
+
+def main(rows: int = 1_000_000):
+    baseline = pd.DataFrame(make_records(rows))
+    start = time.perf_counter()
+    typed = apply_schema(baseline)
+    convert = time.perf_counter() - start
+
+    before = memory_report(baseline)
+    after = memory_report(typed)
+    print(f"{rows} rows (apply_schema took {convert:.2f}s)\n")
+    print(pd.concat({"before": before, "after": after}, axis=1).to_string())
+
+    base_times, typed_times = workload(baseline), workload(typed)
+    total_before, total_after = before.loc["TOTAL", "mb"], after.loc["TOTAL", "mb"]
+    print(f"\nmemory: {total_before:.1f} MB -> {total_after:.1f} MB ({total_after / total_before:.0%})")
+    for name in base_times:
+        print(f"{name}: {base_times[name]:.3f}s -> {typed_times[name]:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
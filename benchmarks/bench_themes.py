@@ -0,0 +1,87 @@
+"""
+Theme clustering (painscout.themes) on synthetic posts drawn from a few known
+topics: TF-IDF build time, total clustering time, themes found, purity
+(share of posts whose theme is dominated by their true topic) and the share
+of LLM calls saved when only theme representatives are analyzed.
+
+    python benchmarks/bench_themes.py --sizes 10000,100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from painscout.themes import cluster_themes, tfidf_matrix
+
+TOPICS = [
+    ("Zapier is too expensive", "zapier pricing automation cost per task workflow bill expensive cheaper alternative"),
+    ("HubSpot and Salesforce keep duplicating contacts", "hubspot salesforce crm sync duplicates contacts integration records"),
+    ("Invoicing software for a small agency", "invoicing invoice billing clients payments quickbooks accounting late"),
+    ("Cold email tool that actually lands in the inbox", "cold email outreach sequences deliverability spam inbox copywriting"),
+    ("Two-way sync between Notion and Linear", "notion linear tasks issues sync roadmap project management"),
+    ("Our analytics dashboard is painfully slow", "dashboard slow loading performance reports analytics timeout"),
+    ("Onboarding new hires takes forever", "onboarding hires checklist training documentation hr manual"),
+    ("Customer support inbox is a mess", "support tickets inbox helpdesk zendesk response customers backlog"),
+]
+FILLER = "the we our team every week really just need tool help any recommendations honestly".split()
+
+
+def make_posts(rows: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    topics = rng.integers(0, len(TOPICS), rows)
+    vocabularies = [words.split() for _, words in TOPICS]
+    posts = []
+    for i, topic in enumerate(topics):
+        body = rng.choice(vocabularies[topic], 14).tolist() + rng.choice(FILLER, 10).tolist()
+        rng.shuffle(body)
+        posts.append({
+            "title": f"{TOPICS[topic][0]} ({i % 97})",
+            "text": " ".join(body),
+            "score": int(rng.integers(0, 800)),
+            "comments": int(rng.integers(0, 120)),
+        })
+    return pd.DataFrame(posts), topics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+
+    # Warm up: the first call pays for importing scipy / scikit-learn
+    cluster_themes(make_posts(200)[0])
+
+    results = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        df, topics = make_posts(size)
+        texts = df['title'] + " " + df['text']
+
+        start = time.perf_counter()
+        matrix, _ = tfidf_matrix(texts)
+        tfidf = time.perf_counter() - start
+
+        start = time.perf_counter()
+        themes, _, representatives = cluster_themes(df)
+        elapsed = time.perf_counter() - start
+
+        dominant = pd.crosstab(themes.to_numpy(), topics).max(axis=1).sum()
+        results.append({
+            "posts": size,
+            "terms": matrix.shape[1],
+            "tfidf_s": tfidf,
+            "cluster_s": elapsed,
+            "themes": len(representatives),
+            "purity": dominant / size,
+            "llm_calls_saved": 1 - len(representatives) / size,
+        })
+
+    print(pd.DataFrame(results).to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+
+
+if __name__ == "__main__":
+    main()
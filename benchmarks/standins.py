@@ -0,0 +1,236 @@
+"""
+Local stand-ins for the external APIs painscout talks to, for offline benchmarks:
+
+- Pushshift   GET  /reddit/search/submission/   (subreddit, after, before, size, sort_type)
+- X v2        GET  /2/tweets/search/recent       (query, max_results, next_token)
+- Gemini      POST /v1beta/models/<model>:generateContent   (single-post and batch prompts)
+
+Each API has its own latency, error rate and 429 rate; responses are
+deterministic synthetic data. Point painscout at it with
+PUSHSHIFT_BASE_URL, X_API_BASE_URL and GEMINI_API_ENDPOINT.
+"""
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+PAIN_TITLES = [
+    "Need a tool that automatically merges HubSpot + Salesforce duplicates",
+    "Wish there was a proper two-way sync between Notion and Linear",
+    "Looking for alternative to Zapier that doesn't cost $800/mo",
+    "Our invoicing software is too expensive for a 5 person team",
+    "Is there any tool that writes decent cold email sequences?",
+    "We're hiring a growth marketer, check out my profile",
+]
+CATEGORIES = ["Integration", "Pricing", "UI/UX", "Missing Feature", "Customer Support", "Performance"]
+BATCH_ID_RE = re.compile(r"^\[(\S+)\]$", re.MULTILINE)
+
+
+class Behavior:
+    """Latency and failure profile of one stand-in API."""
+
+    def __init__(self, latency_ms: float = 50, jitter: float = 0.5, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: float = 1.0):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+
+
+class StandInServer:
+    """Threaded HTTP server emulating Pushshift, X search and Gemini on one local port."""
+
+    def __init__(self, pushshift: Optional[Behavior] = None, x: Optional[Behavior] = None, gemini: Optional[Behavior] = None,
+                 posts_per_subreddit: int = 1000, tweets_per_query: int = 300, window_days: int = 30, seed: int = 7):
+        self.behaviors = {"pushshift": pushshift or Behavior(), "x": x or Behavior(), "gemini": gemini or Behavior(latency_ms=400)}
+        self.posts_per_subreddit = posts_per_subreddit
+        self.tweets_per_query = tweets_per_query
+        self.window_days = window_days
+        self.seed = seed
+        self.requests = {name: 0 for name in self.behaviors}
+        self.failures = {name: 0 for name in self.behaviors}
+        self._posts: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+        self._now = int(time.time())
+
+        handler = self._handler_class()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="standins", daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def start(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset_counters(self):
+        with self._lock:
+            for name in self.behaviors:
+                self.requests[name] = 0
+                self.failures[name] = 0
+
+    # --- Synthetic data ---
+
+    def _subreddit_posts(self, subreddit: str) -> List[Dict]:
+        """Newest-first posts spread evenly over the window (generated once per subreddit)."""
+        with self._lock:
+            posts = self._posts.get(subreddit)
+            if posts is None:
+                rng = random.Random(f"{self.seed}:{subreddit}")
+                span = self.window_days * 86400
+                step = span / max(self.posts_per_subreddit, 1)
+                posts = [
+                    {
+                        "id": f"{subreddit[:3].lower()}{i:07d}",
+                        "title": f"{rng.choice(PAIN_TITLES)} ({subreddit} #{i})",
+                        "selftext": "Every week we waste hours on this. " * rng.randint(0, 6),
+                        "full_link": f"https://reddit.com/r/{subreddit}/comments/{i:07d}",
+                        "score": rng.randint(0, 800),
+                        "num_comments": rng.randint(0, 120),
+                        "created_utc": int(self._now - 60 - i * step),
+                        "author": f"user_{rng.randint(1, 5000)}",
+                    }
+                    for i in range(self.posts_per_subreddit)
+                ]
+                self._posts[subreddit] = posts
+        return posts
+
+    def pushshift(self, params: Dict[str, str]) -> Dict:
+        posts = self._subreddit_posts(params.get("subreddit", "all"))
+        after = int(float(params.get("after", 0)))
+        before = int(float(params["before"])) if "before" in params else None
+        size = min(int(params.get("size", 25)), 1000)
+        selected = [p for p in posts if p["created_utc"] > after and (before is None or p["created_utc"] < before)]
+        if params.get("sort_type") == "score":
+            selected = sorted(selected, key=lambda p: p["score"], reverse=True)
+        return {"data": selected[:size]}
+
+    def x_search(self, params: Dict[str, str]) -> Dict:
+        query = params.get("query", "")
+        offset = int(params.get("next_token", 0) or 0)
+        count = max(10, min(100, int(params.get("max_results", 10))))
+        end = min(offset + count, self.tweets_per_query)
+        rng = random.Random(f"{self.seed}:{query}:{offset}")
+        base = abs(hash(query)) % 10 ** 8
+        data = []
+        for i in range(offset, end):
+            created = datetime.fromtimestamp(self._now - 30 - i * 60, tz=timezone.utc)
+            data.append({
+                "id": str(10 ** 17 + base * 1000 + i),
+                "text": f"{rng.choice(PAIN_TITLES)} #{i}",
+                "author_id": str(rng.randint(1, 10 ** 6)),
+                "created_at": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "public_metrics": {"retweet_count": rng.randint(0, 50), "reply_count": rng.randint(0, 40),
+                                   "like_count": rng.randint(0, 300), "quote_count": 0},
+            })
+        meta = {"result_count": len(data)}
+        if end < self.tweets_per_query:
+            meta["next_token"] = str(end)
+        return {"data": data, "meta": meta} if data else {"meta": {"result_count": 0}}
+
+    @staticmethod
+    def _analysis(seed: str) -> Dict:
+        rng = random.Random(seed)
+        if rng.random() < 0.15:
+            return {"pain_point": None}
+        return {
+            "pain_point": f"Needs {rng.choice(['cheaper', 'simpler', 'faster', 'integrated'])} tooling",
+            "frustration_score": rng.randint(1, 10),
+            "category": rng.choice(CATEGORIES),
+            "target_audience": rng.choice(["Sales Ops", "Founders", "Marketing Agency", "Developer"]),
+            "urgency": rng.choice(["Low", "Medium", "High"]),
+        }
+
+    def gemini(self, body: Dict) -> Dict:
+        prompt = "".join(part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", []))
+        ids = BATCH_ID_RE.findall(prompt)
+        if ids:
+            answer = [dict(self._analysis(post_id), id=post_id) for post_id in ids]
+        else:
+            answer = self._analysis(prompt)
+            answer = answer if answer.get("pain_point") else None
+        return {
+            "candidates": [{
+                "content": {"parts": [{"text": json.dumps(answer)}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0,
+            }]
+        }
+
+    # --- HTTP plumbing ---
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _misbehave(self, api: str) -> bool:
+                """Applies the API's latency and, sometimes, a 429 or 500 instead of an answer."""
+                behavior = server.behaviors[api]
+                with server._lock:
+                    server.requests[api] += 1
+                delay = behavior.latency_ms / 1000 * (1 + random.uniform(-behavior.jitter, behavior.jitter))
+                time.sleep(max(0.0, delay))
+                roll = random.random()
+                if roll < behavior.throttle_rate:
+                    with server._lock:
+                        server.failures[api] += 1
+                    self._send(429, {"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}},
+                               {"Retry-After": str(behavior.retry_after), "x-rate-limit-reset": str(int(time.time() + behavior.retry_after))})
+                    return True
+                if roll < behavior.throttle_rate + behavior.error_rate:
+                    with server._lock:
+                        server.failures[api] += 1
+                    self._send(500, {"error": {"code": 500, "message": "Internal error", "status": "INTERNAL"}})
+                    return True
+                return False
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+                if parts.path.startswith("/reddit/search/submission"):
+                    if not self._misbehave("pushshift"):
+                        self._send(200, server.pushshift(params))
+                elif parts.path.startswith("/2/tweets/search/recent"):
+                    if not self._misbehave("x"):
+                        self._send(200, server.x_search(params))
+                else:
+                    self._send(404, {"error": "unknown endpoint"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if ":generateContent" in self.path:
+                    if not self._misbehave("gemini"):
+                        self._send(200, server.gemini(body))
+                else:
+                    self._send(404, {"error": "unknown endpoint"})
+
+        return Handler
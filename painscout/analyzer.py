@@ -1,60 +1,22 @@
-import google.generativeai as genai
 import pandas as pd
+import numpy as np
 import json
+import hashlib
 from painscout.config import Config
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Tuple
+from painscout.transport import AIMDLimiter
+from painscout.cache import AnalysisCache, content_key
+from painscout.profiling import profiled
+from painscout.schema import apply_schema
+from painscout.metrics import METRICS
 
-class PainAnalyzer:
-    def __init__(self):
-        self.mock_mode = Config.MOCK_MODE
-        if not self.mock_mode:
-            if not Config.GEMINI_API_KEY:
-                 self.mock_mode = True
-            else:
-                genai.configure(api_key=Config.GEMINI_API_KEY)
-                self.model = genai.GenerativeModel('gemini-pro')
-
-    def analyze_batch(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df.empty:
-            return df
+MODEL_NAME = 'gemini-pro'
 
-        df['pain_point'] = None
-        df['sentiment_score'] = 0
-        df['category'] = None
-        df['target_audience'] = None
-        df['urgency'] = 'Low'
-        
-        print("Starting AI analysis..." if not self.mock_mode else "Starting Mock AI Analysis...")
-        
-        for index, row in df.iterrows():
-            content = f"Title: {row['title']}\nBody: {row['text'][:500]}"
-            if len(content) < 20:
-                continue
-                
-            try:
-                if self.mock_mode:
-                    analysis = self._mock_analyze(content)
-                else:
-                    analysis = self._analyze_single_post(content)
-                    # Rate limit safety
-                    time.sleep(1) 
-
-                if analysis:
-                    df.at[index, 'pain_point'] = analysis.get('pain_point')
-                    df.at[index, 'sentiment_score'] = analysis.get('frustration_score', 0)
-                    df.at[index, 'category'] = analysis.get('category')
-                    df.at[index, 'target_audience'] = analysis.get('target_audience')
-                    df.at[index, 'urgency'] = analysis.get('urgency')
-                
-            except Exception as e:
-                print(f"Error analyzing post {index}: {e}")
-                continue
-                
-        return df
-
-    def _analyze_single_post(self, text: str) -> dict:
-        prompt = f"""
+SINGLE_POST_PROMPT = """
         Analyze the following social media post for B2B software pain points.
         Return ONLY a raw JSON object (no markdown formatting) with the following keys:
         - "pain_point": Brief summary of the problem/need (max 10 words).
@@ -68,20 +30,326 @@ class PainAnalyzer:
         Post content:
         {text}
         """
+
+BATCH_PROMPT = """
+        Analyze each of the following social media posts for B2B software pain points.
+        Each post starts with its id in square brackets, e.g. [p0].
+        Return ONLY a raw JSON array (no markdown formatting) with exactly one object per post and the following keys:
+        - "id": The post id, without brackets.
+        - "pain_point": Brief summary of the problem/need (max 10 words), or null if no clear pain point exists.
+        - "frustration_score": Integer 1-10 (10 being extremely frustrated/urgent).
+        - "category": One of [Integration, Pricing, UI/UX, Missing Feature, Customer Support, Performance].
+        - "target_audience": Guessed role or industry (e.g., "Marketing Agency", "Developer").
+        - "urgency": "High", "Medium", or "Low".
+
+        Posts:
+        {posts_block}
+        """
+
+# Cached analyses are keyed on this, so editing either prompt invalidates them
+PROMPT_VERSION = hashlib.sha256((SINGLE_POST_PROMPT + BATCH_PROMPT).encode("utf-8")).hexdigest()[:16]
+
+class AnalysisColumns:
+    """Per-column result buffers, attached to the frame in one bulk assign()."""
+
+    def __init__(self, size: int):
+        self.pain_point = [None] * size
+        self.sentiment_score = [0] * size
+        self.category = [None] * size
+        self.target_audience = [None] * size
+        self.urgency = ['Low'] * size
+
+    def write(self, position: int, analysis: dict):
+        if not analysis:
+            return
+        self.pain_point[position] = analysis.get('pain_point')
+        self.sentiment_score[position] = analysis.get('frustration_score', 0)
+        self.category[position] = analysis.get('category')
+        self.target_audience[position] = analysis.get('target_audience')
+        self.urgency[position] = analysis.get('urgency')
+
+    def attach(self, df: pd.DataFrame) -> pd.DataFrame:
+        scores = pd.to_numeric(pd.Series(self.sentiment_score, index=df.index), errors='coerce')
+        # Typed once here (small ints, categoricals, Arrow strings) instead of object columns
+        return apply_schema(df.assign(
+            pain_point=pd.Series(self.pain_point, index=df.index, dtype=object),
+            sentiment_score=scores.fillna(0),
+            category=pd.Series(self.category, index=df.index, dtype=object),
+            target_audience=pd.Series(self.target_audience, index=df.index, dtype=object),
+            urgency=pd.Series(self.urgency, index=df.index, dtype=object)
+        ))
+
+class PainAnalyzer:
+    def __init__(self, cache: AnalysisCache = None):
+        self.mock_mode = Config.MOCK_MODE
+        self.model_name = MODEL_NAME
+        if not self.mock_mode and not Config.GEMINI_API_KEY:
+             self.mock_mode = True
+        # The Gemini client is created on the first real call (see `model`)
+        self._model = None
+        self._model_lock = threading.Lock()
+        # Persistent result cache; mock results are free and random, so never cached
+        self.cache = cache
+        if self.cache is None and Config.ANALYSIS_CACHE_ENABLED and not self.mock_mode:
+            try:
+                self.cache = AnalysisCache()
+            except Exception as e:
+                print(f"Analysis cache unavailable: {e}")
+        # Shared across analyze_batch calls so the learned limit carries over
+        self.limiter = AIMDLimiter(
+            initial=Config.LLM_INITIAL_CONCURRENCY,
+            maximum=Config.LLM_MAX_CONCURRENCY
+        )
+
+    @property
+    def model(self):
+        # google.generativeai is the slowest import in the app; mock mode never pays for it
+        with self._model_lock:
+            if self._model is None:
+                import google.generativeai as genai
+                if Config.GEMINI_API_ENDPOINT:
+                    genai.configure(api_key=Config.GEMINI_API_KEY, transport="rest",
+                                    client_options={"api_endpoint": Config.GEMINI_API_ENDPOINT})
+                else:
+                    genai.configure(api_key=Config.GEMINI_API_KEY)
+                self._model = genai.GenerativeModel(self.model_name)
+            return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+
+    def analyze_batch(self, df: pd.DataFrame, batched: bool = None) -> pd.DataFrame:
+        """
+        Returns a copy of `df` with the analysis columns added.
+        With `batched` (default Config.LLM_BATCHED) many posts are packed into
+        each Gemini prompt; otherwise every post gets its own call. Gemini calls
+        run on a thread pool whose effective concurrency is set by self.limiter.
+        Results are collected per column and attached in a single assign().
+        """
+        if df.empty:
+            return df
+
+        with METRICS.stage("analyze") as stage:
+            stage.rows = len(df)
+            analyzed = self._analyze(df, batched)
+        METRICS.inc("pain_points_total", int(analyzed['pain_point'].notna().sum()))
+        return analyzed
+
+    def _analyze(self, df: pd.DataFrame, batched: bool) -> pd.DataFrame:
+        print("Starting AI analysis..." if not self.mock_mode else "Starting Mock AI Analysis...")
+        columns = AnalysisColumns(len(df))
+
+        if batched is None:
+            batched = Config.LLM_BATCHED
+        if batched and not self.mock_mode:
+            self._analyze_batched(df, columns)
+            return columns.attach(df)
+
+        contents = self._build_contents(df, max_body=500)
+        positions = np.flatnonzero((contents.str.len() >= 20).to_numpy())
+        texts = contents.to_numpy()
         
-        try:
-            response = self.model.generate_content(prompt)
-            cleaned_text = response.text.strip()
-            if cleaned_text.startswith("```json"):
-                cleaned_text = cleaned_text[7:]
-            if cleaned_text.endswith("```"):
-                cleaned_text = cleaned_text[:-3]
+        if self.mock_mode:
+            for position in positions:
+                columns.write(position, self._mock_analyze(texts[position]))
+            return columns.attach(df)
+
+        # Results are written back by row position, in whatever order calls finish
+        jobs = [(position, texts[position]) for position in positions]
+        for position, analysis in self._run_concurrent(self._analyze_single_post, jobs):
+            columns.write(position, analysis)
                 
-            data = json.loads(cleaned_text)
-            return data
+        return columns.attach(df)
+
+    @staticmethod
+    def _build_contents(df: pd.DataFrame, max_body: int = None, max_chars: int = None) -> pd.Series:
+        """Vectorized "Title: ...\nBody: ..." prompt text for every row."""
+        title = df['title'].fillna('').astype(str)
+        body = df['text'].fillna('').astype(str)
+        if max_body is not None:
+            body = body.str[:max_body]
+        contents = "Title: " + title + "\nBody: " + body
+        if max_chars is not None:
+            contents = contents.str[:max_chars]
+        return contents
+
+    def _run_concurrent(self, fn: Callable, jobs: List[Tuple[object, object]]) -> Iterator[Tuple[object, object]]:
+        """Runs fn(arg) for each (key, arg) job on a pool; yields (key, result) as each finishes."""
+        fn = profiled(fn)
+        with ThreadPoolExecutor(max_workers=Config.LLM_MAX_CONCURRENCY) as executor:
+            futures = {executor.submit(fn, arg): key for key, arg in jobs}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    yield key, future.result()
+                except Exception as e:
+                    print(f"Error analyzing post {key}: {e}")
+
+    @staticmethod
+    def _is_quota_error(error: Exception) -> bool:
+        # google.api_core raises ResourceExhausted (HTTP 429) when over quota
+        name = type(error).__name__
+        return name in ("ResourceExhausted", "TooManyRequests") or "429" in str(error)
+
+    def _generate(self, prompt: str) -> str:
+        """
+        One Gemini call under the AIMD limiter. Quota errors shrink the limit
+        and are retried with jittered backoff; other errors propagate.
+        """
+        for attempt in range(Config.LLM_MAX_RETRIES + 1):
+            self.limiter.acquire()
+            METRICS.inc("llm_calls_total")
+            try:
+                with METRICS.timer("llm_latency_seconds"):
+                    response = self.model.generate_content(prompt)
+            except Exception as e:
+                throttled = self._is_quota_error(e)
+                self.limiter.release(throttled=throttled)
+                METRICS.set("llm_concurrency_limit", self.limiter.limit)
+                METRICS.inc("llm_throttled_total" if throttled else "llm_errors_total")
+                if not throttled or attempt == Config.LLM_MAX_RETRIES:
+                    raise
+                METRICS.inc("llm_retries_total")
+                time.sleep(random.uniform(0, min(30, 2 ** attempt)))
+                continue
+            self.limiter.release()
+            METRICS.set("llm_concurrency_limit", self.limiter.limit)
+            return response.text
+
+    # --- Batched mode ---
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # ~4 characters per token is close enough for budgeting
+        return len(text) // 4 + 1
+
+    def _pack_batches(self, items: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        """Greedily packs (id, content) items into batches under the token budget."""
+        budget = Config.LLM_BATCH_TOKEN_BUDGET
+        batches = []
+        current = []
+        used = 0
+        for item in items:
+            cost = self._estimate_tokens(item[1]) + 8  # id tag + separator
+            if current and (used + cost > budget or len(current) >= Config.LLM_MAX_BATCH_SIZE):
+                batches.append(current)
+                current = []
+                used = 0
+            current.append(item)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _analyze_batched(self, df: pd.DataFrame, columns: "AnalysisColumns"):
+        # Per-post cap comes from the token budget instead of a fixed text[:500]
+        contents = self._build_contents(df, max_chars=Config.LLM_MAX_POST_TOKENS * 4)
+        positions = np.flatnonzero((contents.str.len() >= 20).to_numpy())
+        texts = contents.to_numpy()
+
+        items = []
+        key_by_id = {}
+        for position in positions:
+            content = texts[position]
+            post_id = f"p{position}"
+            if self.cache:
+                key_by_id[post_id] = self._cache_key(content)
+                cached = self.cache.get(key_by_id[post_id])
+                if cached is not None:
+                    # Already analyzed in an earlier scan
+                    columns.write(position, cached)
+                    continue
+            items.append((post_id, content))
+
+        batches = list(enumerate(self._pack_batches(items)))
+        for _, batch_results in self._run_concurrent(self._analyze_batch_resilient, batches):
+            for post_id, analysis in batch_results.items():
+                if self.cache:
+                    self.cache.put(key_by_id[post_id], analysis or {})
+                columns.write(int(post_id[1:]), analysis)
+
+    def _analyze_batch_resilient(self, items: List[Tuple[str, str]]) -> Dict[str, dict]:
+        """
+        Runs one batched call; any ids missing from the answer (failed call,
+        truncated or malformed JSON) are retried in two smaller halves, so
+        results already returned are kept.
+        """
+        results = self._analyze_post_batch(items)
+
+        missing = [item for item in items if item[0] not in results]
+        if not missing:
+            return results
+        if len(missing) == 1:
+            # _analyze_batched already looked this post up and caches the result
+            analysis = self._analyze_single_post(missing[0][1], use_cache=False)
+            if analysis:
+                results[missing[0][0]] = analysis
+            return results
+
+        middle = len(missing) // 2
+        results.update(self._analyze_batch_resilient(missing[:middle]))
+        results.update(self._analyze_batch_resilient(missing[middle:]))
+        return results
+
+    def _analyze_post_batch(self, items: List[Tuple[str, str]]) -> Dict[str, dict]:
+        """Analyzes several posts in one prompt; returns {post id: analysis}."""
+        posts_block = "\n\n".join(f"[{post_id}]\n{content}" for post_id, content in items)
+        prompt = BATCH_PROMPT.format(posts_block=posts_block)
+
+        try:
+            data = json.loads(self._strip_code_fence(self._generate(prompt)))
+        except Exception as e:
+            print(f"Batch analysis failed for {len(items)} posts: {e}")
+            return {}
+
+        if not isinstance(data, list):
+            return {}
+
+        expected = {post_id for post_id, _ in items}
+        results = {}
+        for entry in data:
+            if isinstance(entry, dict) and str(entry.get('id')) in expected:
+                post_id = str(entry.pop('id'))
+                # A post without a pain point is still a valid answer
+                results[post_id] = entry if entry.get('pain_point') else {}
+        return results
+
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        cleaned_text = text.strip()
+        if cleaned_text.startswith("```json"):
+            cleaned_text = cleaned_text[7:]
+        if cleaned_text.endswith("```"):
+            cleaned_text = cleaned_text[:-3]
+        return cleaned_text
+
+    def _cache_key(self, text: str) -> str:
+        return content_key(text, PROMPT_VERSION, self.model_name)
+
+    def _analyze_single_post(self, text: str, use_cache: bool = True) -> dict:
+        key = self._cache_key(text) if self.cache and use_cache else None
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached or None
+
+        prompt = SINGLE_POST_PROMPT.format(text=text)
+        
+        try:
+            data = json.loads(self._strip_code_fence(self._generate(prompt)))
         except Exception:
             return None
 
+        if data is not None and not isinstance(data, dict):
+            # A list or bare value is a malformed answer: nothing to write or cache
+            print(f"Unexpected analysis answer of type {type(data).__name__}")
+            return None
+        if key:
+            # "No pain point" (null) is cached too, as {}
+            self.cache.put(key, data or {})
+        return data
+
     def _mock_analyze(self, text: str) -> dict:
         """Simulates AI analysis for demo purposes."""
         categories = ["Integration", "Pricing", "UI/UX", "Missing Feature", "Performance"]
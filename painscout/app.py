@@ -1,20 +1,21 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import sys
 import os
 import time
+import uuid
 import base64
-from datetime import datetime
 
 # Add parent directory to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from painscout.config import Config
-from painscout.scraper import RedditScraper
-from painscout.analyzer import PainAnalyzer
-from painscout.reporter import Reporter
+from painscout.artifacts import ArtifactCache
+from painscout.charts import category_counts, urgency_points
+from painscout.history import ScanHistory
+from painscout.metrics import METRICS
+# Scraper, analyzer, reporter and plotly are imported where they are first
+# needed so the landing view renders without loading them
 
 # --- Page Config ---
 st.set_page_config(
@@ -311,14 +312,295 @@ st.markdown("""
 def show_toast(message, icon="✅"):
     st.toast(f"{icon} {message}")
 
-# --- Session State for Past Scans ---
-if 'scan_history' not in st.session_state:
-    st.session_state.scan_history = []
+@st.cache_resource
+def get_artifact_cache():
+    # One per server process; entries are keyed by result content, so sessions can share them
+    return ArtifactCache()
+
+def summarize_results(df):
+    return {
+        'total_posts': len(df),
+        'top_category': df['category'].mode()[0] if not df['category'].empty else "N/A",
+        'high_urgency_count': int((df['urgency'] == 'High').sum()),
+        'avg_frustration': df['sentiment_score'].mean(),
+    }
 
-def save_scan(df):
-    scan_id = datetime.now().strftime("%Y-%m-%d %H:%M")
-    st.session_state.scan_history.append({"id": scan_id, "data": df, "count": len(df)})
-    show_toast(f"Scan saved as {scan_id}", "💾")
+def build_theme_table(df):
+    # Scans saved before themes existed are clustered on first view
+    from painscout.themes import summarize_themes
+    themes = summarize_themes(df)
+    return themes.rename(columns={
+        'label': 'Theme', 'posts': 'Posts', 'avg_sentiment': 'Avg Frustration',
+        'engagement': 'Engagement', 'headline': 'Top Pain Point',
+    }).drop(columns='theme')
+
+def build_category_chart(df):
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    # Advanced 3D-style Donut Chart, fed pre-counted values (one slice per category)
+    counts = category_counts(df)
+    fig_cat = go.Figure(data=[go.Pie(
+        labels=counts.index.tolist(), 
+        values=counts.tolist(),
+        hole=.6,
+        marker=dict(colors=px.colors.sequential.Plasma),
+        textinfo='label+percent',
+        textposition='outside',
+        pull=[0.1 if i == 0 else 0 for i in range(len(counts))]
+    )])
+    fig_cat.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Inter", color="white"),
+        showlegend=False,
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=300
+    )
+    return fig_cat
+
+def build_urgency_chart(df):
+    import plotly.express as px
+    
+    # Advanced Scatter Plot with Gradient Quadrants; large result sets are binned
+    # so the figure sent to the browser stays bounded
+    points = urgency_points(df)
+    binned = len(points) < len(df)
+    fig_scat = px.scatter(
+        points, 
+        x='sentiment_score', 
+        y='comments', 
+        color='urgency', 
+        size='posts' if binned else 'sentiment_score', 
+        hover_data=['pain_point', 'posts'] if binned else ['pain_point'], 
+        color_discrete_map={'High': '#FF6B6B', 'Medium': '#FFAB40', 'Low': '#00D4FF'}
+    )
+    fig_scat.update_traces(marker=dict(line=dict(width=1, color='white'), opacity=0.8))
+    fig_scat.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Inter", color="white"),
+        xaxis=dict(showgrid=False, title="Frustration Score"),
+        yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)', title="Engagement Volume"),
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=300,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig_scat
+
+def feed_sort_order(df):
+    # Positions of the rows by frustration, then engagement (highest first)
+    return df.reset_index(drop=True).sort_values(['sentiment_score', 'comments'], ascending=False, kind='stable').index.tolist()
+
+def render_opportunity_card(row):
+    u_class = "urgency-low"
+    if row['urgency'] == 'Medium': u_class = "urgency-med"
+    if row['urgency'] == 'High': u_class = "urgency-high"
+    
+    score = max(0, min(int(row['sentiment_score']), 10))
+    
+    # Dynamic Gauge
+    color = "#FF6B6B" if score > 7 else "#00D4FF"
+    segment = "<span style='display:inline-block; width:6px; height:18px; background:{}; margin-right:2px; border-radius:2px; opacity:{};'></span>"
+    gauge_html = segment.format(color, "1") * score + segment.format(color, "0.2") * (10 - score)
+    
+    revenue_badge = ""
+    if row['comments'] > 20 or row['score'] > 100:
+        revenue_badge = "<div class='revenue-badge'>High Revenue Potential</div>"
+    
+    return f"""
+    <div class="glass-card">
+        <div style="display:flex; justify-content:space-between; align-items:flex-start; margin-bottom: 16px;">
+            <div style="display:flex; align-items:center; gap: 12px;">
+                <span class="category-tag">{row['category']}</span>
+                <span class="urgency-pill {u_class}">{row['urgency']}</span>
+                {revenue_badge}
+            </div>
+            <div style="text-align:right; color: #94A3B8; font-size:0.8rem;">
+                {row['sub_source']} · <span style="color: #fff">{str(row.get('created_at', 'Just now'))[:10]}</span>
+            </div>
+        </div>
+        
+        <div style="display:grid; grid-template-columns: 1fr 180px; gap: 32px;">
+            <div>
+                <h4 style="font-size:1.25rem; margin-bottom:12px; line-height: 1.4;">
+                    "{row['pain_point']}"
+                </h4>
+                <p style="color: #94A3B8; font-size: 0.95rem; margin-bottom: 0; padding-left: 16px; border-left: 2px solid rgba(255,255,255,0.1);">
+                    {row['text'][:200]}...
+                </p>
+            </div>
+            
+            <div style="display:flex; flex-direction:column; justify-content:center; align-items: flex-end; border-left: 1px solid rgba(255,255,255,0.05); padding-left: 24px;">
+                <div style="font-size:0.75rem; color:#94A3B8; text-transform:uppercase; letter-spacing:1px; margin-bottom: 8px;">Frustration Score</div>
+                <div style="margin-bottom: 16px;">{gauge_html}</div>
+                
+                <a href="{row['url']}" target="_blank" style="
+                    display:inline-block; 
+                    background: rgba(255,255,255,0.05); 
+                    color: #fff; 
+                    text-decoration: none; 
+                    padding: 8px 16px; 
+                    border-radius: 8px; 
+                    font-size: 0.85rem; 
+                    font-weight: 600;
+                    transition: all 0.2s;
+                    border: 1px solid rgba(255,255,255,0.1);
+                ">
+                    View Source ↗
+                </a>
+            </div>
+        </div>
+    </div>
+"""
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def export_data(df, fmt, export_stats):
+    # Written chunk by chunk into one buffer; size and write time are kept for the caption
+    import io
+    from painscout.exports import export
+    buffer = io.BytesIO()
+    export_stats[fmt] = export(df, buffer, fmt)
+    return buffer.getvalue()
+
+def export_pdf(df, summary_stats):
+    from painscout.reporter import Reporter
+    return Reporter.generate_pdf(df, summary_stats)
+
+def export_full_report(df, summary_stats):
+    from painscout.reporter import Reporter
+    return Reporter.generate_full_report(df, summary_stats)
+
+# --- Past Scans (on disk; one index per server process, scoped by history_owner()) ---
+@st.cache_resource
+def get_scan_history():
+    return ScanHistory()
+
+def history_owner():
+    """Whose scans this session sees: everyone's (HISTORY_SHARED), the signed-in user's, or only its own."""
+    if Config.HISTORY_SHARED:
+        return ""
+    if getattr(st.user, "is_logged_in", False) and st.user.get("email"):
+        return f"user:{st.user.email}"
+    if 'history_owner' not in st.session_state:
+        st.session_state.history_owner = f"session:{uuid.uuid4().hex}"
+    return st.session_state.history_owner
+
+def save_scan(df, source=None):
+    meta = get_scan_history().save(df, source=source, owner=history_owner())
+    show_toast(f"Scan saved as {meta['label']}", "💾")
+
+# --- Metrics (process-wide, filled in by the pipeline, analyzer and exports) ---
+def format_count(value):
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 10_000:
+        return f"{value / 1_000:.1f}K"
+    return f"{int(value):,}"
+
+def format_age(seconds):
+    if seconds < 60:
+        return "Just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h {int(seconds % 3600 // 60)}m ago"
+    return f"{int(seconds // 86400)}d ago"
+
+def render_system_status():
+    last_scan = METRICS.gauge("last_scan_timestamp")
+    last_scan_text = "Never"
+    if last_scan is not None:
+        last_scan_text = f"{format_age(time.time() - last_scan)} · {METRICS.gauge('last_scan_seconds'):.1f}s"
+    
+    llm_latency = METRICS.histogram("llm_latency_seconds")
+    llm_text = f"{format_count(METRICS.counter('llm_calls_total'))}"
+    if llm_latency and llm_latency.count:
+        llm_text += f" · p95 {llm_latency.quantile(0.95):.2f}s"
+    
+    hits = METRICS.counter("analysis_cache_hits_total")
+    lookups = hits + METRICS.counter("analysis_cache_misses_total")
+    hit_rate = f"{hits / lookups:.0%}" if lookups else "–"
+    
+    stages = {row['stage']: row for row in METRICS.stage_summary()}
+    analyze = stages.get("analyze")
+    throughput = f"{analyze['rows_per_s']:,.1f} rows/s" if analyze and analyze['seconds'] else "–"
+    
+    status = "Mock Mode" if Config.MOCK_MODE else "Online"
+    st.markdown(f"""
+        <div class='sidebar-stat'>
+            <span>Status</span> 
+            <span><span class='status-dot'></span>{status}</span>
+        </div>
+        <div class='sidebar-stat'>
+            <span>Last Scan</span> 
+            <span style='color: #94A3B8'>{last_scan_text}</span>
+        </div>
+        <div class='sidebar-stat'>
+            <span>HTTP Requests</span> 
+            <span>{format_count(METRICS.counter('http_requests_total'))} · {format_count(METRICS.counter('http_retries_total'))} retries</span>
+        </div>
+        <div class='sidebar-stat'>
+            <span>LLM Calls</span> 
+            <span style='color: #00D4FF'>{llm_text}</span>
+        </div>
+        <div class='sidebar-stat'>
+            <span>Cache Hit Rate</span> 
+            <span>{hit_rate}</span>
+        </div>
+        <div class='sidebar-stat'>
+            <span>Analysis Throughput</span> 
+            <span>{throughput}</span>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    if stages:
+        with st.expander("⏱️ Stage Timings"):
+            st.dataframe(pd.DataFrame(list(stages.values())), use_container_width=True, hide_index=True)
+            st.download_button("Metrics (JSON)", data=METRICS.to_json, file_name="painscout_metrics.json",
+                               mime="application/json", use_container_width=True)
+            st.download_button("Metrics (Prometheus)", data=METRICS.to_prometheus, file_name="painscout_metrics.prom",
+                               mime="text/plain", use_container_width=True)
+
+def read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def render_last_profile(profile):
+    with st.expander(f"🔬 Last Profile ({profile['seconds']:.1f}s)"):
+        st.dataframe(pd.DataFrame(profile['hot']), use_container_width=True, hide_index=True)
+        st.download_button("Trace (.prof)", data=lambda: read_file(profile['path']),
+                           file_name=os.path.basename(profile['path']), mime="application/octet-stream",
+                           use_container_width=True)
+        st.download_button("Summary (.txt)", data=lambda: read_file(profile['summary_path']),
+                           file_name=os.path.basename(profile['summary_path']), mime="text/plain",
+                           use_container_width=True)
+
+def render_hero_counters():
+    return f"""
+<div class="glass-card" style="padding: 24px; display: flex; justify-content: space-around; align-items: center;">
+    <div style="text-align: center;">
+        <div style="color: #94A3B8; font-size: 0.8rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">Sources Monitored</div>
+        <div style="font-size: 1.5rem; font-weight: 700; color: #fff;">{format_count(METRICS.counter('scan_sources_total'))}</div>
+    </div>
+    <div style="width: 1px; height: 40px; background: rgba(255,255,255,0.1);"></div>
+    <div style="text-align: center;">
+        <div style="color: #94A3B8; font-size: 0.8rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">Data Points Processed</div>
+        <div style="font-size: 1.5rem; font-weight: 700; color: #fff;">{format_count(METRICS.counter('scan_posts_total'))}</div>
+    </div>
+    <div style="width: 1px; height: 40px; background: rgba(255,255,255,0.1);"></div>
+    <div style="text-align: center;">
+        <div style="color: #00D4FF; font-size: 0.8rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">High Intent Signals</div>
+        <div style="font-size: 1.5rem; font-weight: 700; color: #00D4FF; text-shadow: 0 0 20px rgba(0, 212, 255, 0.3);">{format_count(METRICS.counter('pain_points_total'))}</div>
+    </div>
+</div>
+"""
 
 # --- Sidebar UI ---
 with st.sidebar:
@@ -360,31 +642,21 @@ with st.sidebar:
     
     st.markdown("<div style='height: 20px'></div>", unsafe_allow_html=True)
     st.markdown("### 📊 System Status")
-    st.markdown("""
-        <div class='sidebar-stat'>
-            <span>Status</span> 
-            <span><span class='status-dot'></span>Online</span>
-        </div>
-        <div class='sidebar-stat'>
-            <span>Last Scan</span> 
-            <span style='color: #94A3B8'>Just now</span>
-        </div>
-        <div class='sidebar-stat'>
-            <span>API Usage</span> 
-            <span style='color: #00D4FF'>84%</span>
-        </div>
-        <div class='sidebar-stat'>
-            <span>Next Auto-scan</span> 
-            <span>6h 24m</span>
-        </div>
-    """, unsafe_allow_html=True)
+    # Filled in at the end of the run so a scan started in this run is included
+    status_panel = st.container()
     
-    if st.session_state.scan_history:
+    # Only scan metadata is read here; rows are loaded when a scan is picked
+    saved_scans = {meta['id']: meta for meta in get_scan_history().list(owner=history_owner())}
+    if saved_scans:
         st.markdown("<div style='height: 20px'></div>", unsafe_allow_html=True)
         st.markdown("### 📂 History")
-        selected_scan = st.selectbox("Load Previous Scan", [s['id'] for s in st.session_state.scan_history])
+        selected_scan = st.selectbox(
+            "Load Previous Scan",
+            list(saved_scans),
+            format_func=lambda scan_id: f"{saved_scans[scan_id]['label']} · {saved_scans[scan_id]['rows']} signals"
+        )
         if st.button("Load Scan Data", type="secondary"):
-            hist_data = next((s['data'] for s in st.session_state.scan_history if s['id'] == selected_scan), None)
+            hist_data = get_scan_history().load(selected_scan, owner=history_owner())
             if hist_data is not None:
                 st.session_state.results = hist_data
                 st.rerun()
@@ -405,290 +677,281 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# 2. Live Counter (Glass Panel)
-st.markdown("""
-<div class="glass-card" style="padding: 24px; display: flex; justify-content: space-around; align-items: center;">
-    <div style="text-align: center;">
-        <div style="color: #94A3B8; font-size: 0.8rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">Sources Monitored</div>
-        <div style="font-size: 1.5rem; font-weight: 700; color: #fff;">12,492</div>
-    </div>
-    <div style="width: 1px; height: 40px; background: rgba(255,255,255,0.1);"></div>
-    <div style="text-align: center;">
-        <div style="color: #94A3B8; font-size: 0.8rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">Data Points Processed</div>
-        <div style="font-size: 1.5rem; font-weight: 700; color: #fff;">1.4M</div>
-    </div>
-    <div style="width: 1px; height: 40px; background: rgba(255,255,255,0.1);"></div>
-    <div style="text-align: center;">
-        <div style="color: #00D4FF; font-size: 0.8rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">High Intent Signals</div>
-        <div style="font-size: 1.5rem; font-weight: 700; color: #00D4FF; text-shadow: 0 0 20px rgba(0, 212, 255, 0.3);">847</div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+# 2. Live Counter (Glass Panel): filled in at the end of the run, like the status panel
+hero_counters = st.empty()
 
 # --- Logic State ---
 if 'results' not in st.session_state:
     st.session_state.results = pd.DataFrame()
 
-# --- Execution Logic ---
-if run_btn:
-    progress_text = "Initializing scout bots..."
-    my_bar = st.progress(0, text=progress_text)
+# --- Profiling (opt-in, PROFILE_ENABLED): one trace per scan run, scan -> analyze -> render -> export ---
+profile_run = None
+if run_btn and Config.PROFILE_ENABLED:
+    from painscout.profiling import ProfileRun
+    profile_run = ProfileRun(label="app").start()
+
+# Profiled span: always stopped, even when the run fails or Streamlit interrupts it for a rerun
+try:
+    # --- Execution Logic ---
+    if run_btn:
+        from painscout.scraper import RedditScraper
+        from painscout.analyzer import PainAnalyzer
+        from painscout.pipeline import ScanPipeline, noise_summary
     
-    scraper = RedditScraper()
+        progress_text = "Initializing scout bots..."
+        my_bar = st.progress(0, text=progress_text)
     
-    # Parse inputs
-    topic_list = [s.strip() for s in topics_input.split(',')]
+        scraper = RedditScraper()
     
-    # For Reddit we need the second box, for X we imply intent keywords
-    trigger_list = []
-    if source_type == "Reddit":
-        trigger_list = [k.strip() for k in keywords.split(',')]
+        # Parse inputs
+        topic_list = [s.strip() for s in topics_input.split(',')]
     
-    try:
-        for percent_complete in range(0, 30):
-            time.sleep(0.02)
-            my_bar.progress(percent_complete, text=f"🛰️ Intercepting {source_type} signals...")
-            
-        # RUN SCAN
-        raw_data = scraper.run_scan(topic_list, trigger_list, days=days_back, source=source_type)
+        # For Reddit we need the second box, for X we imply intent keywords
+        trigger_list = []
+        if source_type == "Reddit":
+            trigger_list = [k.strip() for k in keywords.split(',')]
+    
+        # Progress is counted in sources (X search is a single one); deep scans send several chunks each
+        expected_sources = max(len(topic_list), 1) if source_type == "Reddit" else 1
+        partial_view = st.empty()
+    
+        def stage_progress(stats):
+            # Scanning and analysis overlap; each covers half of the bar
+            scanned = min(stats['sources_scanned'], expected_sources)
+            analyzed = min(stats['sources_analyzed'], expected_sources)
+            return int(5 + 45 * scanned / expected_sources + 45 * analyzed / expected_sources)
+    
+        def show_scanned(label, stats):
+            my_bar.progress(stage_progress(stats), text=f"🛰️ Scanned {label}: {stats['raw_posts']} signals so far...")
+    
+        def show_partial(results_so_far, stats):
+            done = min(stats['sources_analyzed'], expected_sources)
+            my_bar.progress(
+                stage_progress(stats),
+                text=f"🧠 {len(results_so_far)} pain points · {noise_summary(stats)} ({done}/{expected_sources} sources analyzed)..."
+            )
+            preview_cols = [c for c in ['pain_point', 'category', 'urgency', 'sub_source'] if c in results_so_far]
+            partial_view.dataframe(results_so_far[preview_cols], use_container_width=True, hide_index=True)
+    
+        try:
+            my_bar.progress(5, text=f"🛰️ Intercepting {source_type} signals...")
         
-        my_bar.progress(50, text=f"Found {len(raw_data)} raw signals. Engaging Neural Engine...")
+            # RUN SCAN: analysis starts as soon as the first source has been scanned
+            pipeline = ScanPipeline(scraper, PainAnalyzer())
+            analyzed_data = pipeline.run(topic_list, trigger_list, days=days_back, source=source_type, on_partial=show_partial, on_scanned=show_scanned)
+            partial_view.empty()
         
-        if raw_data.empty:
-            st.warning("No signals detected. Try broadening your search vectors.")
-            my_bar.empty()
-        else:
-            analyzer = PainAnalyzer()
-            my_bar.progress(70, text="🧠 Synthesizing pain points & sentiment analysis...")
+            if analyzed_data.empty:
+                st.warning(f"No signals detected ({noise_summary(pipeline.stats)}). Try broadening your search vectors.")
+                my_bar.empty()
+            else:
+                st.session_state.results = analyzed_data
             
-            analyzed_data = analyzer.analyze_batch(raw_data)
-            analyzed_data = analyzed_data.dropna(subset=['pain_point'])
-            st.session_state.results = analyzed_data
+                my_bar.progress(100, text=f"✅ Intelligence Report Generated · {noise_summary(pipeline.stats)}")
+                time.sleep(0.5)
+                my_bar.empty()
+                st.balloons()
+                show_toast(f"Deep scan completed successfully! {noise_summary(pipeline.stats)}.")
             
-            my_bar.progress(100, text="✅ Intelligence Report Generated")
-            time.sleep(0.5)
-            my_bar.empty()
-            st.balloons()
-            show_toast("Deep scan completed successfully!")
+                # Auto-save scan
+                save_scan(analyzed_data, source=source_type)
             
-            # Auto-save scan
-            save_scan(analyzed_data)
-            
-    except Exception as e:
-        st.error(f"System Error: {str(e)}")
+        except Exception as e:
+            st.error(f"System Error: {str(e)}")
+
+    # --- Results Dashboard ---
+    if not st.session_state.results.empty:
+        df = st.session_state.results
+        # Everything derived from the results is computed once per result set, not per rerun
+        artifacts = get_artifact_cache()
+    
+        st.markdown("<div style='height: 40px'></div>", unsafe_allow_html=True)
+    
+        # Trending Section
+        st.markdown("### 🔥 Trending This Week")
+        t_col1, t_col2, t_col3 = st.columns(3)
+        trending_df = artifacts.get_or_compute(df, "trending", lambda: df.nlargest(3, 'score'))
+    
+        for i, (idx, row) in enumerate(trending_df.iterrows()):
+            with [t_col1, t_col2, t_col3][i]:
+                st.markdown(f"""
+                <div class="glass-card" style="border-top: 4px solid #FF6B6B;">
+                    <div style="display:flex; justify-content:space-between; align-items:center; margin-bottom: 12px;">
+                        <div class="urgency-pill urgency-high" style="font-size: 0.6rem;">Trending #{i+1}</div>
+                        <div class="trending-icon">🔥</div>
+                    </div>
+                    <p style="font-size: 1rem; font-weight: 600; line-height: 1.4; margin-bottom: 16px; height: 65px; overflow: hidden; display: -webkit-box; -webkit-line-clamp: 3; -webkit-box-orient: vertical;">
+                        "{row['pain_point']}"
+                    </p>
+                    <div style="display:flex; gap: 12px; font-size: 0.75rem; color: #94A3B8; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 12px;">
+                        <span>💬 {row['comments']} comments</span>
+                        <span>⚡ {row['score']} impact</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
 
-# --- Results Dashboard ---
-if not st.session_state.results.empty:
-    df = st.session_state.results
+        # Key Metrics
+        st.markdown("### 🎯 Executive Overview")
+        m_col1, m_col2, m_col3, m_col4 = st.columns(4)
     
-    st.markdown("<div style='height: 40px'></div>", unsafe_allow_html=True)
+        summary_stats = artifacts.get_or_compute(df, "summary", lambda: summarize_results(df))
+        top_cat = summary_stats['top_category']
+        high_urgency = summary_stats['high_urgency_count']
+        avg_frust = summary_stats['avg_frustration']
     
-    # Trending Section
-    st.markdown("### 🔥 Trending This Week")
-    t_col1, t_col2, t_col3 = st.columns(3)
-    trending_df = df.sort_values('score', ascending=False).head(3)
+        source_label = "X Signals" if source_type == "X (Twitter)" else "Reddit Posts"
     
-    for i, (idx, row) in enumerate(trending_df.iterrows()):
-        with [t_col1, t_col2, t_col3][i]:
+        with m_col1:
             st.markdown(f"""
-            <div class="glass-card" style="border-top: 4px solid #FF6B6B;">
-                <div style="display:flex; justify-content:space-between; align-items:center; margin-bottom: 12px;">
-                    <div class="urgency-pill urgency-high" style="font-size: 0.6rem;">Trending #{i+1}</div>
-                    <div class="trending-icon">🔥</div>
+                <div class="glass-card" style="text-align:center; padding: 24px;">
+                    <div class="metric-value">{len(df)}</div>
+                    <div class="metric-label">{source_label}</div>
                 </div>
-                <p style="font-size: 1rem; font-weight: 600; line-height: 1.4; margin-bottom: 16px; height: 65px; overflow: hidden; display: -webkit-box; -webkit-line-clamp: 3; -webkit-box-orient: vertical;">
-                    "{row['pain_point']}"
-                </p>
-                <div style="display:flex; gap: 12px; font-size: 0.75rem; color: #94A3B8; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 12px;">
-                    <span>💬 {row['comments']} comments</span>
-                    <span>⚡ {row['score']} impact</span>
+            """, unsafe_allow_html=True)
+        with m_col2:
+            st.markdown(f"""
+                <div class="glass-card" style="text-align:center; padding: 24px;">
+                    <div class="metric-value" style="background: linear-gradient(180deg, #FF6B6B 0%, #C0392B 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{high_urgency}</div>
+                    <div class="metric-label">Critical Pains</div>
+                </div>
+            """, unsafe_allow_html=True)
+        with m_col3:
+            st.markdown(f"""
+                <div class="glass-card" style="text-align:center; padding: 24px;">
+                    <div class="metric-value" style="background: linear-gradient(180deg, #00D4FF 0%, #0083B0 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{avg_frust:.1f}</div>
+                    <div class="metric-label">Avg Frustration</div>
+                </div>
+            """, unsafe_allow_html=True)
+        with m_col4:
+            st.markdown(f"""
+                <div class="glass-card" style="text-align:center; padding: 24px;">
+                    <div class="metric-value" style="font-size: 1.5rem; line-height: 3.5rem; overflow:hidden; white-space:nowrap;">{top_cat}</div>
+                    <div class="metric-label">Top Category</div>
                 </div>
-            </div>
             """, unsafe_allow_html=True)
 
-    # Key Metrics
-    st.markdown("### 🎯 Executive Overview")
-    m_col1, m_col2, m_col3, m_col4 = st.columns(4)
+        # Charts
+        col_chart1, col_chart2 = st.columns([1, 1])
     
-    top_cat = df['category'].mode()[0] if not df['category'].empty else "N/A"
-    high_urgency = len(df[df['urgency'] == 'High'])
-    avg_frust = df['sentiment_score'].mean()
+        with col_chart1:
+            st.markdown("<div class='glass-card'>", unsafe_allow_html=True)
+            st.markdown("<h4 style='margin-bottom: 24px'>Market Gaps by Category</h4>", unsafe_allow_html=True)
+            fig_cat = artifacts.get_or_compute(df, "category_chart", lambda: build_category_chart(df))
+            st.plotly_chart(fig_cat, use_container_width=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col_chart2:
+            st.markdown("<div class='glass-card'>", unsafe_allow_html=True)
+            st.markdown("<h4 style='margin-bottom: 24px'>Urgency Matrix</h4>", unsafe_allow_html=True)
+            fig_scat = artifacts.get_or_compute(df, "urgency_chart", lambda: build_urgency_chart(df))
+            st.plotly_chart(fig_scat, use_container_width=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        # Themes: posts about the same problem grouped together instead of one card each
+        if Config.THEMES_ENABLED:
+            st.markdown("### 🧩 Opportunity Themes")
+            theme_table = artifacts.get_or_compute(df, "themes", lambda: build_theme_table(df))
+            st.dataframe(
+                theme_table, use_container_width=True, hide_index=True,
+                column_config={"Avg Frustration": st.column_config.ProgressColumn(min_value=0, max_value=10, format="%.1f")},
+            )
     
-    source_label = "X Signals" if source_type == "X (Twitter)" else "Reddit Posts"
+        # Detailed List: one page of cards, ordered by a sort index computed once per result set
+        st.markdown("### 📢 High-Value Opportunity Feed")
     
-    with m_col1:
-        st.markdown(f"""
-            <div class="glass-card" style="text-align:center; padding: 24px;">
-                <div class="metric-value">{len(df)}</div>
-                <div class="metric-label">{source_label}</div>
-            </div>
-        """, unsafe_allow_html=True)
-    with m_col2:
-        st.markdown(f"""
-            <div class="glass-card" style="text-align:center; padding: 24px;">
-                <div class="metric-value" style="background: linear-gradient(180deg, #FF6B6B 0%, #C0392B 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{high_urgency}</div>
-                <div class="metric-label">Critical Pains</div>
-            </div>
-        """, unsafe_allow_html=True)
-    with m_col3:
-        st.markdown(f"""
-            <div class="glass-card" style="text-align:center; padding: 24px;">
-                <div class="metric-value" style="background: linear-gradient(180deg, #00D4FF 0%, #0083B0 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{avg_frust:.1f}</div>
-                <div class="metric-label">Avg Frustration</div>
-            </div>
-        """, unsafe_allow_html=True)
-    with m_col4:
-        st.markdown(f"""
-            <div class="glass-card" style="text-align:center; padding: 24px;">
-                <div class="metric-value" style="font-size: 1.5rem; line-height: 3.5rem; overflow:hidden; white-space:nowrap;">{top_cat}</div>
-                <div class="metric-label">Top Category</div>
-            </div>
-        """, unsafe_allow_html=True)
-
-    # Charts
-    col_chart1, col_chart2 = st.columns([1, 1])
-    
-    with col_chart1:
-        st.markdown("<div class='glass-card'>", unsafe_allow_html=True)
-        st.markdown("<h4 style='margin-bottom: 24px'>Market Gaps by Category</h4>", unsafe_allow_html=True)
-        
-        # Advanced 3D-style Donut Chart
-        fig_cat = go.Figure(data=[go.Pie(
-            labels=df['category'], 
-            hole=.6,
-            marker=dict(colors=px.colors.sequential.Plasma),
-            textinfo='label+percent',
-            textposition='outside',
-            pull=[0.1 if i == 0 else 0 for i in range(len(df['category'].unique()))]
-        )])
-        fig_cat.update_layout(
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            font=dict(family="Inter", color="white"),
-            showlegend=False,
-            margin=dict(t=0, b=0, l=0, r=0),
-            height=300
-        )
-        st.plotly_chart(fig_cat, use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-    with col_chart2:
-        st.markdown("<div class='glass-card'>", unsafe_allow_html=True)
-        st.markdown("<h4 style='margin-bottom: 24px'>Urgency Matrix</h4>", unsafe_allow_html=True)
-        
-        # Advanced Scatter Plot with Gradient Quadrants
-        fig_scat = px.scatter(
-            df, 
-            x='sentiment_score', 
-            y='comments', 
-            color='urgency', 
-            size='sentiment_score', 
-            hover_data=['pain_point'], 
-            color_discrete_map={'High': '#FF6B6B', 'Medium': '#FFAB40', 'Low': '#00D4FF'}
-        )
-        fig_scat.update_traces(marker=dict(line=dict(width=1, color='white'), opacity=0.8))
-        fig_scat.update_layout(
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            font=dict(family="Inter", color="white"),
-            xaxis=dict(showgrid=False, title="Frustration Score"),
-            yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.05)', title="Engagement Volume"),
-            margin=dict(t=0, b=0, l=0, r=0),
-            height=300,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        st.plotly_chart(fig_scat, use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    # Detailed List
-    st.markdown("### 📢 High-Value Opportunity Feed")
+        feed_order = artifacts.get_or_compute(df, "feed_order", lambda: feed_sort_order(df))
+        feed_cards = artifacts.get_or_compute(df, "feed_cards", dict)
+        total_pages = max(1, -(-len(feed_order) // Config.FEED_PAGE_SIZE))
     
-    top_pains = df.sort_values(['sentiment_score', 'comments'], ascending=False).head(10)
+        if total_pages > 1:
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key="feed_page")
+        else:
+            page = 1
+        page_start = (page - 1) * Config.FEED_PAGE_SIZE
+        page_positions = feed_order[page_start:page_start + Config.FEED_PAGE_SIZE]
+    
+        missing = [pos for pos in page_positions if pos not in feed_cards]
+        if missing:
+            for pos, row in zip(missing, df.iloc[missing].to_dict('records')):
+                feed_cards[pos] = render_opportunity_card(row)
+    
+        st.caption(f"Showing {page_start + 1}–{page_start + len(page_positions)} of {len(feed_order)} opportunities")
+        st.markdown("".join(feed_cards[pos] for pos in page_positions), unsafe_allow_html=True)
+
+        # Exports: generated on click (off the script thread), then served from the cache
+        st.markdown("### 📤 Export Intelligence")
+        export_stats = artifacts.get_or_compute(df, "export_stats", dict)
+        col_e1, col_e2, col_e3 = st.columns(3)
+        with col_e1:
+            st.download_button(
+                "📥 Download CSV Dataset",
+                data=lambda: artifacts.get_or_compute(df, "csv", lambda: export_data(df, "csv", export_stats)),
+                file_name="painscout_data.csv", mime="text/csv", use_container_width=True
+            )
+        with col_e2:
+            st.download_button(
+                "📄 Download Executive PDF",
+                data=lambda: artifacts.get_or_compute(df, "pdf", lambda: export_pdf(df, summary_stats)),
+                file_name="painscout_report.pdf", mime="application/pdf", use_container_width=True
+            )
+        with col_e3:
+            st.download_button(
+                "📚 Download Full Report PDF",
+                data=lambda: artifacts.get_or_compute(df, "full_pdf", lambda: export_full_report(df, summary_stats)),
+                file_name="painscout_full_report.pdf", mime="application/pdf", use_container_width=True
+            )
     
-    for idx, row in top_pains.iterrows():
-        u_class = "urgency-low"
-        if row['urgency'] == 'Medium': u_class = "urgency-med"
-        if row['urgency'] == 'High': u_class = "urgency-high"
-        
-        score = int(row['sentiment_score'])
-        
-        # Dynamic Gauge
-        gauge_html = ""
-        for i in range(10):
-            opacity = "1" if i < score else "0.2"
-            color = "#FF6B6B" if score > 7 else "#00D4FF"
-            gauge_html += f"<span style='display:inline-block; width:6px; height:18px; background:{color}; margin-right:2px; border-radius:2px; opacity:{opacity};'></span>"
-        
-        revenue_badge = ""
-        if row['comments'] > 20 or row['score'] > 100:
-            revenue_badge = "<div class='revenue-badge'>High Revenue Potential</div>"
-        
-        st.markdown(f"""
-        <div class="glass-card">
-            <div style="display:flex; justify-content:space-between; align-items:flex-start; margin-bottom: 16px;">
-                <div style="display:flex; align-items:center; gap: 12px;">
-                    <span class="category-tag">{row['category']}</span>
-                    <span class="urgency-pill {u_class}">{row['urgency']}</span>
-                    {revenue_badge}
-                </div>
-                <div style="text-align:right; color: #94A3B8; font-size:0.8rem;">
-                    {row['sub_source']} · <span style="color: #fff">{str(row.get('created_at', 'Just now'))[:10]}</span>
-                </div>
-            </div>
-            
-            <div style="display:grid; grid-template-columns: 1fr 180px; gap: 32px;">
-                <div>
-                    <h4 style="font-size:1.25rem; margin-bottom:12px; line-height: 1.4;">
-                        "{row['pain_point']}"
-                    </h4>
-                    <p style="color: #94A3B8; font-size: 0.95rem; margin-bottom: 0; padding-left: 16px; border-left: 2px solid rgba(255,255,255,0.1);">
-                        {row['text'][:200]}...
-                    </p>
-                </div>
-                
-                <div style="display:flex; flex-direction:column; justify-content:center; align-items: flex-end; border-left: 1px solid rgba(255,255,255,0.05); padding-left: 24px;">
-                    <div style="font-size:0.75rem; color:#94A3B8; text-transform:uppercase; letter-spacing:1px; margin-bottom: 8px;">Frustration Score</div>
-                    <div style="margin-bottom: 16px;">{gauge_html}</div>
-                    
-                    <a href="{row['url']}" target="_blank" style="
-                        display:inline-block; 
-                        background: rgba(255,255,255,0.05); 
-                        color: #fff; 
-                        text-decoration: none; 
-                        padding: 8px 16px; 
-                        border-radius: 8px; 
-                        font-size: 0.85rem; 
-                        font-weight: 600;
-                        transition: all 0.2s;
-                        border: 1px solid rgba(255,255,255,0.1);
-                    ">
-                        View Source ↗
-                    </a>
-                </div>
-            </div>
+        col_e4, col_e5 = st.columns(2)
+        with col_e4:
+            st.download_button(
+                "🧱 Download Parquet (columnar)",
+                data=lambda: artifacts.get_or_compute(df, "parquet", lambda: export_data(df, "parquet", export_stats)),
+                file_name="painscout_data.parquet", mime="application/vnd.apache.parquet", use_container_width=True
+            )
+        with col_e5:
+            st.download_button(
+                "🗜️ Download JSONL (gzip)",
+                data=lambda: artifacts.get_or_compute(df, "jsonl.gz", lambda: export_data(df, "jsonl.gz", export_stats)),
+                file_name="painscout_data.jsonl.gz", mime="application/gzip", use_container_width=True
+            )
+        if export_stats:
+            st.caption(" · ".join(
+                f"{fmt.upper()}: {format_bytes(stats['bytes'])} in {stats['seconds']:.2f}s"
+                for fmt, stats in export_stats.items()
+            ))
+    
+        if profile_run:
+            # Exports normally run on click; a profiled run builds them up front so they are in the trace
+            artifacts.get_or_compute(df, "csv", lambda: export_data(df, "csv", export_stats))
+            artifacts.get_or_compute(df, "pdf", lambda: export_pdf(df, summary_stats))
+    
+        if st.button("💾 Save Scan to History", key="manual_save"):
+            save_scan(df)
+
+    else:
+        st.markdown("<br><br>", unsafe_allow_html=True)
+        st.markdown("""
+        <div style="text-align: center; padding: 60px; opacity: 0.5;">
+            <div style="font-size: 5rem; margin-bottom: 1.5rem; filter: drop-shadow(0 0 30px rgba(0, 212, 255, 0.3));">📡</div>
+            <h3 style="font-size: 1.5rem; margin-bottom: 1rem;">Ready to intercept signals?</h3>
+            <p style="max-width: 400px; margin: 0 auto;">Configure your search vectors in the sidebar and initialize the deep scan engine.</p>
         </div>
         """, unsafe_allow_html=True)
+finally:
+    if profile_run:
+        profile_run.stop()
+
+if profile_run and profile_run.path:
+    st.session_state.last_profile = {
+        'path': profile_run.path,
+        'summary_path': profile_run.summary_path,
+        'seconds': profile_run.seconds,
+        'hot': profile_run.hot_functions(),
+    }
 
-    # Exports
-    st.markdown("### 📤 Export Intelligence")
-    col_e1, col_e2 = st.columns(2)
-    with col_e1:
-        csv = Reporter.get_csv_download_link(df)
-        st.download_button("📥 Download CSV Dataset", data=csv, file_name="painscout_data.csv", mime="text/csv", use_container_width=True)
-    with col_e2:
-        summary_stats = {'total_posts': len(df), 'top_category': top_cat, 'high_urgency_count': high_urgency}
-        pdf_bytes = Reporter.generate_pdf(df, summary_stats)
-        st.download_button("📄 Download Executive PDF", data=pdf_bytes, file_name="painscout_report.pdf", mime="application/pdf", use_container_width=True)
-    
-    if st.button("💾 Save Scan to History", key="manual_save"):
-        save_scan(df)
-
-else:
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    st.markdown("""
-    <div style="text-align: center; padding: 60px; opacity: 0.5;">
-        <div style="font-size: 5rem; margin-bottom: 1.5rem; filter: drop-shadow(0 0 30px rgba(0, 212, 255, 0.3));">📡</div>
-        <h3 style="font-size: 1.5rem; margin-bottom: 1rem;">Ready to intercept signals?</h3>
-        <p style="max-width: 400px; margin: 0 auto;">Configure your search vectors in the sidebar and initialize the deep scan engine.</p>
-    </div>
-    """, unsafe_allow_html=True)
+# --- Live Metrics ---
+hero_counters.markdown(render_hero_counters(), unsafe_allow_html=True)
+with status_panel:
+    render_system_status()
+    if 'last_profile' in st.session_state:
+        render_last_profile(st.session_state.last_profile)
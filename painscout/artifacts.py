@@ -0,0 +1,101 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from painscout.config import Config
+
+
+def result_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a result set: values, index, column names and dtypes."""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode("utf-8"))
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+    except TypeError:
+        # Unhashable cells (lists/dicts): fall back to their string form
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=True)
+    digest.update(row_hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Bounded LRU of values derived from a result set (export bytes, figures,
+    aggregates), keyed by (result fingerprint, artifact name). Identical
+    results share entries, so widget reruns and re-opened scans reuse them.
+    Thread-safe: lazy download callables run off the script thread.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or Config.ARTIFACT_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._fingerprints: Dict[int, Tuple[weakref.ref, str]] = {}
+        # ids of collected frames; weakref callbacks can fire while _lock is held, so they only append here
+        self._dead: "deque[int]" = deque()
+        self._lock = threading.Lock()
+
+    def fingerprint(self, df: pd.DataFrame) -> str:
+        """
+        result_fingerprint(df), memoized per DataFrame object so reruns that
+        hold the same (never mutated in place) results skip the hashing.
+        """
+        with self._lock:
+            self._purge()
+            cached = self._fingerprints.get(id(df))
+            if cached is not None and cached[0]() is df:
+                return cached[1]
+        value = result_fingerprint(df)
+        key = id(df)
+        with self._lock:
+            self._fingerprints[key] = (weakref.ref(df, lambda _: self._dead.append(key)), value)
+        return value
+
+    def _purge(self):
+        """Drops fingerprints of collected frames (caller holds _lock)."""
+        while self._dead:
+            key = self._dead.popleft()
+            entry = self._fingerprints.get(key)
+            # The id may already belong to a newer frame
+            if entry is not None and entry[0]() is None:
+                del self._fingerprints[key]
+
+    def get_or_compute(self, df: pd.DataFrame, name: str, compute: Callable[[], Any]) -> Any:
+        """Returns the cached `name` artifact of `df`, computing it on a miss."""
+        key = (self.fingerprint(df), name)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Computed outside the lock: PDF/CSV generation can take a while
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+            self._dead.clear()
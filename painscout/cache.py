@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from painscout.config import Config
+from painscout.metrics import METRICS
+
+
+def content_key(text: str, prompt_version: str, model_name: str) -> str:
+    """Content address for an analysis: normalized post text + prompt + model."""
+    normalized = " ".join(text.split()).lower()
+    payload = "\0".join([normalized, prompt_version, model_name])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Persistent SQLite cache of LLM analysis results.
+    Entries expire after `ttl` seconds and the least recently used ones are
+    evicted once the table grows past `max_entries`. Safe to share between
+    the analyzer's worker threads.
+    """
+
+    EVICT_EVERY = 256  # writes between size checks
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.path = path or Config.ANALYSIS_CACHE_PATH
+        self.ttl = ttl if ttl is not None else Config.ANALYSIS_CACHE_TTL_DAYS * 86400
+        self.max_entries = max_entries or Config.ANALYSIS_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_accessed ON analysis (accessed_at)")
+        self._conn.commit()
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the cached analysis (possibly {} for "no pain point"), or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM analysis WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                METRICS.inc("analysis_cache_misses_total")
+                return None
+            self._conn.execute("UPDATE analysis SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        METRICS.inc("analysis_cache_hits_total")
+        return json.loads(row[0])
+
+    def put(self, key: str, value: dict):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict_locked()
+
+    def _evict_locked(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM analysis WHERE key IN "
+                "(SELECT key FROM analysis ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+            self._conn.commit()
+
+    def purge_expired(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis WHERE created_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+            self._evict_locked()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,46 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from painscout.config import Config
+
+
+def category_counts(df: pd.DataFrame) -> pd.Series:
+    """Posts per category, largest first: what the donut chart actually needs."""
+    return df['category'].astype(object).fillna("Other").value_counts()
+
+
+def urgency_points(df: pd.DataFrame, max_points: Optional[int] = None, comment_bins: Optional[int] = None) -> pd.DataFrame:
+    """
+    Points for the Urgency Matrix with a `posts` column (marker weight).
+    Up to `max_points` rows are plotted one marker per post. Above that, posts
+    are binned by urgency, frustration score and log-spaced comment ranges, so
+    the figure has at most 3 * 11 * `comment_bins` markers whatever the row count.
+    Each bin keeps its mean comments and its most engaged pain point for hovering.
+    """
+    max_points = max_points or Config.CHART_MAX_POINTS
+    comment_bins = comment_bins or Config.CHART_COMMENT_BINS
+
+    points = pd.DataFrame({
+        'sentiment_score': pd.to_numeric(df['sentiment_score'], errors='coerce').fillna(0),
+        'comments': pd.to_numeric(df['comments'], errors='coerce').fillna(0).clip(lower=0),
+        'urgency': df['urgency'].fillna('Low').astype(str),
+        'pain_point': df['pain_point'].astype(str),
+    }, index=df.index)
+
+    if len(points) <= max_points:
+        return points.assign(posts=1)
+
+    # Engagement is heavy-tailed: equal-width bins in log space
+    log_comments = np.log1p(points['comments'].to_numpy())
+    edges = np.linspace(0, log_comments.max() or 1.0, comment_bins + 1)
+    points['comment_bin'] = np.clip(np.digitize(log_comments, edges[1:-1]), 0, comment_bins - 1)
+    points['sentiment_score'] = points['sentiment_score'].round()
+
+    keys = ['urgency', 'sentiment_score', 'comment_bin']
+    # Hover text: the most discussed pain point of each bin
+    leaders = points.sort_values('comments', ascending=False).drop_duplicates(keys)
+    binned = points.groupby(keys, sort=False).agg(comments=('comments', 'mean'), posts=('comments', 'size')).reset_index()
+    binned = binned.merge(leaders[keys + ['pain_point']], on=keys, how='left')
+    return binned.drop(columns='comment_bin')
@@ -0,0 +1,139 @@
+import argparse
+import sys
+import time
+from typing import TYPE_CHECKING, Dict, List
+
+from painscout.config import Config
+from painscout.metrics import METRICS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SOURCES = {"reddit": "Reddit", "x": "X (Twitter)"}
+FORMATS = ("jsonl", "jsonl.gz", "csv", "parquet")
+
+
+def _split(value: str) -> List[str]:
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def _log(message: str):
+    print(message, file=sys.stderr, flush=True)
+
+
+class ConsoleProgress:
+    """Pipeline callbacks that print one progress line per event to stderr."""
+
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
+
+    def scanned(self, label: str, stats: Dict):
+        if not self.quiet:
+            _log(f"[scan] {label}: {stats['raw_posts']} signals so far ({stats['sources_scanned']} sources done)")
+
+    def partial(self, results: "pd.DataFrame", stats: Dict):
+        if not self.quiet:
+            from painscout.pipeline import noise_summary
+            elapsed = time.time() - stats['started']
+            _log(f"[analyze] {len(results)} pain points after {stats['chunks_analyzed']} chunks ({elapsed:.1f}s); "
+                 f"{noise_summary(stats)}")
+
+
+def export_results(df: "pd.DataFrame", path: str, fmt: str = None) -> Dict:
+    """
+    Streams results to `path` as JSONL, gzipped JSONL, CSV or Parquet
+    (inferred from the extension unless `fmt` is given); returns the
+    format, rows, bytes written and seconds taken.
+    """
+    from painscout.exports import export
+    return export(df, path, fmt)
+
+
+def write_metrics(path: str):
+    """Dumps the run's metrics as Prometheus text (.prom/.txt) or JSON (anything else)."""
+    text = METRICS.to_prometheus() if path.endswith((".prom", ".txt")) else METRICS.to_json()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m painscout",
+        description="Headless scan -> analyze -> export run (no Streamlit required).",
+    )
+    parser.add_argument("--source", choices=sorted(SOURCES), default="reddit", help="where to look for signals")
+    parser.add_argument("--topics", default=",".join(Config.DEFAULT_SUBREDDITS),
+                        help="comma-separated subreddits (Reddit) or topics (X)")
+    parser.add_argument("--keywords", default=",".join(Config.DEFAULT_KEYWORDS),
+                        help="comma-separated pain triggers (Reddit only)")
+    parser.add_argument("--days", type=int, default=30, help="look-back window in days")
+    parser.add_argument("--deep", action="store_true", help="paginate each subreddit instead of one page")
+    parser.add_argument("--max-posts", type=int, default=None, help="per-subreddit cap for deep scans")
+    parser.add_argument("-o", "--output", default="painscout_results.jsonl", help="output file (.jsonl, .jsonl.gz, .csv or .parquet)")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="override the format inferred from --output")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print the final summary")
+    parser.add_argument("--memory-report", action="store_true", help="print per-column memory use of the results")
+    parser.add_argument("--report", default=None, metavar="PATH",
+                        help="also write the full PDF report (every pain point, grouped by category)")
+    parser.add_argument("--metrics", default=None, metavar="PATH",
+                        help="write pipeline metrics to PATH (.prom for Prometheus text, otherwise JSON)")
+    parser.add_argument("--profile", action="store_true", default=Config.PROFILE_ENABLED,
+                        help=f"cProfile the run and save the trace under {Config.PROFILE_DIR} (or set PROFILE_ENABLED)")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    # Imported here so `--help` stays instant
+    from painscout.analyzer import PainAnalyzer
+    from painscout.pipeline import ScanPipeline, noise_summary
+    from painscout.scraper import RedditScraper
+
+    source = SOURCES[args.source]
+    topics = _split(args.topics)
+    keywords = _split(args.keywords) if source == "Reddit" else []
+    progress = ConsoleProgress(args.quiet)
+
+    profile = None
+    if args.profile:
+        from painscout.profiling import ProfileRun
+        profile = ProfileRun(label=f"cli-{args.source}").start()
+
+    try:
+        started = time.time()
+        pipeline = ScanPipeline(RedditScraper(), PainAnalyzer())
+        results = pipeline.run(
+            topics, keywords, days=args.days, source=source,
+            on_partial=progress.partial, on_scanned=progress.scanned,
+            deep=args.deep, max_posts=args.max_posts,
+        )
+
+        if args.memory_report and not results.empty:
+            from painscout.schema import memory_report
+            _log(memory_report(results).to_string())
+
+        if Config.RELEVANCE_FILTER_ENABLED:
+            _log(noise_summary(pipeline.stats))
+        written = export_results(results, args.output, args.format)
+        _log(f"Wrote {len(results)} pain points to {args.output} ({written['format']}, {written['bytes']:,} bytes "
+             f"in {written['seconds']:.2f}s) after {time.time() - started:.1f}s")
+        if args.report and not results.empty:
+            from painscout.reporter import Reporter
+            summary_stats = {
+                'total_posts': len(results),
+                'top_category': results['category'].mode()[0] if results['category'].notna().any() else "N/A",
+                'high_urgency_count': int((results['urgency'] == 'High').sum()),
+            }
+            Reporter.generate_full_report(results, summary_stats, path=args.report)
+            _log(f"Wrote full report to {args.report}")
+    finally:
+        # Also on errors and Ctrl-C, so the profiler never outlives the run
+        if profile and profile.stop():
+            if not args.quiet:
+                _log(profile.summary())
+            _log(f"Wrote profile to {profile.path} (summary: {profile.summary_path})")
+    if args.metrics:
+        write_metrics(args.metrics)
+        _log(f"Wrote metrics to {args.metrics}")
+    return 0
@@ -9,9 +9,98 @@ class Config:
     REDDIT_USER_AGENT = os.getenv("REDDIT_USER_AGENT", "PainScout.ai/1.0")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+    # API Endpoints: overridable to point at proxies or local stand-ins (see benchmarks/)
+    PUSHSHIFT_BASE_URL = os.getenv("PUSHSHIFT_BASE_URL", "https://api.pushshift.io/reddit/search/submission/")
+    X_API_BASE_URL = os.getenv("X_API_BASE_URL", "https://api.twitter.com")
+    GEMINI_API_ENDPOINT = os.getenv("GEMINI_API_ENDPOINT", "")  # e.g. http://127.0.0.1:8080 (uses REST transport)
+
     # Mock Mode: Enable if keys are missing
     MOCK_MODE = os.getenv("MOCK_MODE", "False").lower() == "true" or not (REDDIT_CLIENT_ID and GEMINI_API_KEY)
 
+    # Scan Concurrency: max subreddits fetched in parallel
+    SCAN_CONCURRENCY = int(os.getenv("SCAN_CONCURRENCY", "8"))
+
+    # HTTP Transport: per-host token bucket + retry policy
+    HTTP_RATE_LIMIT = float(os.getenv("HTTP_RATE_LIMIT", "2.0"))  # requests/sec per host
+    HTTP_BURST = float(os.getenv("HTTP_BURST", "5"))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "4"))
+    HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))  # seconds
+    HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "30"))  # seconds
+
+    # Deep Scan: cursor pagination over the full window
+    DEEP_SCAN_PAGE_SIZE = int(os.getenv("DEEP_SCAN_PAGE_SIZE", "100"))
+    DEEP_SCAN_MAX_POSTS = int(os.getenv("DEEP_SCAN_MAX_POSTS", "1000"))  # per subreddit
+
+    # X Search: query planning + pagination
+    X_QUERY_MAX_LENGTH = int(os.getenv("X_QUERY_MAX_LENGTH", "512"))  # 512 on Basic, 1024 on Pro
+    X_MAX_TWEETS_PER_QUERY = int(os.getenv("X_MAX_TWEETS_PER_QUERY", "300"))
+    X_QUERY_CONCURRENCY = int(os.getenv("X_QUERY_CONCURRENCY", "4"))
+
+    # LLM Batching: many posts per Gemini prompt
+    LLM_BATCHED = os.getenv("LLM_BATCHED", "True").lower() == "true"
+    LLM_BATCH_TOKEN_BUDGET = int(os.getenv("LLM_BATCH_TOKEN_BUDGET", "6000"))  # input tokens per prompt
+    LLM_MAX_BATCH_SIZE = int(os.getenv("LLM_MAX_BATCH_SIZE", "25"))  # posts per prompt
+    LLM_MAX_POST_TOKENS = int(os.getenv("LLM_MAX_POST_TOKENS", "400"))  # per-post truncation
+
+    # LLM Concurrency: AIMD-controlled parallel Gemini calls
+    LLM_INITIAL_CONCURRENCY = float(os.getenv("LLM_INITIAL_CONCURRENCY", "2"))
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))  # retries on quota errors
+
+    # Analysis Cache: persistent LLM results keyed by content + prompt + model
+    ANALYSIS_CACHE_ENABLED = os.getenv("ANALYSIS_CACHE_ENABLED", "True").lower() == "true"
+    ANALYSIS_CACHE_PATH = os.getenv("ANALYSIS_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".painscout", "analysis_cache.sqlite"))
+    ANALYSIS_CACHE_TTL_DAYS = float(os.getenv("ANALYSIS_CACHE_TTL_DAYS", "30"))
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "50000"))
+
+    # Post Store: local copy of scraped posts + incremental fetch watermarks
+    POST_STORE_ENABLED = os.getenv("POST_STORE_ENABLED", "True").lower() == "true"
+    POST_STORE_PATH = os.getenv("POST_STORE_PATH", os.path.join(os.path.expanduser("~"), ".painscout", "posts.sqlite"))
+    POST_STORE_RETENTION_DAYS = float(os.getenv("POST_STORE_RETENTION_DAYS", "120"))
+
+    # Relevance Filter: cheap pre-LLM scoring, posts below the threshold skip Gemini
+    RELEVANCE_FILTER_ENABLED = os.getenv("RELEVANCE_FILTER_ENABLED", "True").lower() == "true"
+    RELEVANCE_THRESHOLD = float(os.getenv("RELEVANCE_THRESHOLD", "0.25"))
+
+    # Near-Duplicate Collapsing: MinHash Jaccard estimate at which posts count as the same
+    DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "True").lower() == "true"
+    DEDUP_SIMILARITY = float(os.getenv("DEDUP_SIMILARITY", "0.8"))
+
+    # Themes: TF-IDF + mini-batch k-means grouping of posts into opportunity themes
+    THEMES_ENABLED = os.getenv("THEMES_ENABLED", "True").lower() == "true"
+    THEME_COUNT = int(os.getenv("THEME_COUNT", "0"))  # 0 = sqrt(posts / 2), capped at THEME_MAX_COUNT
+    THEME_MAX_COUNT = int(os.getenv("THEME_MAX_COUNT", "40"))
+    THEME_MAX_FEATURES = int(os.getenv("THEME_MAX_FEATURES", "20000"))
+    # Send only each theme's most central post to Gemini and copy its analysis to the rest
+    THEME_LLM_REPRESENTATIVES_ONLY = os.getenv("THEME_LLM_REPRESENTATIVES_ONLY", "False").lower() == "true"
+
+    # Pipeline: overlapped scrape -> analyze execution
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))  # scanned chunks waiting for analysis
+    PIPELINE_ANALYSIS_WORKERS = int(os.getenv("PIPELINE_ANALYSIS_WORKERS", "2"))
+
+    # Dashboard: memoized exports, figures and aggregates per result set
+    ARTIFACT_CACHE_MAX_ENTRIES = int(os.getenv("ARTIFACT_CACHE_MAX_ENTRIES", "64"))
+    FEED_PAGE_SIZE = int(os.getenv("FEED_PAGE_SIZE", "10"))  # opportunity cards per page
+    CHART_MAX_POINTS = int(os.getenv("CHART_MAX_POINTS", "2000"))  # above this the Urgency Matrix is binned
+    CHART_COMMENT_BINS = int(os.getenv("CHART_COMMENT_BINS", "40"))
+
+    # Scan history: Parquet files on disk, only a few scans held in memory
+    HISTORY_DIR = os.getenv("HISTORY_DIR", os.path.join(os.path.expanduser("~"), ".painscout", "history"))
+    HISTORY_MEMORY_SCANS = int(os.getenv("HISTORY_MEMORY_SCANS", "3"))
+    HISTORY_MAX_SCANS = int(os.getenv("HISTORY_MAX_SCANS", "50"))  # per owner
+    # Each signed-in user (or, without app login, each browser session) sees only its own scans;
+    # HISTORY_SHARED=true gives every visitor one shared history (single-user / trusted team installs)
+    HISTORY_SHARED = os.getenv("HISTORY_SHARED", "False").lower() == "true"
+    HISTORY_SESSION_TTL_HOURS = float(os.getenv("HISTORY_SESSION_TTL_HOURS", "24"))  # scans of ended sessions
+
+    # Exports: CSV/JSONL are written this many rows at a time (to_json buffers ~5x its output)
+    EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "10000"))
+
+    # Profiling: opt-in cProfile capture of whole scan runs (also `--profile` on the CLI)
+    PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "False").lower() == "true"
+    PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(os.path.expanduser("~"), ".painscout", "profiles"))
+    PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "25"))
+
     # Search Configuration
     DEFAULT_SUBREDDITS = ["SaaS", "Entrepreneur", "startups", "sales", "marketing", "smallbusiness"]
     DEFAULT_KEYWORDS = [
@@ -0,0 +1,230 @@
+import re
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from painscout.config import Config
+
+NUM_PERM = 64             # MinHash signature length
+BANDS = 16                # LSH bands of NUM_PERM // BANDS rows each
+TOKEN_CHUNK = 200_000     # tokens hashed per vectorized chunk (~50 MB of work arrays)
+MAX_CHARS = 2000          # leading text per post that is fingerprinted
+SEED = 1337
+
+ANALYSIS_COLUMNS = ['pain_point', 'sentiment_score', 'category', 'target_audience', 'urgency']
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop URLs and punctuation, collapse whitespace (first MAX_CHARS only)."""
+    text = _URL_RE.sub(" ", str(text)[:MAX_CHARS].lower())
+    return _NON_WORD_RE.sub(" ", text).strip()
+
+
+def _shingles(text: str) -> List[str]:
+    # Words plus word bigrams: robust to small edits on short posts
+    words = text.split()
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def minhash_signatures(texts: List[str]) -> np.ndarray:
+    """
+    (len(texts), NUM_PERM) uint32 MinHash signatures of each normalized text.
+    Token hashing and the permutations are vectorized in chunks; rows of
+    empty texts are all 0xFFFFFFFF.
+    """
+    rng = np.random.default_rng(SEED)
+    # Universal hashing a * h + b (mod 2^32) with odd a; uint32 keeps it cheap
+    a = (rng.integers(0, 2 ** 32, size=(NUM_PERM, 1), dtype=np.uint64) | np.uint64(1)).astype(np.uint32)
+    b = rng.integers(0, 2 ** 32, size=(NUM_PERM, 1), dtype=np.uint64).astype(np.uint32)
+
+    # Built transposed, (NUM_PERM, docs), so the per-doc min runs along contiguous rows
+    signatures = np.full((NUM_PERM, len(texts)), np.iinfo(np.uint32).max, dtype=np.uint32)
+    tokens: List[str] = []
+    owners: List[int] = []
+
+    def flush():
+        if not tokens:
+            return
+        hashes = (pd.util.hash_array(np.array(tokens, dtype=object)) >> np.uint64(32)).astype(np.uint32)
+        docs = np.array(owners, dtype=np.int64)
+        permuted = hashes[None, :] * a + b
+        starts = np.flatnonzero(np.r_[True, docs[1:] != docs[:-1]])
+        mins = np.minimum.reduceat(permuted, starts, axis=1)
+        columns = docs[starts]
+        # A document can straddle two chunks
+        signatures[:, columns] = np.minimum(signatures[:, columns], mins)
+        tokens.clear()
+        owners.clear()
+
+    for position, text in enumerate(texts):
+        shingles = _shingles(text)
+        tokens.extend(shingles)
+        owners.extend([position] * len(shingles))
+        if len(tokens) >= TOKEN_CHUNK:
+            flush()
+    flush()
+    return np.ascontiguousarray(signatures.T)
+
+
+def group_near_duplicates(signatures: np.ndarray, threshold: float = None) -> np.ndarray:
+    """
+    Labels posts whose estimated Jaccard similarity is >= `threshold`
+    (transitively) with the same group id. Banded LSH keeps this near-linear:
+    each post is only compared with the first post of every bucket it lands in.
+    """
+    threshold = Config.DEDUP_SIMILARITY if threshold is None else threshold
+    count = len(signatures)
+    parent = np.arange(count)
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    rows = NUM_PERM // BANDS
+    pairs = []
+    for band in range(BANDS):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.itemsize * rows))).ravel()
+        _, first, bucket = np.unique(keys, return_index=True, return_inverse=True)
+        leaders = first[bucket.ravel()]
+        candidates = np.flatnonzero(leaders != np.arange(count))
+        if not len(candidates):
+            continue
+        similarity = (signatures[candidates] == signatures[leaders[candidates]]).mean(axis=1)
+        matched = candidates[similarity >= threshold]
+        pairs.append(np.column_stack((matched, leaders[matched])))
+
+    # The same pair usually matches in many bands; union each one once
+    if pairs:
+        for x, y in np.unique(np.concatenate(pairs), axis=0):
+            x, y = find(x), find(y)
+            if x != y:
+                parent[max(x, y)] = min(x, y)
+
+    return np.array([find(i) for i in range(count)], dtype=np.int64)
+
+
+def _collapse(df: pd.DataFrame, texts: pd.Series, signatures: np.ndarray, threshold: float = None) -> Tuple[pd.DataFrame, pd.Series, np.ndarray]:
+    """collapse_duplicates on precomputed texts/signatures; also returns the representatives' row positions."""
+    labels = group_near_duplicates(signatures, threshold)
+    # Posts with no words at all are never duplicates of each other
+    empty = (texts == "").to_numpy()
+    labels[empty] = np.flatnonzero(empty)
+    groups = pd.Series(labels, index=df.index, name="dup_group")
+
+    score = pd.to_numeric(df['score'], errors='coerce').fillna(0)
+    comments = pd.to_numeric(df['comments'], errors='coerce').fillna(0)
+    engagement = score + comments
+
+    # Most engaged row per group, keeping the input order of representatives
+    leaders = engagement.groupby(groups).idxmax()
+    positions = np.sort(df.index.get_indexer(leaders.values))
+    representatives = df.iloc[positions].copy()
+    rep_groups = groups.loc[representatives.index]
+
+    representatives['score'] = rep_groups.map(score.groupby(groups).sum()).astype(int).values
+    representatives['comments'] = rep_groups.map(comments.groupby(groups).sum()).astype(int).values
+    # Re-collapsing already collapsed rows adds up their existing counts
+    sizes = pd.to_numeric(df['duplicates'], errors='coerce').fillna(1) if 'duplicates' in df else pd.Series(1, index=df.index)
+    representatives['duplicates'] = rep_groups.map(sizes.groupby(groups).sum()).astype(int).values
+    representatives['dup_group'] = rep_groups.values
+    return representatives, groups, positions
+
+
+def _normalized_texts(df: pd.DataFrame) -> pd.Series:
+    return (df['title'].fillna('').astype(str) + " " + df['text'].fillna('').astype(str)).map(normalize_text)
+
+
+def collapse_duplicates(df: pd.DataFrame, threshold: float = None) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Collapses near-identical posts (cross-posts, reposts, quote tweets).
+    Returns (one representative row per group, the group id of every input row).
+    The representative is the most engaged post of its group and stands in for
+    all of it downstream: its `score` and `comments` become the group totals,
+    `duplicates` holds the group size and `dup_group` the group id.
+    """
+    if df.empty:
+        return df, pd.Series(dtype=np.int64)
+
+    texts = _normalized_texts(df)
+    representatives, groups, _ = _collapse(df, texts, minhash_signatures(texts.tolist()), threshold)
+    return representatives, groups
+
+
+class DuplicateIndex:
+    """
+    Run-wide near-duplicate index for chunks that arrive one at a time (one
+    per subreddit page). Each chunk is collapsed on its own, then every
+    representative is looked up in the LSH band buckets of the groups kept
+    so far: a match is folded into that group instead of being analyzed
+    again, anything else starts a new group. Group totals (score, comments,
+    duplicates) keep growing as later copies arrive; apply_totals() writes
+    them onto the analyzed rows. Not thread-safe: feed it from one thread.
+    """
+
+    def __init__(self, threshold: float = None):
+        self.threshold = Config.DEDUP_SIMILARITY if threshold is None else threshold
+        self._buckets = [dict() for _ in range(BANDS)]
+        self._leaders: List[np.ndarray] = []     # signature of each group's first post
+        self._totals: List[List[int]] = []       # [score, comments, duplicates] per group
+
+    def __len__(self) -> int:
+        return len(self._leaders)
+
+    def _match(self, signature: np.ndarray, keys: List[bytes]) -> int:
+        for band, key in enumerate(keys):
+            group = self._buckets[band].get(key)
+            if group is not None and (self._leaders[group] == signature).mean() >= self.threshold:
+                return group
+        return -1
+
+    def collapse(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The posts of `df` that start a new group, collapsed as in
+        collapse_duplicates, with run-wide `dup_group` ids. Posts matching an
+        earlier group only add to its totals.
+        """
+        if df.empty:
+            return df
+
+        texts = _normalized_texts(df)
+        signatures = minhash_signatures(texts.tolist())
+        representatives, _, positions = _collapse(df, texts, signatures, self.threshold)
+
+        rows = NUM_PERM // BANDS
+        empty = (texts.iloc[positions] == "").to_numpy()
+        keep = np.zeros(len(representatives), dtype=bool)
+        group_ids = np.empty(len(representatives), dtype=np.int64)
+        totals = representatives[['score', 'comments', 'duplicates']].to_numpy(dtype=np.int64)
+        for i, position in enumerate(positions):
+            signature = signatures[position]
+            keys = [signature[band * rows:(band + 1) * rows].tobytes() for band in range(BANDS)]
+            group = -1 if empty[i] else self._match(signature, keys)
+            if group >= 0:
+                self._totals[group] = [t + v for t, v in zip(self._totals[group], totals[i].tolist())]
+                continue
+            group = len(self._leaders)
+            self._leaders.append(signature)
+            self._totals.append(totals[i].tolist())
+            if not empty[i]:
+                for band, key in enumerate(keys):
+                    self._buckets[band].setdefault(key, group)
+            keep[i] = True
+            group_ids[i] = group
+
+        kept = representatives[keep].copy()
+        kept['dup_group'] = group_ids[keep]
+        return kept
+
+    def apply_totals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """`df` (rows returned by collapse) with each group's final score, comments and duplicates."""
+        if df.empty or 'dup_group' not in df:
+            return df
+        totals = np.array(self._totals, dtype=np.int64).reshape(-1, 3)[df['dup_group'].to_numpy(dtype=np.int64)]
+        return df.assign(score=totals[:, 0], comments=totals[:, 1], duplicates=totals[:, 2])
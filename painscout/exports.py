@@ -0,0 +1,119 @@
+import gzip
+import io
+import os
+import time
+from typing import IO, Dict, Union
+
+import pandas as pd
+
+from painscout.config import Config
+from painscout.metrics import METRICS
+
+# Format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "jsonl.gz": (".jsonl.gz", "application/gzip"),
+    "jsonl": (".jsonl", "application/x-ndjson"),
+}
+
+
+CSV_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _CountingWriter(io.RawIOBase):
+    """Binary sink that forwards writes to `target` and counts the bytes."""
+
+    def __init__(self, target: IO[bytes]):
+        self.target = target
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.target.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self):
+        self.target.flush()
+
+
+def infer_format(path: str) -> str:
+    for fmt, (extension, _) in EXPORT_FORMATS.items():
+        if path.endswith(extension):
+            return fmt
+    return "jsonl"
+
+
+def _chunks(df: pd.DataFrame, chunk_rows: int):
+    for start in range(0, len(df), chunk_rows):
+        yield start, df.iloc[start:start + chunk_rows]
+
+
+def _write_csv(df: pd.DataFrame, sink: IO[bytes], chunk_rows: int):
+    # One chunk of text is alive at a time instead of the whole file as str + bytes
+    text = io.TextIOWrapper(sink, encoding="utf-8", newline="", write_through=True)
+    if df.empty:
+        df.to_csv(text, index=False)
+    for start, chunk in _chunks(df, chunk_rows):
+        # Fixed format: pandas drops the time from a chunk whose timestamps are all midnight
+        chunk.to_csv(text, index=False, header=start == 0, date_format=CSV_DATE_FORMAT)
+    text.detach()
+
+
+def _write_jsonl(df: pd.DataFrame, sink: IO[bytes], chunk_rows: int):
+    for _, chunk in _chunks(df, chunk_rows):
+        lines = chunk.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+        sink.write(lines.encode("utf-8"))
+        if not lines.endswith("\n"):
+            sink.write(b"\n")
+
+
+def _write_jsonl_gz(df: pd.DataFrame, sink: IO[bytes], chunk_rows: int):
+    with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=6, mtime=0) as compressed:
+        _write_jsonl(df, compressed, chunk_rows)
+
+
+def _write_parquet(df: pd.DataFrame, sink: IO[bytes], chunk_rows: int):
+    # Columnar and zstd-compressed; pyarrow writes straight to the sink
+    df.to_parquet(sink, index=False, compression="zstd")
+
+
+_WRITERS = {"csv": _write_csv, "parquet": _write_parquet, "jsonl.gz": _write_jsonl_gz, "jsonl": _write_jsonl}
+
+
+def export(df: pd.DataFrame, target: Union[str, IO[bytes]], fmt: str = None, chunk_rows: int = None) -> Dict:
+    """
+    Writes `df` straight to a file path or binary stream in `fmt` (csv,
+    parquet, jsonl.gz or jsonl; inferred from a path's extension), CSV and
+    JSONL in chunks of `chunk_rows` rows. Returns format, rows, bytes written
+    and seconds taken.
+    """
+    if fmt is None:
+        fmt = infer_format(target) if isinstance(target, str) else "csv"
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    chunk_rows = chunk_rows or Config.EXPORT_CHUNK_ROWS
+
+    start = time.perf_counter()
+    with METRICS.stage(f"export_{fmt}") as stage:
+        stage.rows = len(df)
+        if isinstance(target, str):
+            os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+            with open(target, "wb") as f:
+                sink = _CountingWriter(f)
+                _WRITERS[fmt](df, sink, chunk_rows)
+        else:
+            sink = _CountingWriter(target)
+            _WRITERS[fmt](df, sink, chunk_rows)
+    METRICS.inc("export_bytes_total", sink.bytes_written, format=fmt)
+    return {"format": fmt, "rows": len(df), "bytes": sink.bytes_written, "seconds": time.perf_counter() - start}
+
+
+def export_bytes(df: pd.DataFrame, fmt: str, chunk_rows: int = None) -> bytes:
+    """The export as one bytes object (for download buttons)."""
+    buffer = io.BytesIO()
+    export(df, buffer, fmt, chunk_rows)
+    return buffer.getvalue()
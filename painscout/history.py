@@ -0,0 +1,181 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from painscout.artifacts import result_fingerprint
+from painscout.config import Config
+
+
+class ScanHistory:
+    """
+    Saved scans on disk: one Parquet file per scan plus a small SQLite index
+    of their metadata. Listing only reads the index; a scan's rows are read
+    on first load and kept in an LRU of at most `max_loaded` DataFrames.
+    Saving the same results twice is a no-op.
+
+    Every scan belongs to an `owner` key and is only listed, loaded or
+    deleted for that owner; the app passes a per-user or per-session key
+    ("" is the one history shared by everyone, see HISTORY_SHARED).
+    """
+
+    def __init__(self, root: Optional[str] = None, max_loaded: Optional[int] = None, max_scans: Optional[int] = None,
+                 session_ttl: Optional[float] = None):
+        self.root = root or Config.HISTORY_DIR
+        self.max_loaded = max_loaded or Config.HISTORY_MEMORY_SCANS
+        self.max_scans = max_scans or Config.HISTORY_MAX_SCANS
+        self.session_ttl = session_ttl or Config.HISTORY_SESSION_TTL_HOURS * 3600
+        self._loaded: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(self.root, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(self.root, "index.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(scans)")}
+        if columns and "owner" not in columns:
+            # Index from before scans had owners: they were visible to everyone, so they join the shared history
+            self._conn.execute("ALTER TABLE scans RENAME TO scans_unowned")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scans ("
+            " id TEXT PRIMARY KEY,"
+            " owner TEXT NOT NULL,"
+            " label TEXT NOT NULL,"
+            " source TEXT,"
+            " rows INTEGER NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " UNIQUE (owner, fingerprint))"
+        )
+        if columns and "owner" not in columns:
+            self._conn.execute(
+                "INSERT INTO scans (id, owner, label, source, rows, fingerprint, created_at)"
+                " SELECT id, '', label, source, rows, fingerprint, created_at FROM scans_unowned"
+            )
+            self._conn.execute("DROP TABLE scans_unowned")
+        self._conn.commit()
+
+    def _path(self, scan_id: str) -> str:
+        return os.path.join(self.root, f"{scan_id}.parquet")
+
+    def save(self, df: pd.DataFrame, source: Optional[str] = None, owner: str = "") -> Dict:
+        """Writes the scan (unless the owner already saved identical results) and returns its metadata."""
+        fingerprint = result_fingerprint(df)
+        existing = self._find(owner, fingerprint)
+        if existing:
+            return existing
+
+        now = datetime.now()
+        meta = {
+            # Random suffix: two owners may save the same results in the same second
+            "id": f"{now.strftime('%Y%m%d-%H%M%S')}-{fingerprint[:8]}-{uuid.uuid4().hex[:6]}",
+            "label": now.strftime("%Y-%m-%d %H:%M"),
+            "source": source,
+            "rows": len(df),
+            "fingerprint": fingerprint,
+            "created_at": time.time(),
+        }
+        # Write to a temp file first so a crash never leaves a half-written scan
+        tmp_path = self._path(meta["id"]) + ".tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self._path(meta["id"]))
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO scans (id, owner, label, source, rows, fingerprint, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (meta["id"], owner, meta["label"], meta["source"], meta["rows"], meta["fingerprint"], meta["created_at"]),
+            )
+            self._conn.commit()
+            self._remember(meta["id"], df)
+        self.prune(owner)
+        return meta
+
+    def _find(self, owner: str, fingerprint: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, label, source, rows, fingerprint, created_at FROM scans WHERE owner = ? AND fingerprint = ?",
+                (owner, fingerprint),
+            ).fetchone()
+        return self._meta(row) if row else None
+
+    def _owns(self, owner: str, scan_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM scans WHERE id = ? AND owner = ?", (scan_id, owner)).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _meta(row) -> Dict:
+        return dict(zip(["id", "label", "source", "rows", "fingerprint", "created_at"], row))
+
+    def list(self, owner: str = "") -> List[Dict]:
+        """Metadata of the owner's saved scans, newest first (no scan data is read)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, label, source, rows, fingerprint, created_at FROM scans WHERE owner = ? ORDER BY created_at DESC",
+                (owner,),
+            ).fetchall()
+        return [self._meta(row) for row in rows]
+
+    def load(self, scan_id: str, owner: str = "") -> Optional[pd.DataFrame]:
+        """The scan's rows, from the in-memory LRU or its Parquet file; None if unknown or someone else's."""
+        if not self._owns(owner, scan_id):
+            return None
+        with self._lock:
+            if scan_id in self._loaded:
+                self._loaded.move_to_end(scan_id)
+                return self._loaded[scan_id]
+        path = self._path(scan_id)
+        if not os.path.exists(path):
+            return None
+        df = pd.read_parquet(path)
+        with self._lock:
+            self._remember(scan_id, df)
+        return df
+
+    def _remember(self, scan_id: str, df: pd.DataFrame):
+        self._loaded[scan_id] = df
+        self._loaded.move_to_end(scan_id)
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
+
+    def delete(self, scan_id: str, owner: str = ""):
+        if not self._owns(owner, scan_id):
+            return
+        self._drop(scan_id)
+
+    def _drop(self, scan_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM scans WHERE id = ?", (scan_id,))
+            self._conn.commit()
+            self._loaded.pop(scan_id, None)
+        try:
+            os.remove(self._path(scan_id))
+        except FileNotFoundError:
+            pass
+
+    def prune(self, owner: str = ""):
+        """
+        Drops the owner's oldest scans beyond `max_scans`, and every
+        per-session scan older than `session_ttl` (its session is gone).
+        """
+        with self._lock:
+            stale = self._conn.execute(
+                "SELECT id FROM scans WHERE owner = ? ORDER BY created_at DESC LIMIT -1 OFFSET ?",
+                (owner, self.max_scans),
+            ).fetchall()
+            stale += self._conn.execute(
+                "SELECT id FROM scans WHERE owner LIKE 'session:%' AND created_at < ?",
+                (time.time() - self.session_ttl,),
+            ).fetchall()
+        for (scan_id,) in stale:
+            self._drop(scan_id)
+
+    def close(self):
+        with self._lock:
+            self._loaded.clear()
+            self._conn.close()
@@ -0,0 +1,214 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Latency buckets in seconds (upper bounds; +Inf is implicit)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, object]) -> LabelKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _series(key: LabelKey, extra: Optional[Dict[str, str]] = None) -> str:
+    name, labels = key
+    pairs = list(labels) + sorted((extra or {}).items())
+    if not pairs:
+        return name
+    return name + "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    # Prometheus text wants full precision (timestamps) but not "5.0" for counts
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus style) with an interpolated quantile estimate."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            if count and seen + count >= rank:
+                if bound == float("inf"):
+                    return lower
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return lower
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts)),
+        }
+
+
+class StageTimer:
+    """Handed out by Metrics.stage(); set `rows` to get a rows/s figure for the stage."""
+
+    def __init__(self):
+        self.rows = 0
+
+
+class Metrics:
+    """
+    Process-wide counters, gauges and histograms, labelled like Prometheus
+    series. Thread-safe; exported as a JSON snapshot or Prometheus text.
+    """
+
+    def __init__(self):
+        self._counters: Dict[LabelKey, float] = {}
+        self._gauges: Dict[LabelKey, float] = {}
+        self._histograms: Dict[LabelKey, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observes the wall time of the block (in seconds) into histogram `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[StageTimer]:
+        """Per-stage wall time (stage_seconds) and processed rows (stage_rows_total)."""
+        timer = StageTimer()
+        start = time.perf_counter()
+        try:
+            yield timer
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - start, stage=stage)
+            self.inc("stage_rows_total", timer.rows, stage=stage)
+
+    # --- Reading ---
+
+    def counter(self, name: str, **labels) -> float:
+        """A counter's value; without labels, the sum over all its series."""
+        with self._lock:
+            if labels:
+                return self._counters.get(_key(name, labels), 0)
+            return sum(v for (n, _), v in self._counters.items() if n == name)
+
+    def gauge(self, name: str, **labels) -> Optional[float]:
+        with self._lock:
+            return self._gauges.get(_key(name, labels))
+
+    def histogram(self, name: str, **labels) -> Optional[Histogram]:
+        """A histogram series; without labels, all its series merged."""
+        with self._lock:
+            if labels:
+                return self._histograms.get(_key(name, labels))
+            series = [h for (n, _), h in self._histograms.items() if n == name]
+            if not series:
+                return None
+            merged = Histogram(series[0].buckets)
+            for h in series:
+                merged.counts = [a + b for a, b in zip(merged.counts, h.counts)]
+                merged.sum += h.sum
+                merged.count += h.count
+            return merged
+
+    def stage_summary(self) -> List[Dict]:
+        """Wall time, runs, rows and rows/s of every instrumented stage."""
+        with self._lock:
+            stages = [(dict(labels)["stage"], h) for (n, labels), h in self._histograms.items() if n == "stage_seconds"]
+            rows = {dict(labels).get("stage"): v for (n, labels), v in self._counters.items() if n == "stage_rows_total"}
+        return [
+            {
+                "stage": stage,
+                "runs": h.count,
+                "seconds": h.sum,
+                "rows": rows.get(stage, 0),
+                "rows_per_s": rows.get(stage, 0) / h.sum if h.sum else 0.0,
+            }
+            for stage, h in stages
+        ]
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "counters": {_series(k): v for k, v in self._counters.items()},
+                "gauges": {_series(k): v for k, v in self._gauges.items()},
+                "histograms": {_series(k): h.to_dict() for k, h in self._histograms.items()},
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(dict(self.snapshot(), stages=self.stage_summary()), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix: str = "painscout_") -> str:
+        lines: List[str] = []
+        with self._lock:
+            for kind, series in (("counter", self._counters), ("gauge", self._gauges)):
+                for name in sorted({k[0] for k in series}):
+                    lines.append(f"# TYPE {prefix}{name} {kind}")
+                    for key in sorted(k for k in series if k[0] == name):
+                        lines.append(f"{prefix}{_series(key)} {_number(series[key])}")
+            for name in sorted({k[0] for k in self._histograms}):
+                lines.append(f"# TYPE {prefix}{name} histogram")
+                for key in sorted(k for k in self._histograms if k[0] == name):
+                    h = self._histograms[key]
+                    cumulative = 0
+                    for bound, count in zip([f"{b:g}" for b in h.buckets] + ["+Inf"], h.counts):
+                        cumulative += count
+                        lines.append(f"{prefix}{_series((name + '_bucket', key[1]), {'le': bound})} {cumulative}")
+                    lines.append(f"{prefix}{_series((name + '_sum', key[1]))} {_number(h.sum)}")
+                    lines.append(f"{prefix}{_series((name + '_count', key[1]))} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+# Shared by every module in the process (and every Streamlit session)
+METRICS = Metrics()
@@ -0,0 +1,222 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from painscout.analyzer import PainAnalyzer
+from painscout.config import Config
+from painscout.dedup import DuplicateIndex
+from painscout.metrics import METRICS
+from painscout.profiling import profiled
+from painscout.relevance import filter_relevant
+from painscout.schema import apply_schema
+from painscout.scraper import RedditScraper
+from painscout.themes import assign_themes, expand_to_themes, theme_representatives
+
+_DONE = object()
+
+
+def noise_summary(stats: Dict) -> str:
+    """"Kept N of M signals (x% skipped as noise)" from pipeline stats."""
+    raw = stats.get("raw_posts", 0)
+    skipped = stats.get("skipped", 0)
+    return f"Kept {raw - skipped} of {raw} signals ({skipped / raw if raw else 0:.0%} skipped as noise)"
+
+
+class _Scanned:
+    """Scan progress event, relayed to the caller's thread via the result queue."""
+
+    def __init__(self, label: str):
+        self.label = label
+
+
+class ScanPipeline:
+    """
+    Overlapped scrape -> analyze execution.
+    A producer thread streams scan chunks (one per subreddit, or one per page
+    on deep scans), filters them and drops posts already seen earlier in the
+    run, then feeds a bounded queue; analysis workers pick chunks up as soon
+    as they arrive. The caller's
+    thread only merges results and reports partials, so `on_partial` can
+    safely update Streamlit elements. Wall time is roughly the slower of the
+    two stages instead of their sum.
+    """
+
+    def __init__(self, scraper: RedditScraper, analyzer: PainAnalyzer, queue_size: int = None, workers: int = None):
+        self.scraper = scraper
+        self.analyzer = analyzer
+        self.queue_size = queue_size or Config.PIPELINE_QUEUE_SIZE
+        self.workers = workers or Config.PIPELINE_ANALYSIS_WORKERS
+        # Counters of the latest run (raw_posts, skipped, chunks_/sources_ scanned and analyzed)
+        self.stats: Dict = {}
+
+    def _prepare(self, chunk: pd.DataFrame, trigger_list: List[str], duplicates: Optional[DuplicateIndex]) -> Tuple[pd.DataFrame, int]:
+        """
+        Pre-LLM stages on one chunk: relevance filter, then near-duplicate
+        collapsing against every chunk of the run seen so far.
+        """
+        skipped = 0
+        if Config.RELEVANCE_FILTER_ENABLED:
+            with METRICS.stage("relevance") as stage:
+                stage.rows = len(chunk)
+                chunk, relevance_stats = filter_relevant(chunk, keywords=trigger_list or None)
+            skipped = relevance_stats["skipped"]
+            METRICS.inc("relevance_skipped_total", skipped)
+        if duplicates is not None and not chunk.empty:
+            with METRICS.stage("dedup") as stage:
+                stage.rows = len(chunk)
+                deduped = duplicates.collapse(chunk)
+            METRICS.inc("dedup_collapsed_total", len(chunk) - len(deduped))
+            chunk = deduped
+        return chunk, skipped
+
+    def _analyze_representatives(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Analyzes only the most central post of each theme and copies the result to the rest."""
+        with METRICS.stage("themes") as stage:
+            stage.rows = len(chunk)
+            representatives, themes = theme_representatives(chunk)
+        METRICS.inc("theme_llm_skipped_total", len(chunk) - len(representatives))
+        analyzed = self.analyzer.analyze_batch(representatives)
+        return expand_to_themes(analyzed, chunk, themes)
+
+    def run(self, subreddits: List[str], keywords: List[str], days: int = 30, source: str = "Reddit",
+            on_partial: Optional[Callable[[pd.DataFrame, Dict], None]] = None,
+            on_scanned: Optional[Callable[[str, Dict], None]] = None, **scan_options) -> pd.DataFrame:
+        """
+        Runs the scan and analysis concurrently and returns the analyzed rows
+        that contain a pain point. Both callbacks run on the caller's thread:
+        `on_scanned(label, stats)` whenever a scan chunk arrives and
+        `on_partial(results_so_far, stats)` whenever a chunk finishes analysis.
+        """
+        started = time.perf_counter()
+        with METRICS.stage("pipeline") as stage:
+            results = self._run(subreddits, keywords, days, source, on_partial, on_scanned, **scan_options)
+            stage.rows = len(results)
+        METRICS.set("last_scan_seconds", time.perf_counter() - started)
+        METRICS.set("last_scan_timestamp", time.time())
+        METRICS.set("last_scan_rows", len(results))
+        return results
+
+    def _run(self, subreddits: List[str], keywords: List[str], days: int, source: str,
+             on_partial: Optional[Callable[[pd.DataFrame, Dict], None]],
+             on_scanned: Optional[Callable[[str, Dict], None]], **scan_options) -> pd.DataFrame:
+        scan_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        result_queue: "queue.Queue" = queue.Queue()
+        stats = self.stats = {"raw_posts": 0, "skipped": 0, "chunks_scanned": 0, "chunks_analyzed": 0,
+                              "sources_scanned": 0, "sources_analyzed": 0, "started": time.time()}
+        stats_lock = threading.Lock()
+        # One index for the whole run: a cross-post seen in an earlier chunk never reaches the LLM again
+        duplicates = DuplicateIndex() if Config.DEDUP_ENABLED else None
+        # Per source position: chunks queued but not analyzed yet, and whether its last chunk was scanned
+        pending: Dict[int, int] = {}
+        closed = set()
+
+        def close_if_done(idx: int):
+            # Caller holds stats_lock
+            if idx in closed and not pending.get(idx):
+                stats["sources_analyzed"] += 1
+
+        def enqueue(idx: int, label: str, records: List[Dict], last: bool):
+            chunk, skipped = pd.DataFrame(), 0
+            if records:
+                try:
+                    chunk, skipped = self._prepare(apply_schema(pd.DataFrame(records)), keywords, duplicates)
+                except Exception as e:
+                    print(f"Error preparing {label}: {e}")
+            with stats_lock:
+                stats["skipped"] += skipped
+                if not chunk.empty:
+                    pending[idx] = pending.get(idx, 0) + 1
+                if last:
+                    closed.add(idx)
+                    close_if_done(idx)
+            if not chunk.empty:
+                # Blocks while analysis is behind: bounded memory, natural backpressure
+                scan_queue.put((idx, label, chunk))
+
+        def produce():
+            try:
+                for idx, label, records, last in self.scraper.iter_scan(subreddits, keywords, days=days, source=source, **scan_options):
+                    with stats_lock:
+                        stats["raw_posts"] += len(records)
+                        stats["chunks_scanned"] += 1
+                        stats["sources_scanned"] += last
+                    result_queue.put(_Scanned(label))
+                    enqueue(idx, label, records, last)
+            except Exception as e:
+                print(f"Fatal Error during scan: {e}")
+            finally:
+                if stats["raw_posts"] == 0:
+                    print("No signals scanned -> Falling back to DEMO DATA")
+                    demo = self.scraper._get_beautiful_demo_data(source="Twitter" if source == "X (Twitter)" else "Reddit")
+                    stats["raw_posts"] = len(demo)
+                    enqueue(-1, "Demo", demo, False)
+                for _ in range(self.workers):
+                    scan_queue.put(_DONE)
+
+        def analyze():
+            while True:
+                item = scan_queue.get()
+                if item is _DONE:
+                    result_queue.put(_DONE)
+                    return
+                idx, label, chunk = item
+                try:
+                    if Config.THEME_LLM_REPRESENTATIVES_ONLY:
+                        analyzed = self._analyze_representatives(chunk)
+                    else:
+                        analyzed = self.analyzer.analyze_batch(chunk)
+                    result_queue.put((idx, analyzed.dropna(subset=['pain_point'])))
+                except Exception as e:
+                    print(f"Error analyzing {label}: {e}")
+                    result_queue.put((idx, pd.DataFrame()))
+
+        threads = [threading.Thread(target=profiled(produce), name="painscout-scan", daemon=True)]
+        threads += [threading.Thread(target=profiled(analyze), name=f"painscout-analyze-{i}", daemon=True) for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        frames = []
+        finished = 0
+        while finished < self.workers:
+            item = result_queue.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            if isinstance(item, _Scanned):
+                if on_scanned:
+                    with stats_lock:
+                        snapshot = dict(stats)
+                    on_scanned(item.label, snapshot)
+                continue
+            idx, frame = item
+            with stats_lock:
+                stats["chunks_analyzed"] += 1
+                if idx in pending:
+                    pending[idx] -= 1
+                    close_if_done(idx)
+            if not frame.empty:
+                frames.append(frame)
+            if on_partial and frames:
+                with stats_lock:
+                    snapshot = dict(stats)
+                on_partial(pd.concat(frames, ignore_index=True), snapshot)
+
+        for thread in threads:
+            thread.join()
+
+        if not frames:
+            return pd.DataFrame()
+        results = pd.concat(frames, ignore_index=True)
+        # Copies that arrived after their group's representative was queued still count
+        if duplicates is not None:
+            results = duplicates.apply_totals(results)
+        # Themes span chunks, so they are (re)assigned over the merged results
+        if Config.THEMES_ENABLED:
+            with METRICS.stage("themes") as stage:
+                stage.rows = len(results)
+                results = assign_themes(results)
+        # Per-chunk categoricals with different categories concat to object; re-type once
+        return apply_schema(results.reset_index(drop=True))
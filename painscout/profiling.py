@@ -0,0 +1,176 @@
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from painscout.config import Config
+
+# Python 3.12+ profiles through sys.monitoring: one enabled cProfile.Profile sees
+# every thread, and enabling a second one raises ValueError
+SHARED_PROFILER = sys.version_info >= (3, 12)
+
+# The run being captured by this thread (and the workers it hands `profiled` calls to)
+_ACTIVE_RUN: ContextVar[Optional["ProfileRun"]] = ContextVar("painscout_profile_run", default=None)
+
+
+def profiled(fn: Callable) -> Callable:
+    """
+    `fn` wrapped for running on another thread as part of the current
+    ProfileRun: before Python 3.12 each call gets its own profiler, merged
+    into the run. Wrap in the thread that owns the run (or inside another
+    profiled call); outside a run, and on 3.12+, `fn` is returned as is.
+    """
+    run = _ACTIVE_RUN.get()
+    if run is None or SHARED_PROFILER:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Threads start with an empty context: carry the run over for nested pools
+        token = _ACTIVE_RUN.set(run)
+        try:
+            return run._call(fn, args, kwargs)
+        finally:
+            _ACTIVE_RUN.reset(token)
+
+    return wrapper
+
+
+def _location(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Built-ins: "{method 'sort' of 'list' objects}"
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+class ProfileRun:
+    """
+    Opt-in cProfile capture of one scan run (scan -> analyze -> render -> export).
+    Profiles the pipeline, scan and LLM pool threads too: on Python 3.12+ a
+    single profiler covers every thread of the process; before that, only
+    the calling thread and the work the run hands to other threads through
+    `profiled()` are captured, each call with its own profiler that is
+    disabled when it returns and merged at stop(). Writes a .prof file
+    (pstats / snakeviz) plus a text summary of the hottest functions. Only
+    one run can be captured at a time; always call stop(), even when the run
+    fails, from the thread that started it.
+    """
+
+    def __init__(self, label: str = "scan", directory: str = None, top_n: int = None):
+        self.label = label
+        self.directory = directory or Config.PROFILE_DIR
+        self.top_n = top_n or Config.PROFILE_TOP_N
+        self.path: Optional[str] = None
+        self.summary_path: Optional[str] = None
+        self.stats: Optional[pstats.Stats] = None
+        self.seconds = 0.0
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._token = None
+        self._started = 0.0
+        self.active = False
+
+    def _call(self, fn: Callable, args: tuple, kwargs: dict):
+        """Runs fn on this worker thread under its own profiler (Python < 3.12)."""
+        if not self.active or sys.getprofile() is not None:
+            # Run already stopped, or this thread is profiled already (nested call)
+            return fn(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+            with self._lock:
+                if self.active:
+                    self._profiles.append(profile)
+
+    def start(self) -> "ProfileRun":
+        main = cProfile.Profile()
+        try:
+            main.enable()
+        except ValueError as e:
+            print(f"Profiling skipped: {e}")
+            return self
+        self._profiles = [main]
+        self._token = _ACTIVE_RUN.set(self)
+        self._started = time.perf_counter()
+        self.active = True
+        return self
+
+    def stop(self) -> Optional[str]:
+        """
+        Stops profiling, writes the .prof file and its summary; returns the
+        .prof path (None if profiling never started).
+        """
+        if not self.active:
+            return None
+        main = self._profiles[0]
+        main.disable()
+        self.seconds = time.perf_counter() - self._started
+        _ACTIVE_RUN.reset(self._token)
+
+        with self._lock:
+            # Calls still running on other threads disable their profiler on return and are left out
+            self.active = False
+            profiles = list(self._profiles)
+        self.stats = pstats.Stats(main)
+        for profile in profiles[1:]:
+            profile.create_stats()
+            if profile.stats:
+                self.stats.add(profile)
+
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.label}"
+        self.path = os.path.join(self.directory, f"{name}.prof")
+        self.summary_path = os.path.join(self.directory, f"{name}.txt")
+        self.stats.dump_stats(self.path)
+        with open(self.summary_path, "w", encoding="utf-8") as f:
+            f.write(self.summary())
+        return self.path
+
+    def __enter__(self) -> "ProfileRun":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def hot_functions(self, n: int = None, sort: str = "tottime") -> List[Dict]:
+        """Top `n` functions by own time ("tottime") or inclusive time ("cumtime")."""
+        rows = [
+            {
+                "function": _location(func),
+                "calls": nc,
+                "tottime": tt,
+                "cumtime": ct,
+                "per_call_ms": tt / nc * 1000 if nc else 0.0,
+            }
+            for func, (cc, nc, tt, ct, callers) in self.stats.stats.items()
+        ]
+        rows.sort(key=lambda row: row[sort], reverse=True)
+        return rows[:n or self.top_n]
+
+    def summary(self) -> str:
+        """Plain-text top-N report: hottest by own time, then by cumulative time."""
+        lines = [
+            f"Profile '{self.label}': {self.seconds:.2f}s wall, "
+            f"{'all threads' if SHARED_PROFILER else f'main thread + {len(self._profiles) - 1} worker call(s)'}, "
+            f"{self.stats.total_calls} calls",
+            "",
+        ]
+        for sort, title in (("tottime", "own time"), ("cumtime", "cumulative time")):
+            lines.append(f"Top {self.top_n} by {title}:")
+            lines.append(f"{'calls':>10} {'tottime':>9} {'cumtime':>9}  function")
+            for row in self.hot_functions(sort=sort):
+                lines.append(f"{row['calls']:>10} {row['tottime']:>9.3f} {row['cumtime']:>9.3f}  {row['function']}")
+            lines.append("")
+        return "\n".join(lines)
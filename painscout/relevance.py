@@ -0,0 +1,101 @@
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from painscout.config import Config
+
+# Complaints, requests and buying intent
+PAIN_PATTERN = (
+    r"\b(?:hat(?:e|es|ed|ing)|sucks?|frustrat\w*|annoy\w*|broken|struggl\w*|waste\w*|"
+    r"nightmare|painful|can'?t find|cannot|doesn'?t work|too (?:expensive|slow|complicated)|"
+    r"looking for|is there (?:a|any)|anyone (?:know|recommend)|alternative|"
+    r"someone should|would pay|wish|need (?:a|an|to)|how do (?:i|you))\b"
+)
+
+# Posts that look like promotion, memes or community chatter
+NOISE_PATTERN = (
+    r"\b(?:announc\w*|we'?re hiring|giveaway|meme|weekly thread|ama|promo code|"
+    r"discount code|check out my|just launched|upvote)\b"
+)
+
+WEIGHTS = {
+    "trigger": 0.40,     # pain-trigger phrase hits (saturates at 2)
+    "pain": 0.25,        # complaint / request wording
+    "question": 0.10,    # asks something
+    "length": 0.10,      # enough text to describe a problem
+    "engagement": 0.15,  # score + comments, log-scaled
+}
+NOISE_PENALTY = 0.30
+
+
+def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df:
+        return pd.Series(0.0, index=df.index)
+    return pd.to_numeric(df[column], errors='coerce').fillna(0).clip(lower=0)
+
+
+def score_relevance(df: pd.DataFrame, keywords: List[str] = None) -> pd.Series:
+    """
+    Cheap, fully vectorized 0-1 estimate of how likely each post is to contain
+    a pain point. Meant to run before the LLM, not to replace it.
+    """
+    if df.empty:
+        return pd.Series(dtype=float)
+
+    keywords = [k.strip().lower() for k in (keywords or Config.DEFAULT_KEYWORDS) if k.strip()]
+    text = (df['title'].fillna('').astype(str) + " " + df['text'].fillna('').astype(str)).str.lower()
+    # Python's re is several times faster than Arrow's regex engine on these
+    # word-boundary patterns, so match on object dtype
+    text = text.astype(object)
+
+    if keywords:
+        trigger_regex = "|".join(re.escape(k) for k in keywords)
+        trigger_hits = text.str.count(trigger_regex).clip(upper=2) / 2
+    else:
+        trigger_hits = pd.Series(0.0, index=df.index)
+
+    pain = text.str.contains(PAIN_PATTERN, regex=True).astype(float)
+    question = text.str.contains("?", regex=False).astype(float)
+    length = (text.str.len() / 200).clip(upper=1.0)
+
+    engagement_raw = _numeric_column(df, 'score') + _numeric_column(df, 'comments')
+    engagement = pd.Series(np.log1p(engagement_raw) / np.log1p(500), index=df.index).clip(upper=1.0)
+
+    noise = text.str.contains(NOISE_PATTERN, regex=True).astype(float)
+
+    score = (
+        WEIGHTS["trigger"] * trigger_hits
+        + WEIGHTS["pain"] * pain
+        + WEIGHTS["question"] * question
+        + WEIGHTS["length"] * length
+        + WEIGHTS["engagement"] * engagement
+        - NOISE_PENALTY * noise
+    )
+    return score.clip(lower=0.0, upper=1.0)
+
+
+def filter_relevant(df: pd.DataFrame, keywords: List[str] = None, threshold: float = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Keeps posts scoring at or above `threshold` (default Config.RELEVANCE_THRESHOLD).
+    Returns (kept rows with a `relevance` column, stats incl. the skip ratio).
+    """
+    threshold = Config.RELEVANCE_THRESHOLD if threshold is None else threshold
+    if df.empty:
+        return df, {"total": 0, "kept": 0, "skipped": 0, "skip_ratio": 0.0, "threshold": threshold}
+
+    relevance = score_relevance(df, keywords)
+    mask = relevance >= threshold
+    kept = df.loc[mask].assign(relevance=relevance[mask])
+
+    total = len(df)
+    skipped = total - len(kept)
+    stats = {
+        "total": total,
+        "kept": len(kept),
+        "skipped": skipped,
+        "skip_ratio": skipped / total,
+        "threshold": threshold,
+    }
+    return kept, stats
@@ -1,7 +1,61 @@
+from typing import Optional, Union
+
+import numpy as np
 import pandas as pd
+import fpdf
 from fpdf import FPDF
 
+from painscout.metrics import METRICS
+
+# Full report table: (header, width in mm, alignment); 190mm fits A4 margins
+FULL_REPORT_COLUMNS = [("#", 12, 'C'), ("Pain Point", 104, 'L'), ("Urgency", 20, 'C'),
+                       ("Score", 14, 'C'), ("Comments", 20, 'C'), ("Source", 20, 'C')]
+FULL_REPORT_LINE_HEIGHT = 5
+
+# fpdf versions whose buffer internals _Buffer was checked against
+BUFFER_PATCH_VERSIONS = ("1.7.2",)
+
+
+class _Buffer:
+    """
+    Append-only stand-in for FPDF's string buffer. FPDF grows `self.buffer`
+    with `+=` on an attribute, which copies the whole document for every
+    line written, so output time grows quadratically with page count.
+    Relies on fpdf 1.7.2 internals (pinned in requirements.txt, and only
+    installed on the versions in BUFFER_PATCH_VERSIONS): the buffer is only
+    ever `+=`-ed, measured with len() and encoded once at output. The whole
+    document still stays in memory until then, so memory grows linearly
+    with the report size; that is an accepted limit of the full report.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.length = 0
+
+    def __iadd__(self, text: str) -> "_Buffer":
+        self.parts.append(text)
+        self.length += len(text)
+        return self
+
+    def __len__(self) -> int:
+        return self.length
+
+    def encode(self, encoding: str) -> bytes:
+        return "".join(self.parts).encode(encoding)
+
+
+def _latin1(values: pd.Series) -> np.ndarray:
+    # The built-in PDF fonts are latin-1 only: anything else (emoji, CJK) becomes "?"
+    text = values.astype(object).where(values.notna(), "").astype(str)
+    return text.str.encode('latin-1', 'replace').str.decode('latin-1').to_numpy()
+
+
 class PDFReport(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if getattr(fpdf, "FPDF_VERSION", None) in BUFFER_PATCH_VERSIONS:
+            self.buffer = _Buffer()
+
     def header(self):
         self.set_font('Arial', 'B', 15)
         self.set_text_color(33, 37, 41) # Dark gray
@@ -17,6 +71,13 @@ class PDFReport(FPDF):
 class Reporter:
     @staticmethod
     def generate_pdf(df: pd.DataFrame, summary_stats: dict) -> bytes:
+        with METRICS.stage("export_pdf") as stage:
+            stage.rows = len(df)
+            return Reporter._build_pdf(df, summary_stats).output(dest='S').encode('latin-1')
+
+    @staticmethod
+    def _build_pdf(df: pd.DataFrame, summary_stats: dict) -> PDFReport:
+        """Summary page shared by both reports: executive summary and the top-10 table."""
         pdf = PDFReport()
         pdf.add_page()
         pdf.set_auto_page_break(auto=True, margin=15)
@@ -52,23 +113,100 @@ class Reporter:
         pdf.cell(30, 10, "Urgency", 1, 0, 'C', 1)
         pdf.cell(30, 10, "Score", 1, 1, 'C', 1)
         
-        # Rows (Top 10)
+        # Rows (Top 10): partial selection, no full sort
         pdf.set_font('Arial', '', 9)
-        top_df = df.sort_values(by='sentiment_score', ascending=False).head(10)
+        top_df = df.nlargest(10, 'sentiment_score')
+        
+        for pain, cat, urgency, score in zip(_latin1(top_df['pain_point']), _latin1(top_df['category']),
+                                             _latin1(top_df['urgency']), top_df['sentiment_score']):
+            pdf.cell(90, 8, pain[:50] + "...", 1)
+            pdf.cell(40, 8, cat[:20], 1)
+            pdf.cell(30, 8, urgency or '-', 1, 0, 'C')
+            pdf.cell(30, 8, str(score), 1, 1, 'C')
         
-        for _, row in top_df.iterrows():
-            pain = str(row.get('pain_point', 'N/A'))[:50] + "..."
-            cat = str(row.get('category', 'N/A'))[:20]
-            urgency = str(row.get('urgency', '-'))
-            score = str(row.get('sentiment_score', 0))
+        pdf.ln(10)
+        return pdf
+
+    @staticmethod
+    def generate_full_report(df: pd.DataFrame, summary_stats: dict, path: Optional[str] = None) -> Union[bytes, str]:
+        """
+        Complete ranked opportunity list: the executive summary and top-10
+        table, then one section per category (largest first) listing every
+        pain point by frustration score, then engagement. Sections are laid
+        out one category slice at a time and rows are drawn from column
+        arrays, so generation time is linear in the row count. Memory is
+        linear too: fpdf 1.7 keeps every page in memory until the file is
+        written. Writes to `path` and returns it when given, otherwise
+        returns the PDF bytes.
+        """
+        with METRICS.stage("export_pdf_full") as stage:
+            stage.rows = len(df)
+            pdf = Reporter._build_pdf(df, summary_stats)
+            pdf.set_font('Arial', 'B', 14)
+            pdf.set_text_color(41, 98, 255)
+            pdf.cell(0, 10, "Opportunities by Category", 0, 1)
+            pdf.set_text_color(0)
+            
+            categories = df['category'].astype(object).fillna("Other")
+            for category, positions in sorted(categories.groupby(categories, sort=False).indices.items(),
+                                              key=lambda item: -len(item[1])):
+                Reporter._render_category(pdf, str(category), df.iloc[positions])
             
-            pdf.cell(90, 8, pain, 1)
-            pdf.cell(40, 8, cat, 1)
-            pdf.cell(30, 8, urgency, 1, 0, 'C')
-            pdf.cell(30, 8, score, 1, 1, 'C')
+            if path:
+                pdf.output(path, 'F')
+                return path
+            return pdf.output(dest='S').encode('latin-1')
+
+    @staticmethod
+    def _full_report_header(pdf: FPDF):
+        pdf.set_font('Arial', 'B', 9)
+        pdf.set_fill_color(240, 240, 240)
+        for title, width, align in FULL_REPORT_COLUMNS:
+            pdf.cell(width, 7, title, 1, 0, align, 1)
+        pdf.ln()
+        pdf.set_font('Arial', '', 8)
+
+    @staticmethod
+    def _render_category(pdf: FPDF, category: str, rows: pd.DataFrame):
+        # Highest frustration first, engagement breaks ties
+        sentiment = pd.to_numeric(rows['sentiment_score'], errors='coerce').fillna(0).to_numpy()
+        engagement = pd.to_numeric(rows['score'], errors='coerce').fillna(0).to_numpy()
+        order = np.lexsort((-engagement, -sentiment))
+        
+        pains = _latin1(rows['pain_point'])[order]
+        urgencies = _latin1(rows['urgency'])[order]
+        sources = _latin1(rows['sub_source'])[order] if 'sub_source' in rows else np.full(len(rows), "")
+        comments = pd.to_numeric(rows['comments'], errors='coerce').fillna(0).astype(int).to_numpy()[order]
+        sentiment = sentiment[order].astype(int)
+        high = int((urgencies == "High").sum())
+        
+        pdf.add_page()
+        pdf.set_font('Arial', 'B', 13)
+        pdf.cell(0, 9, f"{category[:60].encode('latin-1', 'replace').decode('latin-1')} ({len(rows):,} opportunities, {high:,} high urgency)", 0, 1)
+        Reporter._full_report_header(pdf)
+        
+        (_, rank_w, _), (_, pain_w, _), (_, urgency_w, _), (_, score_w, _), (_, comments_w, _), (_, source_w, _) = FULL_REPORT_COLUMNS
+        line_h = FULL_REPORT_LINE_HEIGHT
+        for rank in range(len(rows)):
+            lines = pdf.multi_cell(pain_w, line_h, pains[rank] or "-", split_only=True) or [""]
+            height = line_h * len(lines)
+            if pdf.get_y() + height > pdf.page_break_trigger:
+                pdf.add_page()
+                Reporter._full_report_header(pdf)
             
-        return pdf.output(dest='S').encode('latin-1')
+            x, y = pdf.get_x(), pdf.get_y()
+            pdf.cell(rank_w, height, str(rank + 1), 1, 0, 'C')
+            pdf.rect(x + rank_w, y, pain_w, height)
+            for line in lines:
+                pdf.cell(pain_w, line_h, line, 0, 2)
+            pdf.set_xy(x + rank_w + pain_w, y)
+            pdf.cell(urgency_w, height, urgencies[rank] or '-', 1, 0, 'C')
+            pdf.cell(score_w, height, str(sentiment[rank]), 1, 0, 'C')
+            pdf.cell(comments_w, height, f"{comments[rank]:,}", 1, 0, 'C')
+            pdf.cell(source_w, height, sources[rank][:12], 1, 1, 'C')
 
     @staticmethod
     def get_csv_download_link(df: pd.DataFrame):
-        return df.to_csv(index=False).encode('utf-8')
+        # Chunked straight to UTF-8 bytes: no full-size intermediate str
+        from painscout.exports import export_bytes
+        return export_bytes(df, "csv")
@@ -0,0 +1,96 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Urgency levels in increasing order, so sorts and comparisons are meaningful
+URGENCY_LEVELS = ["Low", "Medium", "High"]
+
+try:
+    # Arrow-backed strings with NaN as the missing value (the pandas 3 default "str")
+    TEXT = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    TEXT = pd.StringDtype("pyarrow")
+URGENCY = pd.CategoricalDtype(URGENCY_LEVELS, ordered=True)
+
+# Column -> target dtype. "category" means an open-ended categorical
+# (categories are taken from the data).
+SCHEMA: Dict[str, object] = {
+    # Scraped records
+    "source": "category",
+    "sub_source": "category",
+    "id": TEXT,
+    "title": TEXT,
+    "text": TEXT,
+    "url": TEXT,
+    "author": TEXT,
+    "score": np.int32,
+    "comments": np.int32,
+    "created_at": "datetime64[ns]",
+    # Pre-LLM stages
+    "relevance": np.float32,
+    "duplicates": np.int32,
+    "dup_group": np.int32,
+    "theme": np.int32,
+    "theme_label": "category",
+    "theme_posts": np.int32,
+    # LLM analysis
+    "pain_point": TEXT,
+    "target_audience": TEXT,
+    "category": "category",
+    "urgency": URGENCY,
+    "sentiment_score": np.int8,
+}
+
+
+def _convert(column: pd.Series, dtype) -> pd.Series:
+    if dtype == "datetime64[ns]":
+        # Reddit stores naive UTC, X adds an offset: normalize both to naive UTC
+        parsed = pd.to_datetime(column, utc=True, errors="coerce", format="ISO8601")
+        return parsed.dt.tz_localize(None).astype("datetime64[ns]")
+    if isinstance(dtype, pd.CategoricalDtype):
+        # LLM labels vary in case/whitespace; anything unknown becomes missing
+        labels = column.astype(object).where(column.notna(), "").astype(str).str.strip().str.title()
+        return labels.where(labels.isin(dtype.categories)).astype(dtype)
+    if dtype == "category":
+        return column.astype("category")
+    if dtype is TEXT:
+        return column.astype(TEXT)
+    # Numeric: missing values become 0, out-of-range values are clipped
+    info = np.iinfo(dtype) if np.issubdtype(dtype, np.integer) else np.finfo(dtype)
+    numeric = pd.to_numeric(column, errors="coerce").fillna(0)
+    return numeric.clip(info.min, info.max).astype(dtype)
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Casts the known columns of scraped/analyzed records to compact dtypes:
+    categoricals for low-cardinality labels, small ints for scores, datetime64
+    timestamps and Arrow-backed strings for text. Unknown columns are kept
+    as they are; columns already in their target dtype are not copied.
+    """
+    converted = {}
+    for column, dtype in SCHEMA.items():
+        if column not in df:
+            continue
+        current = df[column].dtype
+        # CategoricalDtype == "category" is True for any categorical, so test the string itself
+        if isinstance(dtype, str) and dtype == "category":
+            if isinstance(current, pd.CategoricalDtype):
+                continue
+        elif current == dtype:
+            continue
+        converted[column] = _convert(df[column], dtype)
+    return df.assign(**converted) if converted else df
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Deep memory use per column (bytes and MB) with a TOTAL row."""
+    usage = df.memory_usage(deep=True, index=True)
+    report = pd.DataFrame({
+        "dtype": [str(df.index.dtype)] + [str(df[c].dtype) for c in df.columns],
+        "bytes": usage.to_numpy(),
+    }, index=["Index"] + list(df.columns))
+    report.loc["TOTAL"] = ["", int(usage.sum())]
+    report["mb"] = (report["bytes"].astype(float) / 2 ** 20).round(2)
+    return report
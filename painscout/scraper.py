@@ -1,32 +1,62 @@
-import requests
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Dict
-import streamlit as st
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Dict, Iterator, Tuple, Callable
 import random
-import time
 import os
-import tweepy
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from painscout.config import Config
+from painscout.transport import HttpTransport, rewrite_base_url
+from painscout.store import PostStore
+from painscout.metrics import METRICS
+from painscout.profiling import profiled
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 load_dotenv()
 
+X_DEFAULT_BASE_URL = "https://api.twitter.com"
+
 class RedditScraper:
-    def __init__(self):
+    def __init__(self, transport: HttpTransport = None, store: PostStore = None):
         # Pushshift doesn't require auth, but let's be ready to fallback if it fails
         self.mock_mode = False 
-        self.base_url = "https://api.pushshift.io/reddit/search/submission/"
+        self.base_url = Config.PUSHSHIFT_BASE_URL
+        # Shared keep-alive session + rate limiter across all subreddit workers
+        self.transport = transport or HttpTransport()
+
+        # Local post store: later scans only fetch posts newer than the watermark
+        self.store = store
+        if self.store is None and Config.POST_STORE_ENABLED:
+            try:
+                self.store = PostStore()
+            except Exception as e:
+                print(f"Post store unavailable: {e}")
         
-        # Setup Twitter Client
-        self.twitter_client = None
-        bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
-        if bearer_token:
+        # Twitter Client is created on first X scan (tweepy is only imported then)
+        self._twitter_client = None
+        self._bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
+        if not self._bearer_token:
+             print("No Twitter Bearer Token found.")
+
+    @property
+    def twitter_client(self):
+        if self._twitter_client is None and self._bearer_token:
             try:
-                self.twitter_client = tweepy.Client(bearer_token=bearer_token)
+                import tweepy
+                self._twitter_client = tweepy.Client(bearer_token=self._bearer_token)
+                # tweepy hard-codes its host; reroute it when another endpoint is configured
+                if Config.X_API_BASE_URL.rstrip("/") != X_DEFAULT_BASE_URL:
+                    rewrite_base_url(self._twitter_client.session, X_DEFAULT_BASE_URL, Config.X_API_BASE_URL)
             except Exception as e:
                 print(f"Twitter Auth Error: {e}")
-        else:
-             print("No Twitter Bearer Token found.")
+                self._bearer_token = None
+        return self._twitter_client
+
+    @twitter_client.setter
+    def twitter_client(self, client):
+        self._twitter_client = client
 
     def _get_beautiful_demo_data(self, source="Reddit") -> List[Dict]:
         """Returns the high-quality demo data requested."""
@@ -64,73 +94,214 @@ class RedditScraper:
             })
         return results
 
-    def scan_x_posts(self, keywords: List[str], days: int = 7) -> List[Dict]:
+    INTENT_WORDS = ["need", "wish", "hate", "sucks", "problem"]
+
+    def _plan_x_queries(self, keywords: List[str], max_length: int = None) -> List[str]:
+        """
+        Splits topics into sub-queries that each fit the X query-length limit.
+        Every sub-query keeps the shape: (topic OR topic ...) (intent OR ...) -is:retweet lang:en
+        """
+        max_length = max_length or Config.X_QUERY_MAX_LENGTH
+        # Group 2: (intent1 OR intent2)
+        intent_group = " OR ".join(self.INTENT_WORDS)
+        suffix = f" ({intent_group}) -is:retweet lang:en"
+
+        queries = []
+        group = []
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if not keyword:
+                continue
+            if len(f"({keyword}){suffix}") > max_length:
+                print(f"Skipping X topic longer than the query limit: {keyword[:40]}...")
+                continue
+            # Group 1: (keyword1 OR keyword2)
+            candidate = group + [keyword]
+            if group and len(f"({' OR '.join(candidate)}){suffix}") > max_length:
+                queries.append(f"({' OR '.join(group)}){suffix}")
+                candidate = [keyword]
+            group = candidate
+        if group:
+            queries.append(f"({' OR '.join(group)}){suffix}")
+        return queries
+
+    def _tweet_record(self, tweet) -> Dict:
+        metrics = tweet.public_metrics
+        score = metrics.get('retweet_count', 0) + metrics.get('like_count', 0)
+
+        return {
+            "source": "Twitter",
+            "sub_source": "X Search",
+            "id": str(tweet.id),
+            "title": tweet.text[:100] + "...", # Use truncated text as title
+            "text": tweet.text,
+            "url": f"https://twitter.com/user/status/{tweet.id}",
+            "score": score,
+            "comments": metrics.get('reply_count', 0),
+            "created_at": tweet.created_at.isoformat(),
+            "author": str(tweet.author_id)
+        }
+
+    def _search_x_query(self, query: str, start_time: datetime, budget: int) -> Tuple[List[Dict], bool]:
+        """
+        Follows `next_token` pagination for one sub-query until `budget` tweets.
+        Returns (tweets, completed); completed is False if an API error or the
+        budget cut it short.
+        """
+        results = []
+        next_token = None
+
+        try:
+            while True:
+                METRICS.inc("x_requests_total")
+                with METRICS.timer("x_request_seconds"):
+                    tweets = self.twitter_client.search_recent_tweets(
+                        query=query,
+                        max_results=max(10, min(100, budget - len(results))), # 10-100 allowed
+                        tweet_fields=['created_at', 'public_metrics', 'author_id', 'text'],
+                        start_time=start_time,
+                        next_token=next_token
+                    )
+
+                for tweet in tweets.data or []:
+                    results.append(self._tweet_record(tweet))
+
+                next_token = (tweets.meta or {}).get('next_token')
+                if not next_token or len(results) >= budget:
+                    break
+
+        except Exception as e:
+            print(f"Twitter API Error: {e}")
+            METRICS.inc("x_errors_total", reason=type(e).__name__)
+            return results[:budget], False
+
+        # Older tweets left behind at the budget were never fetched
+        return results[:budget], not next_token and len(results) <= budget
+
+    def _search_x(self, keywords: List[str], start_time: datetime, max_tweets: int = None) -> Tuple[List[Dict], bool]:
+        """Runs every planned sub-query concurrently; returns (unique tweets, all completed)."""
+        queries = self._plan_x_queries(keywords)
+        if not queries:
+            return [], False
+
+        budget = max_tweets or Config.X_MAX_TWEETS_PER_QUERY
+        workers = max(1, min(Config.X_QUERY_CONCURRENCY, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = list(executor.map(profiled(lambda q: self._search_x_query(q, start_time, budget)), queries))
+
+        # The same tweet can match several sub-queries
+        unique = {}
+        for page, _ in pages:
+            for record in page:
+                unique.setdefault(record["id"], record)
+        return list(unique.values()), all(completed for _, completed in pages)
+
+    def scan_x_posts(self, keywords: List[str], days: int = 7, max_tweets: int = None) -> List[Dict]:
         """
         Scans X (Twitter) using tweepy.Client.search_recent_tweets
+        Topics are split into length-safe sub-queries that run concurrently, each
+        paginated up to `max_tweets` (Config.X_MAX_TWEETS_PER_QUERY). Results are
+        de-duplicated by tweet id in sub-query order.
         """
         if not self.twitter_client:
             return self._get_beautiful_demo_data(source="Twitter")
 
-        results = []
-        # Build a robust query
-        # keywords list example: ["saas", "marketing", "startup"]
-        # We want to combine these with intent words
-        intent_words = ["need", "wish", "hate", "sucks", "problem"]
-        
-        # Group 1: (keyword1 OR keyword2)
-        keywords_group = " OR ".join(keywords)
-        # Group 2: (intent1 OR intent2)
-        intent_group = " OR ".join(intent_words)
-        
-        query = f"({keywords_group}) ({intent_group}) -is:retweet lang:en"
-        
         # Calculate time window
         # Note: Standard API only allows last 7 days
         start_time = datetime.utcnow() - timedelta(days=min(days, 7))
-        
-        try:
-            tweets = self.twitter_client.search_recent_tweets(
-                query=query,
-                max_results=100, # 10-100 allowed
-                tweet_fields=['created_at', 'public_metrics', 'author_id', 'text'],
-                start_time=start_time
-            )
-            
-            if tweets.data:
-                for tweet in tweets.data:
-                    metrics = tweet.public_metrics
-                    score = metrics.get('retweet_count', 0) + metrics.get('like_count', 0)
-                    
-                    results.append({
-                        "source": "Twitter",
-                        "sub_source": "X Search",
-                        "id": str(tweet.id),
-                        "title": tweet.text[:100] + "...", # Use truncated text as title
-                        "text": tweet.text,
-                        "url": f"https://twitter.com/user/status/{tweet.id}",
-                        "score": score,
-                        "comments": metrics.get('reply_count', 0),
-                        "created_at": tweet.created_at.isoformat(),
-                        "author": str(tweet.author_id)
-                    })
-            else:
-                 # No tweets found
-                 pass
-                 
-        except Exception as e:
-            print(f"Twitter API Error: {e}")
-            return self._get_beautiful_demo_data(source="Twitter")
+
+        if self.store:
+            window_start = start_time.replace(tzinfo=timezone.utc).timestamp()
+            def walk_since(after: float) -> Iterator[List[Dict]]:
+                # X rejects a start_time within ~10s of now
+                tweets, completed = self._search_x(keywords, min(datetime.utcfromtimestamp(after), datetime.utcnow() - timedelta(seconds=30)), max_tweets)
+                yield tweets
+                return completed
+
+            pages = self._iter_incremental("Twitter", "X Search", keywords, window_start, walk_since)
+            results = [record for page in pages for record in page]
+        else:
+            results, _ = self._search_x(keywords, start_time, max_tweets)
             
         if not results:
              return self._get_beautiful_demo_data(source="Twitter")
              
         return results
 
+    def _iter_incremental(self, source: str, community: str, terms: List[str], window_start: float, walk_since: Callable[[float], Iterator[List[Dict]]]) -> Iterator[List[Dict]]:
+        """
+        Fetches only what the post store doesn't already cover: yields each
+        fetched page as soon as it is stored, then the window's stored posts
+        that were not fetched again.
+        `walk_since(after)` must be a generator of record pages covering every
+        post newer than `after`, newest first, that returns `completed`: False
+        when an error or a post budget cut the walk short. The watermark and
+        covered range only move after a complete walk, so anything left
+        unfetched (including a walk the consumer stops early) is retried from
+        the same point next time.
+        """
+        query_key = PostStore.query_key(terms)
+        watermark = self.store.get_watermark(source, community, query_key)
+        covered = watermark is not None and watermark[1] <= window_start
+        # Never fully walked, or the requested window reaches past what's stored
+        after = max(watermark[0], window_start) if covered else window_start
+
+        walk = walk_since(after)
+        fetched_ids = set()
+        newest = None
+        while True:
+            try:
+                page = next(walk)
+            except StopIteration as stop:
+                completed = bool(stop.value)
+                break
+            page_newest = self.store.upsert(source, community, query_key, page)
+            if page_newest is not None:
+                newest = max(newest or page_newest, page_newest)
+            fetched_ids.update(str(record["id"]) for record in page)
+            METRICS.inc("post_store_fetched_total", len(page), source=source)
+            yield page
+
+        if completed:
+            self.store.set_watermark(source, community, query_key, newest or after, window_start)
+
+        reused = [
+            record for record in self.store.load(source, community, query_key, since=window_start)
+            if str(record["id"]) not in fetched_ids
+        ]
+        METRICS.inc("post_store_reused_total", len(reused), source=source)
+        if reused:
+            yield reused
 
-    def scan_subreddit(self, subreddit_name: str, query_terms: List[str], limit: int = 50, days: int = 30) -> List[Dict]:
+    def _reddit_record(self, post: Dict, subreddit_name: str) -> Dict:
+        created_at_ts = post.get('created_utc', 0)
+        submission_date = datetime.utcfromtimestamp(created_at_ts)
+
+        return {
+            "source": "Reddit",
+            "sub_source": f"r/{subreddit_name}",
+            "id": post.get('id', ''),
+            "title": post.get('title', ''),
+            "text": post.get('selftext', '') or post.get('body', ''),
+            "url": post.get('full_link') or post.get('url', ''),
+            "score": post.get('score', 0),
+            "comments": post.get('num_comments', 0),
+            "created_at": submission_date.isoformat(),
+            "author": post.get('author', '[deleted]')
+        }
+
+    def scan_subreddit(self, subreddit_name: str, query_terms: List[str], limit: int = 50, days: int = 30, deep: bool = False, max_posts: int = None) -> List[Dict]:
+        """
+        Default mode: a single request for the top `limit` posts by score.
+        Deep mode: walks the whole `days` window newest-first via iter_subreddit,
+        up to `max_posts` (defaults to Config.DEEP_SCAN_MAX_POSTS).
+        """
         if self.mock_mode:
             return []
 
+        if deep:
+            return list(self.iter_subreddit(subreddit_name, query_terms, days=days, max_posts=max_posts))
+
         results = []
         # Calculate timestamp for "after" parameter
         after_timestamp = int((datetime.utcnow() - timedelta(days=days)).timestamp())
@@ -148,72 +319,253 @@ class RedditScraper:
         }
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.transport.get(self.base_url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json().get('data', [])
                 
                 for post in data:
-                    created_at_ts = post.get('created_utc', 0)
-                    submission_date = datetime.utcfromtimestamp(created_at_ts)
-                    
-                    results.append({
-                        "source": "Reddit",
-                        "sub_source": f"r/{subreddit_name}",
-                        "id": post.get('id', ''),
-                        "title": post.get('title', ''),
-                        "text": post.get('selftext', '') or post.get('body', ''),
-                        "url": post.get('full_link') or post.get('url', ''),
-                        "score": post.get('score', 0),
-                        "comments": post.get('num_comments', 0),
-                        "created_at": submission_date.isoformat(),
-                        "author": post.get('author', '[deleted]')
-                    })
+                    results.append(self._reddit_record(post, subreddit_name))
             else:
-                if response.status_code == 429:
-                    time.sleep(2) 
+                print(f"Pushshift returned {response.status_code} for r/{subreddit_name} after retries")
                 
         except Exception as e:
             print(f"Error scanning r/{subreddit_name} with Pushshift: {e}")
             
         return results
 
-    def run_scan(self, subreddits: List[str], keywords: List[str], days: int = 30, source: str = "Reddit") -> pd.DataFrame:
+    def _scan_subreddit_stored(self, subreddit_name: str, query_terms: List[str], limit: int = 50, days: int = 30, deep: bool = False, max_posts: int = None) -> List[Dict]:
+        """List form of _iter_subreddit_stored: the same posts scan_subreddit returns."""
+        pages = self._iter_subreddit_stored(subreddit_name, query_terms, limit=limit, days=days, deep=deep, max_posts=max_posts)
+        return [record for page in pages for record in page]
+
+    def _iter_subreddit_stored(self, subreddit_name: str, query_terms: List[str], limit: int = 50, days: int = 30, deep: bool = False, max_posts: int = None) -> Iterator[List[Dict]]:
         """
-        Main execution method.
+        scan_subreddit backed by the post store, page by page.
+        Deep scans walk only the posts past the watermark (the whole window
+        the first time) and fill up with stored posts, newest `max_posts` in
+        all. Default scans stay the regular top-`limit`-by-score request:
+        scores and comment counts keep changing after a post is stored, so
+        only the API can rank them. Their results refresh the stored copies.
+        """
+        if self.mock_mode:
+            return
+        community = f"r/{subreddit_name}"
+        if not deep:
+            results = self.scan_subreddit(subreddit_name, query_terms, limit=limit, days=days)
+            self.store.upsert("Reddit", community, PostStore.query_key(query_terms), results)
+            yield results
+            return
+
+        window_start = (datetime.utcnow() - timedelta(days=days)).replace(tzinfo=timezone.utc).timestamp()
+        max_posts = max_posts or Config.DEEP_SCAN_MAX_POSTS
+
+        def walk_since(after: float) -> Iterator[List[Dict]]:
+            # Every post newer than `after`, newest-first
+            fetched = 0
+            try:
+                for page in self.iter_subreddit_pages(subreddit_name, query_terms, max_posts=max_posts, after=after, raise_errors=True):
+                    fetched += len(page)
+                    yield page
+            except Exception as e:
+                print(f"Error scanning r/{subreddit_name} with Pushshift: {e}")
+                return False
+            # Stopping at the post budget leaves older posts past `after` unfetched
+            return fetched < max_posts
+
+        remaining = max_posts
+        for page in self._iter_incremental("Reddit", community, query_terms, window_start, walk_since):
+            page = page[:remaining]
+            remaining -= len(page)
+            if page:
+                yield page
+            if remaining <= 0:
+                return
+
+    def _fetch_page(self, params: Dict) -> List[Dict]:
+        response = self.transport.get(self.base_url, params=params, timeout=10)
+        if response.status_code != 200:
+            raise RuntimeError(f"Pushshift returned {response.status_code}")
+        return response.json().get('data', [])
+
+    def iter_subreddit(self, subreddit_name: str, query_terms: List[str], days: int = 30, max_posts: int = None, page_size: int = None, after: int = None, raise_errors: bool = False) -> Iterator[Dict]:
+        """Record-by-record form of iter_subreddit_pages."""
+        for page in self.iter_subreddit_pages(subreddit_name, query_terms, days=days, max_posts=max_posts, page_size=page_size, after=after, raise_errors=raise_errors):
+            yield from page
+
+    def iter_subreddit_pages(self, subreddit_name: str, query_terms: List[str], days: int = 30, max_posts: int = None, page_size: int = None, after: int = None, raise_errors: bool = False) -> Iterator[List[Dict]]:
+        """
+        Deep scan: pages backwards through `created_utc` using a `before` cursor
+        until the window is covered or `max_posts` records have been yielded.
+        Each page of records is yielded while the next one is prefetched in
+        the background, so consumers can start on page one immediately and
+        memory stays at roughly two pages.
+        `after` (epoch seconds) overrides the `days` window start; `raise_errors`
+        propagates fetch errors instead of ending the scan quietly.
+        """
+        if self.mock_mode:
+            return
+
+        max_posts = max_posts or Config.DEEP_SCAN_MAX_POSTS
+        page_size = page_size or Config.DEEP_SCAN_PAGE_SIZE
+        if after is not None:
+            after_timestamp = int(after)
+        else:
+            after_timestamp = int((datetime.utcnow() - timedelta(days=days)).timestamp())
+
+        base_params = {
+            'subreddit': subreddit_name,
+            'q': "|".join(query_terms),
+            'after': after_timestamp,
+            'sort': 'desc',
+            'sort_type': 'created_utc'
+        }
+
+        def page_params(before, size):
+            params = dict(base_params, size=size)
+            if before is not None:
+                params['before'] = before
+            return params
+
+        yielded = 0
+        # Ids seen at the current cursor second; `before` is inclusive of it
+        # so posts sharing that timestamp are not skipped between pages.
+        boundary_ids = set()
+
+        fetch_page = profiled(self._fetch_page)
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            requested = min(page_size, max_posts)
+            pending = prefetcher.submit(fetch_page, page_params(None, requested))
+            while pending is not None:
+                try:
+                    data = pending.result()
+                except Exception as e:
+                    if raise_errors:
+                        raise
+                    print(f"Error deep-scanning r/{subreddit_name} with Pushshift: {e}")
+                    return
+                pending = None
+
+                fresh = [post for post in data if post.get('id') not in boundary_ids]
+                if not fresh:
+                    return
+
+                oldest = min(post.get('created_utc', 0) for post in fresh)
+                remaining = max_posts - yielded - len(fresh)
+                window_covered = len(data) < requested or oldest <= after_timestamp
+                if remaining > 0 and not window_covered:
+                    boundary_ids = {post.get('id') for post in data if post.get('created_utc', 0) == oldest}
+                    requested = min(page_size, remaining + len(boundary_ids))
+                    pending = prefetcher.submit(fetch_page, page_params(oldest + 1, requested))
+
+                page = [self._reddit_record(post, subreddit_name) for post in fresh[:max_posts - yielded]]
+                yielded += len(page)
+                yield page
+
+    def iter_scan(self, subreddits: List[str], keywords: List[str], days: int = 30, source: str = "Reddit", max_workers: int = None, deep: bool = False, max_posts: int = None) -> Iterator[Tuple[int, str, List[Dict], bool]]:
+        """
+        Streaming form of run_scan: yields (position, label, records, last)
+        chunks in arrival order across subreddits. Default scans send one
+        chunk per subreddit; deep scans send each page as soon as it arrives,
+        and `last` flags a subreddit's final chunk. X scans yield a single
+        chunk. Makes no UI calls, so it can run on a worker thread.
         """
+        with METRICS.stage("scan") as stage:
+            for idx, label, records, last in self._iter_chunks(subreddits, keywords, days, source, max_workers, deep, max_posts):
+                stage.rows += len(records)
+                if last:
+                    METRICS.inc("scan_sources_total", source=source)
+                METRICS.inc("scan_posts_total", len(records), source=source)
+                yield idx, label, records, last
+
+    def _iter_source_pages(self, subreddit_name: str, keywords: List[str], days: int, deep: bool, max_posts: int) -> Iterator[List[Dict]]:
+        if self.store:
+            return self._iter_subreddit_stored(subreddit_name, keywords, days=days, deep=deep, max_posts=max_posts)
+        if deep:
+            return self.iter_subreddit_pages(subreddit_name, keywords, days=days, max_posts=max_posts)
+        return iter([self.scan_subreddit(subreddit_name, keywords, days=days)])
+
+    def _iter_chunks(self, subreddits: List[str], keywords: List[str], days: int, source: str, max_workers: int, deep: bool, max_posts: int) -> Iterator[Tuple[int, str, List[Dict], bool]]:
         if source == "X (Twitter)":
              # For X, 'subreddits' input is treated as domain keywords (e.g. saas, marketing)
              # 'keywords' input is treated as the pain triggers (e.g. hate, wish)
              # We merge them for the single query function for simplicity in this architecture
              # Actually, in scan_x_posts we logic: (keyword OR keyword) (intent OR intent)
              # So we pass subreddits list as the main topics
-             return pd.DataFrame(self.scan_x_posts(subreddits, days))
+             yield 0, "X Search", self.scan_x_posts(subreddits, days), True
+             return
+
+        workers = max(1, min(max_workers or Config.SCAN_CONCURRENCY, len(subreddits) or 1))
+        # (position, records, last, error) from every subreddit worker, in arrival order
+        arrivals: "queue.Queue" = queue.Queue()
+
+        def scan(idx: int, subreddit_name: str):
+            # Pages go out as they arrive; the latest is held back so the final one can be flagged
+            held = []
+            try:
+                with METRICS.timer("scan_source_seconds", source=source):
+                    for page in self._iter_source_pages(subreddit_name, keywords, days, deep, max_posts):
+                        if held:
+                            arrivals.put((idx, held, False, None))
+                        held = page
+            except Exception as e:
+                arrivals.put((idx, held, True, e))
+                return
+            arrivals.put((idx, held, True, None))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for idx, sub in enumerate(subreddits):
+                executor.submit(profiled(scan), idx, sub)
+            finished = 0
+            while finished < len(subreddits):
+                idx, records, last, error = arrivals.get()
+                if error is not None:
+                    raise error
+                finished += last
+                yield idx, f"r/{subreddits[idx]}", records, last
+
+    def run_scan(self, subreddits: List[str], keywords: List[str], days: int = 30, source: str = "Reddit", max_workers: int = None, deep: bool = False, max_posts: int = None, progress_callback: Callable[[int, int, str], None] = None) -> "pd.DataFrame":
+        """
+        Main execution method.
+        Reddit communities are fetched in parallel (at most `max_workers` at a time,
+        defaulting to Config.SCAN_CONCURRENCY). Progress is reported as each
+        subreddit finishes through `progress_callback(done, total, message)`;
+        results are merged in the order of `subreddits`.
+        `deep`/`max_posts` switch each subreddit to a paginated deep scan.
+        """
+        import pandas as pd
+        from painscout.schema import apply_schema
+
+        if source == "X (Twitter)":
+             return apply_schema(pd.DataFrame(self.scan_x_posts(subreddits, days)))
 
         # Default Reddit Logic
-        all_results = []
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        report = progress_callback or (lambda done, total, message: None)
         total_steps = len(subreddits)
         
         try:
-            for idx, sub in enumerate(subreddits):
-                status_text.text(f"Scanning r/{sub}...")
-                sub_results = self.scan_subreddit(sub, keywords, days=days)
-                all_results.extend(sub_results)
-                progress_bar.progress((idx + 1) / total_steps)
-                time.sleep(0.5) 
+            results_by_sub = {}
+            chunks = self.iter_scan(subreddits, keywords, days=days, source=source, max_workers=max_workers, deep=deep, max_posts=max_posts)
+            done = 0
+            for idx, label, records, last in chunks:
+                results_by_sub.setdefault(idx, []).extend(records)
+                if last:
+                    done += 1
+                    report(done, total_steps, f"Scanned {label} ({done}/{total_steps})")
+
+            # Stable merge: input order, not completion order
+            all_results = []
+            for idx in range(total_steps):
+                all_results.extend(results_by_sub.get(idx, []))
                 
-            status_text.text("Scan complete!")
-            progress_bar.empty()
+            report(total_steps, total_steps, "Scan complete!")
             
             if not all_results:
-                 return pd.DataFrame(self._get_beautiful_demo_data(source="Reddit"))
+                 return apply_schema(pd.DataFrame(self._get_beautiful_demo_data(source="Reddit")))
                  
-            return pd.DataFrame(all_results)
+            return apply_schema(pd.DataFrame(all_results))
 
         except Exception as e:
             print(f"Fatal Error during scan: {e} -> Falling back to DEMO DATA")
-            progress_bar.empty()
-            status_text.text("Network Issue. Displaying Cached Intelligence...")
-            return pd.DataFrame(self._get_beautiful_demo_data(source="Reddit"))
+            report(total_steps, total_steps, "Network Issue. Displaying Cached Intelligence...")
+            return apply_schema(pd.DataFrame(self._get_beautiful_demo_data(source="Reddit")))
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from painscout.config import Config
+
+
+def record_timestamp(record: Dict) -> float:
+    """UTC epoch seconds of a scraper record's naive-UTC `created_at` ISO string."""
+    created = datetime.fromisoformat(record["created_at"])
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return created.timestamp()
+
+
+class PostStore:
+    """
+    Local SQLite store of scraped posts, partitioned by (source, community, query).
+    Keeps a `created_utc` high-water mark per partition so later scans only
+    need to fetch posts newer than what is already stored, plus the oldest
+    timestamp the partition covers so a wider window triggers a full fetch.
+    """
+
+    def __init__(self, path: Optional[str] = None, retention_days: Optional[float] = None):
+        self.path = path or Config.POST_STORE_PATH
+        retention_days = retention_days if retention_days is not None else Config.POST_STORE_RETENTION_DAYS
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " source TEXT NOT NULL,"
+            " community TEXT NOT NULL,"
+            " query_key TEXT NOT NULL,"
+            " id TEXT NOT NULL,"
+            " created_utc REAL NOT NULL,"
+            " record TEXT NOT NULL,"
+            " PRIMARY KEY (source, community, query_key, id))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_created ON posts (source, community, query_key, created_utc)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " source TEXT NOT NULL,"
+            " community TEXT NOT NULL,"
+            " query_key TEXT NOT NULL,"
+            " created_utc REAL NOT NULL,"
+            " covered_from REAL NOT NULL,"
+            " PRIMARY KEY (source, community, query_key))"
+        )
+        self._conn.commit()
+        self.prune(time.time() - retention_days * 86400)
+
+    @staticmethod
+    def query_key(terms: List[str]) -> str:
+        """Stable key for a topic/trigger set, independent of order and case."""
+        normalized = sorted({t.strip().lower() for t in terms if t.strip()})
+        return hashlib.sha1("|".join(normalized).encode("utf-8")).hexdigest()[:16]
+
+    def get_watermark(self, source: str, community: str, query_key: str) -> Optional[Tuple[float, float]]:
+        """Returns (high-water created_utc, covered_from) or None if never fetched."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_utc, covered_from FROM watermarks WHERE source = ? AND community = ? AND query_key = ?",
+                (source, community, query_key),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set_watermark(self, source: str, community: str, query_key: str, created_utc: float, covered_from: float):
+        """Widens the covered range; never moves the watermark backwards."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO watermarks (source, community, query_key, created_utc, covered_from) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, community, query_key) DO UPDATE SET "
+                "created_utc = MAX(created_utc, excluded.created_utc), "
+                "covered_from = MIN(covered_from, excluded.covered_from)",
+                (source, community, query_key, created_utc, covered_from),
+            )
+            self._conn.commit()
+
+    def upsert(self, source: str, community: str, query_key: str, records: List[Dict]) -> Optional[float]:
+        """Stores records (newer copies replace older ones); returns the newest created_utc."""
+        rows = [
+            (source, community, query_key, str(r["id"]), record_timestamp(r), json.dumps(r))
+            for r in records
+        ]
+        if not rows:
+            return None
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO posts (source, community, query_key, id, created_utc, record) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return max(row[4] for row in rows)
+
+    def load(self, source: str, community: str, query_key: str, since: float) -> List[Dict]:
+        """All stored posts of one partition created after `since`, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record FROM posts WHERE source = ? AND community = ? AND query_key = ? AND created_utc > ? "
+                "ORDER BY created_utc DESC",
+                (source, community, query_key, since),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def prune(self, older_than: float):
+        with self._lock:
+            self._conn.execute("DELETE FROM posts WHERE created_utc < ?", (older_than,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
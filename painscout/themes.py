@@ -0,0 +1,198 @@
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from painscout.config import Config
+from painscout.dedup import ANALYSIS_COLUMNS, MAX_CHARS
+
+SEED = 1337
+LABEL_TERMS = 3           # top centroid terms used as a theme's label
+BATCH_SIZE = 4096         # mini-batch k-means batch size
+
+
+def theme_count(posts: int) -> int:
+    """Config.THEME_COUNT, or sqrt(posts / 2) capped at THEME_MAX_COUNT when it is 0."""
+    count = Config.THEME_COUNT or int(round(np.sqrt(posts / 2)))
+    return max(1, min(count, Config.THEME_MAX_COUNT, posts))
+
+
+def tfidf_matrix(texts: pd.Series, max_features: int = None):
+    """
+    Sparse TF-IDF of word unigrams and bigrams, built like scikit-learn's
+    TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True,
+    min_df=2, max_df=0.5, max_features=...) with L2-normalized rows, but
+    tokenized with Arrow compute kernels and counted with numpy instead of
+    per-post Python calls. Returns (CSR float32 matrix, feature names).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from scipy import sparse
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    max_features = max_features or Config.THEME_MAX_FEATURES
+    count = len(texts)
+    text = pc.utf8_lower(pa.array(texts.astype(object).to_numpy(), type=pa.large_string()))
+    text = pc.replace_substring_regex(text, r"https?://\S+|www\.\S+", " ")
+    text = pc.replace_substring_regex(text, r"[^a-z0-9]+", " ")
+    tokens = pc.utf8_split_whitespace(text)
+    docs = np.repeat(np.arange(count), pc.list_value_length(tokens).fill_null(0).to_numpy())
+    encoded = pc.dictionary_encode(pc.list_flatten(tokens))
+    vocabulary = np.array(encoded.dictionary.to_pylist(), dtype=object)
+    codes = encoded.indices.to_numpy().astype(np.int64)
+
+    # Stop words and 1-character tokens go before bigrams are formed (as in scikit-learn)
+    allowed = np.array([len(w) > 1 and w not in ENGLISH_STOP_WORDS for w in vocabulary], dtype=bool)
+    kept = allowed[codes]
+    codes, docs = codes[kept], docs[kept]
+
+    # Bigrams of consecutive kept tokens of the same post, numbered after the unigrams
+    words = len(vocabulary)
+    adjacent = np.flatnonzero(docs[1:] == docs[:-1])
+    bigram_keys = codes[adjacent] * words + codes[adjacent + 1]
+    bigram_codes, bigram_keys = pd.factorize(bigram_keys)
+    terms = np.concatenate([codes, words + bigram_codes])
+    term_docs = np.concatenate([docs, docs[adjacent]])
+
+    counts = sparse.csr_matrix(
+        (np.ones(len(terms), dtype=np.float32), (term_docs, terms)),
+        shape=(count, words + len(bigram_keys)),
+    )
+    counts.sum_duplicates()
+
+    # Document-frequency limits, then the most frequent remaining terms
+    min_df, max_df = (2, 0.5 * count) if count >= 20 else (1, count)
+    frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+    totals = np.bincount(counts.indices, weights=counts.data, minlength=counts.shape[1])
+    candidates = np.flatnonzero((frequency >= min_df) & (frequency <= max_df))
+    if not len(candidates):
+        raise ValueError("no terms left after document-frequency filtering")
+    if len(candidates) > max_features:
+        candidates = candidates[np.argpartition(-totals[candidates], max_features - 1)[:max_features]]
+    selected = np.sort(candidates)
+    matrix = counts[:, selected].tocsr()
+
+    idf = (np.log((1 + count) / (1 + frequency[selected])) + 1).astype(np.float32)
+    matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+    rows = np.repeat(np.arange(count), np.diff(matrix.indptr))
+    norms = np.sqrt(np.bincount(rows, weights=matrix.data.astype(np.float64) ** 2, minlength=count))
+    matrix.data /= np.maximum(norms, 1e-12)[rows].astype(np.float32)
+
+    bigrams = selected >= words
+    pairs = bigram_keys[selected[bigrams] - words]
+    names = np.empty(len(selected), dtype=object)
+    names[~bigrams] = vocabulary[selected[~bigrams]]
+    names[bigrams] = vocabulary[pairs // words] + " " + vocabulary[pairs % words]
+    return matrix, names
+
+
+def cluster_themes(df: pd.DataFrame, n_themes: int = None) -> Tuple[pd.Series, pd.Series, np.ndarray]:
+    """
+    Groups posts by topic: a sparse TF-IDF matrix over title + text (words and
+    bigrams, L2-normalized rows) clustered with mini-batch k-means.
+    Returns (theme id of every row, label of every row, the row position of
+    each theme's most central post, indexed by theme id).
+    """
+    if df.empty:
+        empty = pd.Series(dtype=np.int32, name="theme")
+        return empty, pd.Series(dtype=object, name="theme_label"), np.array([], dtype=np.int64)
+
+    # Leading MAX_CHARS of each post, as for duplicate detection
+    texts = (df['title'].fillna('').astype(str) + " " + df['text'].fillna('').astype(str)).str.slice(0, MAX_CHARS)
+    n_themes = min(n_themes or theme_count(len(df)), len(df))
+    try:
+        matrix, terms = tfidf_matrix(texts)
+    except ValueError:
+        # Nothing but stop words: a single catch-all theme
+        matrix, n_themes = None, 1
+
+    if matrix is None or n_themes == 1:
+        labels = np.zeros(len(df), dtype=np.int64)
+        names = np.array(["misc"], dtype=object)
+        distances = np.zeros(len(df))
+    else:
+        from sklearn.cluster import MiniBatchKMeans
+
+        kmeans = MiniBatchKMeans(n_clusters=n_themes, batch_size=BATCH_SIZE, random_state=SEED)
+        labels = kmeans.fit_predict(matrix)
+        # Cosine similarity of each post to its own centroid, one multiply per stored term
+        rows = np.repeat(np.arange(len(df)), np.diff(matrix.indptr))
+        closeness = np.bincount(rows, weights=matrix.data * kmeans.cluster_centers_[labels[rows], matrix.indices],
+                                minlength=len(df))
+        distances = -closeness
+        top_terms = np.argsort(-kmeans.cluster_centers_, axis=1)[:, :LABEL_TERMS]
+        names = np.array([", ".join(terms[top]) for top in top_terms], dtype=object)
+
+    # Empty clusters are possible with mini-batch updates: renumber the used ones 0..n-1
+    used, labels = np.unique(labels, return_inverse=True)
+    names = names[used]
+    representatives = pd.Series(distances).groupby(labels).idxmin().to_numpy()
+    return (
+        pd.Series(labels.astype(np.int32), index=df.index, name="theme"),
+        pd.Series(names[labels], index=df.index, name="theme_label"),
+        representatives,
+    )
+
+
+def assign_themes(df: pd.DataFrame, n_themes: int = None) -> pd.DataFrame:
+    """`df` with `theme` and `theme_label` columns."""
+    themes, labels, _ = cluster_themes(df, n_themes)
+    return df.assign(theme=themes, theme_label=labels)
+
+
+def theme_representatives(df: pd.DataFrame, n_themes: int = None) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    The most central post of every theme (with `theme`, `theme_label` and a
+    `theme_posts` count) and the theme id of every input row, for sending one
+    post per theme to the LLM.
+    """
+    themes, labels, representatives = cluster_themes(df, n_themes)
+    tagged = df.assign(theme=themes, theme_label=labels)
+    picked = tagged.iloc[np.sort(representatives)]
+    return picked.assign(theme_posts=picked['theme'].map(themes.value_counts()).to_numpy()), themes
+
+
+def expand_to_themes(analyzed: pd.DataFrame, df: pd.DataFrame, themes: pd.Series) -> pd.DataFrame:
+    """Copies each representative's analysis columns (and theme label) onto every post of its theme."""
+    columns = [c for c in ANALYSIS_COLUMNS + ['theme_label'] if c in analyzed]
+    by_theme = analyzed.set_index('theme')[columns]
+    expanded = by_theme.reindex(themes.values)
+    return df.assign(theme=themes.values, **{c: expanded[c].to_numpy() for c in columns})
+
+
+def summarize_themes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per theme, largest first: posts (collapsed duplicates included),
+    average frustration score, summed engagement (score + comments) and the
+    most engaged pain point as the theme's headline.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=['theme', 'label', 'posts', 'avg_sentiment', 'engagement', 'headline'])
+    if 'theme' not in df:
+        df = assign_themes(df)
+
+    posts = pd.to_numeric(df['duplicates'], errors='coerce').fillna(1) if 'duplicates' in df else pd.Series(1, index=df.index)
+    engagement = (pd.to_numeric(df['score'], errors='coerce').fillna(0)
+                  + pd.to_numeric(df['comments'], errors='coerce').fillna(0))
+    sentiment = pd.to_numeric(df['sentiment_score'], errors='coerce') if 'sentiment_score' in df else pd.Series(np.nan, index=df.index)
+    headline_source = df['pain_point'] if 'pain_point' in df else df['title']
+
+    frame = pd.DataFrame({
+        'theme': df['theme'].to_numpy(),
+        'label': df['theme_label'].astype(object).to_numpy(),
+        'posts': posts.to_numpy(),
+        'sentiment': sentiment.to_numpy(),
+        'engagement': engagement.to_numpy(),
+        'headline': headline_source.astype(object).to_numpy(),
+    })
+    grouped = frame.groupby('theme', sort=False)
+    summary = grouped.agg(
+        label=('label', 'first'),
+        posts=('posts', 'sum'),
+        avg_sentiment=('sentiment', 'mean'),
+        engagement=('engagement', 'sum'),
+    )
+    summary['headline'] = frame.loc[grouped['engagement'].idxmax(), 'headline'].to_numpy()
+    summary['posts'] = summary['posts'].astype(int)
+    summary['engagement'] = summary['engagement'].astype(int)
+    return summary.reset_index().sort_values(['posts', 'engagement'], ascending=False, ignore_index=True)
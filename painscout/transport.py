@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlsplit
+
+from painscout.config import Config
+from painscout.metrics import METRICS
+
+if TYPE_CHECKING:
+    import requests
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        """Blocks until `tokens` are available, then consumes them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stops handing out tokens for `seconds` (e.g. after a 429 Retry-After)."""
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            # Allow a single probe request as soon as the pause ends
+            self._tokens = 1.0
+            self._updated = self._blocked_until
+
+
+class HttpTransport:
+    """
+    Shared HTTP layer for the scrapers.
+    One pooled keep-alive session, a token bucket per host and retries with
+    jittered exponential backoff that honors Retry-After.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        host_rates: Optional[Dict[str, float]] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        pool_size: Optional[int] = None,
+    ):
+        self.rate = rate if rate is not None else Config.HTTP_RATE_LIMIT
+        self.burst = burst if burst is not None else Config.HTTP_BURST
+        self.host_rates = host_rates or {}
+        self.max_retries = max_retries if max_retries is not None else Config.HTTP_MAX_RETRIES
+        self.backoff_base = backoff_base if backoff_base is not None else Config.HTTP_BACKOFF_BASE
+        self.backoff_max = backoff_max if backoff_max is not None else Config.HTTP_BACKOFF_MAX
+
+        self.pool_size = pool_size or max(Config.SCAN_CONCURRENCY, 10)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """The pooled session, created (and `requests` imported) on first use."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"User-Agent": Config.REDDIT_USER_AGENT})
+                self._session = session
+            return self._session
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate = self.host_rates.get(host, self.rate)
+                bucket = TokenBucket(rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": uniform over [0, min(cap, base * 2^attempt)]
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(response: "requests.Response") -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, url: str, params: Optional[dict] = None, timeout: float = 10) -> "requests.Response":
+        """
+        GET with per-host rate limiting and retries.
+        Returns the last response (even a non-2xx one once retries run out);
+        raises the last network error if every attempt failed to connect.
+        """
+        import requests
+
+        host = urlsplit(url).netloc
+        bucket = self._bucket(host)
+
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            METRICS.inc("http_requests_total", host=host)
+            try:
+                with METRICS.timer("http_request_seconds", host=host):
+                    response = self.session.get(url, params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                METRICS.inc("http_errors_total", host=host, reason="network")
+                if attempt == self.max_retries:
+                    raise
+                METRICS.inc("http_retries_total", host=host)
+                time.sleep(self._backoff(attempt))
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                if response.status_code >= 400:
+                    METRICS.inc("http_errors_total", host=host, reason=str(response.status_code))
+                return response
+
+            METRICS.inc("http_retries_total", host=host)
+
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                # Small jitter so parallel workers don't wake up in lockstep
+                delay = min(self.backoff_max, retry_after) + random.uniform(0, self.backoff_base)
+            else:
+                delay = self._backoff(attempt)
+            if response.status_code == 429:
+                METRICS.inc("http_throttled_total", host=host)
+                # Throttle every worker hitting this host, not just this one;
+                # the next acquire() waits out the pause.
+                bucket.pause(delay)
+            else:
+                time.sleep(delay)
+
+        return response
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+def rewrite_base_url(session: "requests.Session", source: str, target: str):
+    """
+    Sends every request `session` makes under `source` to the same path under
+    `target` instead, for clients that hard-code their host (proxies, local stand-ins).
+    """
+    from requests.adapters import HTTPAdapter
+
+    source, target = source.rstrip("/"), target.rstrip("/")
+
+    class BaseUrlAdapter(HTTPAdapter):
+        def send(self, request, **kwargs):
+            request.url = target + request.url[len(source):]
+            return super().send(request, **kwargs)
+
+    session.mount(source, BaseUrlAdapter())
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit (additive increase, multiplicative decrease).
+    Each success grows the limit by ~1 per window of `limit` calls; a throttled
+    call (quota/429) cuts it by `decrease_factor`, at most once per `cooldown`
+    seconds so a burst of failures from one window counts as a single signal.
+    """
+
+    def __init__(self, initial: float, minimum: float = 1.0, maximum: float = 16.0,
+                 decrease_factor: float = 0.5, cooldown: float = 1.0):
+        self.minimum = max(1.0, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False):
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
@@ -0,0 +1,52 @@
+import json
+import re
+
+import pandas as pd
+
+from painscout.analyzer import PainAnalyzer
+from painscout.cache import AnalysisCache
+
+
+def make_analyzer(generate, tmp_path):
+    analyzer = PainAnalyzer(cache=AnalysisCache(path=str(tmp_path / "cache.sqlite")))
+    analyzer.mock_mode = False
+    analyzer._generate = generate
+    return analyzer
+
+
+def posts(count):
+    return pd.DataFrame({
+        "title": [f"Post number {i} about an invoicing tool that keeps failing" for i in range(count)],
+        "text": ["We lose hours every week"] * count,
+        "score": 1,
+        "comments": 1,
+    })
+
+
+def test_malformed_single_answer_only_loses_that_row(tmp_path):
+    def generate(prompt):
+        if "number 1 " in prompt:
+            return json.dumps([{"pain_point": "x"}])
+        return json.dumps({"pain_point": "invoicing", "frustration_score": 7, "category": "Pricing"})
+
+    analyzer = make_analyzer(generate, tmp_path)
+    analyzed = analyzer.analyze_batch(posts(3), batched=False)
+
+    assert analyzed['pain_point'].isna().tolist() == [False, True, False]
+    assert analyzed['sentiment_score'].tolist() == [7, 0, 7]
+
+
+def test_malformed_fallback_answer_is_not_cached(tmp_path):
+    def generate(prompt):
+        ids = re.findall(r"^\s*\[(p\d+)\]$", prompt, re.M)
+        if ids:
+            # The batch answer leaves out p3, which then falls back to a single call
+            return json.dumps([{"id": i, "pain_point": "invoicing", "frustration_score": 6} for i in ids if i != "p3"])
+        return json.dumps([{"pain_point": "x"}])
+
+    analyzer = make_analyzer(generate, tmp_path)
+    analyzed = analyzer.analyze_batch(posts(4), batched=True)
+
+    assert analyzed['pain_point'].notna().sum() == 3
+    contents = analyzer._build_contents(posts(4), max_chars=4000)
+    assert analyzer.cache.get(analyzer._cache_key(contents.iloc[3])) is None
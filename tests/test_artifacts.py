@@ -0,0 +1,44 @@
+import gc
+import threading
+
+import pandas as pd
+
+from painscout.artifacts import ArtifactCache
+
+
+def test_identical_results_share_artifacts():
+    cache = ArtifactCache(max_entries=2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return b"csv"
+
+    cache.get_or_compute(pd.DataFrame({"a": [1, 2]}), "csv", compute)
+    cache.get_or_compute(pd.DataFrame({"a": [1, 2]}), "csv", compute)
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_frame_collected_while_lock_is_held_does_not_deadlock():
+    cache = ArtifactCache()
+    df = pd.DataFrame({"a": [1]})
+    cache.fingerprint(df)
+    # A reference cycle: the frame is only freed by the cyclic GC, which may run at any allocation
+    cycle = [df]
+    cycle.append(cycle)
+    del df, cycle
+
+    def collect_under_lock():
+        with cache._lock:
+            gc.collect()
+
+    worker = threading.Thread(target=collect_under_lock, daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    live = pd.DataFrame({"b": [2]})
+    cache.fingerprint(live)
+    assert list(cache._fingerprints) == [id(live)]
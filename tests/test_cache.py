@@ -0,0 +1,57 @@
+import pytest
+
+from painscout import cache as cache_module
+from painscout.cache import AnalysisCache, content_key
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def test_key_ignores_case_and_whitespace_but_not_prompt_or_model():
+    key = content_key("Need a  CRM\n", "v1", "gemini")
+
+    assert key == content_key("need a crm", "v1", "gemini")
+    assert key != content_key("need a crm", "v2", "gemini")
+    assert key != content_key("need a crm", "v1", "other")
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = AnalysisCache(path=":memory:", ttl=60)
+    cache.put("a", {"pain_point": "x"})
+    cache.put("none", {})
+
+    clock.now += 59
+    assert cache.get("a") == {"pain_point": "x"}
+    assert cache.get("none") == {}
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = AnalysisCache(path=":memory:", ttl=3600, max_entries=2)
+    cache.EVICT_EVERY = 1
+    cache.put("a", {"n": 1})
+    clock.now += 1
+    cache.put("b", {"n": 2})
+    clock.now += 1
+    # Reading "a" makes "b" the least recently used
+    cache.get("a")
+    clock.now += 1
+    cache.put("c", {"n": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1} and cache.get("c") == {"n": 3}
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from painscout.dedup import DuplicateIndex, collapse_duplicates, group_near_duplicates, minhash_signatures, normalize_text
+
+BASE = "Looking for an alternative to Zapier that does not cost 800 dollars a month for ten thousand tasks"
+
+
+def posts(rows):
+    return pd.DataFrame([
+        {"id": post_id, "title": title, "text": "", "score": score, "comments": comments}
+        for post_id, title, score, comments in rows
+    ])
+
+
+def test_normalize_text_drops_urls_case_and_punctuation():
+    assert normalize_text("Need HELP!!  see https://x.io/a?b=1 now") == "need help see now"
+
+
+def test_lsh_groups_near_duplicates_only():
+    texts = [normalize_text(t) for t in [BASE, BASE + " (x-post)", "Invoicing for agencies is a nightmare every month"]]
+
+    labels = group_near_duplicates(minhash_signatures(texts))
+
+    assert labels[0] == labels[1] != labels[2]
+
+
+def test_union_find_joins_chains_transitively():
+    # 0~1 and 1~2 match, 0 and 2 do not: all three end up in group 0
+    signatures = np.zeros((4, 64), dtype=np.uint32)
+    signatures[1, :12] = 1
+    signatures[2, :24] = 1
+    signatures[3] = np.arange(64) + 100
+
+    labels = group_near_duplicates(signatures, threshold=0.8)
+
+    assert labels.tolist() == [0, 0, 0, 3]
+
+
+def test_group_representative_carries_summed_engagement():
+    df = posts([("a", BASE, 10, 1), ("b", BASE + "!", 90, 9), ("c", "Our CRM keeps losing contacts after every import", 5, 0)])
+
+    representatives, groups = collapse_duplicates(df)
+
+    assert groups.iloc[0] == groups.iloc[1] != groups.iloc[2]
+    top = representatives.set_index('id').loc["b"]
+    assert (top['score'], top['comments'], top['duplicates']) == (100, 10, 2)
+    assert representatives['id'].tolist() == ["b", "c"]
+
+
+def test_empty_posts_are_never_grouped():
+    representatives, _ = collapse_duplicates(posts([("a", "", 1, 0), ("b", "!!!", 1, 0)]))
+
+    assert len(representatives) == 2
+
+
+def test_index_folds_later_chunks_into_earlier_groups():
+    index = DuplicateIndex()
+    first = index.collapse(posts([("a", BASE, 10, 1)]))
+    later = index.collapse(posts([("b", BASE + " please", 30, 3), ("c", "Payroll exports break every quarter", 1, 0)]))
+
+    assert later['id'].tolist() == ["c"]
+    totals = index.apply_totals(first).iloc[0]
+    assert (totals['score'], totals['comments'], totals['duplicates']) == (40, 4, 2)
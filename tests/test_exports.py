@@ -0,0 +1,59 @@
+import gzip
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from painscout.exports import export, export_bytes, infer_format
+from painscout.schema import apply_schema
+
+
+@pytest.fixture
+def results():
+    return apply_schema(pd.DataFrame({
+        "source": ["Reddit", "X", "Reddit"],
+        "id": ["a", "b", "c"],
+        "title": ["CRM import fails", "Invoices, again", "Ünïcode \"quoted\"\nline"],
+        "score": [10, 0, 3],
+        "created_at": ["2026-01-01T10:00:00", "2026-01-02T11:30:00+00:00", "2026-01-03T00:00:00"],
+        "urgency": ["High", "low", None],
+        "sentiment_score": [8, 3, 0],
+    }))
+
+
+def test_jsonl_gz_round_trip_keeps_values_and_dtypes(results):
+    data = export_bytes(results, "jsonl.gz", chunk_rows=2)
+
+    lines = gzip.decompress(data).decode("utf-8").splitlines()
+    assert len(lines) == 3 and json.loads(lines[2])["title"] == results["title"].iloc[2]
+    restored = apply_schema(pd.read_json(io.BytesIO(data), lines=True, compression="gzip", dtype=False))
+    pd.testing.assert_frame_equal(restored, results)
+
+
+def test_parquet_keeps_dtypes(results):
+    restored = pd.read_parquet(io.BytesIO(export_bytes(results, "parquet")))
+
+    pd.testing.assert_frame_equal(restored, results)
+    assert restored["score"].dtype == np.int32 and isinstance(restored["urgency"].dtype, pd.CategoricalDtype)
+
+
+def test_chunked_csv_matches_one_shot(results):
+    chunked = export_bytes(results, "csv", chunk_rows=1)
+
+    assert chunked == export_bytes(results, "csv", chunk_rows=100)
+    assert b"2026-01-03 00:00:00" in chunked
+    assert export_bytes(results.iloc[:0], "csv") == b",".join(c.encode() for c in results.columns) + b"\n"
+
+
+def test_export_to_path_infers_format_and_counts_bytes(results, tmp_path):
+    path = tmp_path / "out" / "scan.jsonl"
+
+    stats = export(results, str(path))
+
+    assert stats["format"] == "jsonl" and stats["rows"] == 3
+    assert stats["bytes"] == path.stat().st_size
+    assert infer_format("scan.jsonl.gz") == "jsonl.gz" and infer_format("scan.txt") == "jsonl"
+    with pytest.raises(ValueError):
+        export(results, io.BytesIO(), "xml")
@@ -0,0 +1,63 @@
+import sqlite3
+import time
+
+import pandas as pd
+import pytest
+
+from painscout.history import ScanHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = ScanHistory(root=str(tmp_path), max_loaded=2, max_scans=3)
+    yield history
+    history.close()
+
+
+def results(n):
+    return pd.DataFrame({"id": [f"p{i}" for i in range(n)], "score": range(n)})
+
+
+def test_scans_are_only_visible_to_their_owner(history):
+    alice = history.save(results(3), owner="user:alice@example.com")
+    history.save(results(4), owner="session:b")
+
+    assert [meta["id"] for meta in history.list(owner="user:alice@example.com")] == [alice["id"]]
+    assert history.list() == []
+    assert history.load(alice["id"], owner="session:b") is None
+    history.delete(alice["id"], owner="session:b")
+    assert len(history.load(alice["id"], owner="user:alice@example.com")) == 3
+
+
+def test_same_results_saved_once_per_owner(history):
+    first = history.save(results(3), owner="a")
+
+    assert history.save(results(3), owner="a") == first
+    assert history.save(results(3), owner="b")["id"] != first["id"]
+
+
+def test_prune_keeps_other_owners_and_drops_ended_sessions(history):
+    for n in range(1, 6):
+        history.save(results(n), owner="a")
+    old = history.save(results(1), owner="session:gone")
+    history._conn.execute("UPDATE scans SET created_at = ? WHERE id = ?", (time.time() - 2 * history.session_ttl, old["id"]))
+    history.save(results(1), owner="b")
+
+    assert [meta["rows"] for meta in history.list(owner="a")] == [5, 4, 3]
+    assert history.list(owner="session:gone") == []
+    assert len(history.list(owner="b")) == 1
+
+
+def test_index_without_owners_becomes_the_shared_history(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "index.sqlite"))
+    conn.execute("CREATE TABLE scans (id TEXT PRIMARY KEY, label TEXT NOT NULL, source TEXT, rows INTEGER NOT NULL,"
+                 " fingerprint TEXT NOT NULL UNIQUE, created_at REAL NOT NULL)")
+    conn.execute("INSERT INTO scans VALUES ('old', 'Old scan', 'Reddit', 3, 'abc', 1.0)")
+    conn.commit()
+    conn.close()
+
+    history = ScanHistory(root=str(tmp_path))
+
+    assert [meta["id"] for meta in history.list()] == ["old"]
+    assert history.list(owner="session:x") == []
+    history.close()
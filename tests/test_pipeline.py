@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from painscout.config import Config
+from painscout.pipeline import ScanPipeline
+from painscout.scraper import RedditScraper
+from painscout.store import PostStore
+
+from test_post_store import FakePushshift, make_posts
+
+
+def record(post_id, sub, title, score, comments=0):
+    return {"source": "Reddit", "sub_source": sub, "id": post_id, "title": title, "text": "", "url": "",
+            "score": score, "comments": comments, "created_at": "2026-01-01T00:00:00", "author": "someone"}
+
+
+CROSS_POST = "Looking for an alternative to Zapier that does not cost 800 dollars a month for ten thousand tasks"
+
+
+class FakeScraper:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def iter_scan(self, subreddits, keywords, **kwargs):
+        yield from self.chunks
+
+    def _get_beautiful_demo_data(self, source="Reddit"):
+        return []
+
+
+class CountingAnalyzer:
+    def __init__(self):
+        self.analyzed = []
+
+    def analyze_batch(self, df):
+        self.analyzed.extend(df['id'].tolist())
+        return df.assign(pain_point=df['title'], sentiment_score=5, category="Pricing",
+                         target_audience="Founders", urgency="High")
+
+
+@pytest.fixture(autouse=True)
+def plain_pipeline(monkeypatch):
+    monkeypatch.setattr(Config, "RELEVANCE_FILTER_ENABLED", False)
+    monkeypatch.setattr(Config, "THEMES_ENABLED", False)
+    monkeypatch.setattr(Config, "THEME_LLM_REPRESENTATIVES_ONLY", False)
+    monkeypatch.setattr(Config, "DEDUP_ENABLED", True)
+
+
+def test_cross_post_in_a_later_chunk_is_not_analyzed_again():
+    analyzer = CountingAnalyzer()
+    chunks = [
+        (0, "r/SaaS", [record("a1", "r/SaaS", CROSS_POST, 100, 10),
+                       record("a2", "r/SaaS", "Invoicing for agencies is a nightmare every single month", 5)], True),
+        (1, "r/startups", [record("b1", "r/startups", CROSS_POST + "!", 40, 4)], True),
+    ]
+    pipeline = ScanPipeline(FakeScraper(chunks), analyzer, workers=1)
+
+    results = pipeline.run(["SaaS", "startups"], [])
+
+    assert sorted(analyzer.analyzed) == ["a1", "a2"]
+    merged = results.set_index('id').loc["a1"]
+    assert (merged['score'], merged['comments'], merged['duplicates']) == (140, 14, 2)
+    assert pipeline.stats['sources_scanned'] == pipeline.stats['sources_analyzed'] == 2
+
+
+def test_deep_scan_streams_pages_before_the_subreddit_finishes(monkeypatch):
+    monkeypatch.setattr(Config, "DEEP_SCAN_PAGE_SIZE", 100)
+    transport = FakePushshift(make_posts(250))
+    scraper = RedditScraper(transport=transport, store=PostStore(":memory:"))
+
+    chunks = list(scraper.iter_scan(["SaaS"], ["need"], days=30, deep=True))
+
+    # One chunk per page (the cursor page re-reads its boundary second), only the final one flagged
+    assert len(chunks) == 3
+    assert [last for _, _, _, last in chunks] == [False, False, True]
+    assert len(chunks[0][2]) == 100 and sum(len(records) for _, _, records, _ in chunks) == 250
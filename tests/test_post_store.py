@@ -0,0 +1,157 @@
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from painscout.store import PostStore
+from painscout.scraper import RedditScraper
+
+
+class FakePushshift:
+    """Pushshift stand-in: filters by `after`/`before`, sorts by `sort_type`, caps at `size`."""
+
+    def __init__(self, posts):
+        self.posts = posts
+        self.requests = []
+        self.fail_after = None
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(dict(params))
+        if self.fail_after is not None and len(self.requests) > self.fail_after:
+            return SimpleNamespace(status_code=503, json=lambda: {})
+        matched = [
+            p for p in self.posts
+            if p['created_utc'] > params['after'] and ('before' not in params or p['created_utc'] < params['before'])
+        ]
+        matched.sort(key=lambda p: p[params['sort_type']], reverse=True)
+        page = matched[:params['size']]
+        return SimpleNamespace(status_code=200, json=lambda: {'data': page})
+
+
+def make_posts(count, newest=None, start_id=0):
+    rng = random.Random(start_id)
+    newest = newest or int(time.time()) - 60
+    return [
+        {'id': f"p{start_id + i}", 'title': f"post {start_id + i}", 'selftext': "", 'score': rng.randint(0, 1000),
+         'num_comments': 1, 'created_utc': newest - i * 2400}
+        for i in range(count)
+    ]
+
+
+def make_scraper(posts, store=True):
+    transport = FakePushshift(posts)
+    scraper = RedditScraper(transport=transport, store=PostStore(":memory:"))
+    if not store:
+        scraper.store = None
+    return scraper, transport
+
+
+def scan(scraper, **kwargs):
+    fetch = scraper._scan_subreddit_stored if scraper.store else scraper.scan_subreddit
+    return fetch("SaaS", ["need"], days=30, **kwargs)
+
+
+def watermark(scraper):
+    return scraper.store.get_watermark("Reddit", "r/SaaS", PostStore.query_key(["need"]))
+
+
+@pytest.fixture
+def posts():
+    return make_posts(600)
+
+
+def test_default_scan_matches_uncached_and_covers_nothing(posts):
+    scraper, _ = make_scraper(posts)
+    uncached, _ = make_scraper(posts, store=False)
+
+    results = scan(scraper)
+
+    assert [r['id'] for r in results] == [r['id'] for r in scan(uncached)]
+    assert len(results) == 50
+    # A top-by-score sample says nothing about the rest of the window
+    assert watermark(scraper) is None
+
+
+def test_deep_scan_after_default_scan_walks_whole_window(posts):
+    scraper, _ = make_scraper(posts)
+    uncached, _ = make_scraper(posts, store=False)
+
+    scan(scraper)
+    deep = scan(scraper, deep=True)
+
+    assert len(deep) == len(scan(uncached, deep=True)) == 600
+    assert watermark(scraper)[0] == posts[0]['created_utc']
+
+
+def test_rescan_only_fetches_posts_past_watermark(posts):
+    scraper, transport = make_scraper(posts)
+    scan(scraper, deep=True)
+    high, _ = watermark(scraper)
+
+    transport.posts = make_posts(5, newest=posts[0]['created_utc'] + 5 * 2400, start_id=1000) + posts
+    transport.requests.clear()
+    deep = scan(scraper, deep=True)
+
+    assert len(deep) == 605
+    assert [r['after'] for r in transport.requests] == [int(high)]
+    assert watermark(scraper)[0] == transport.posts[0]['created_utc']
+
+
+
+def test_default_scan_ranks_by_current_score(posts):
+    scraper, transport = make_scraper(posts)
+    uncached, _ = make_scraper(posts, store=False)
+    scan(scraper, deep=True)
+
+    # Votes arrive after the post was stored
+    posts[-1]['score'] = 10_000
+    transport.requests.clear()
+    top = scan(scraper)
+
+    assert [r['sort_type'] for r in transport.requests] == ['score']
+    assert top[0]['id'] == posts[-1]['id']
+    assert [r['id'] for r in top] == [r['id'] for r in scan(uncached)]
+    # The refreshed engagement is stored too
+    assert next(r for r in scan(scraper, deep=True) if r['id'] == posts[-1]['id'])['score'] == 10_000
+
+
+def test_walk_cut_by_post_budget_keeps_watermark(posts):
+    scraper, _ = make_scraper(posts)
+
+    assert len(scan(scraper, deep=True, max_posts=100)) == 100
+    assert watermark(scraper) is None
+
+    assert len(scan(scraper, deep=True)) == 600
+    assert watermark(scraper) is not None
+
+
+def test_failed_walk_keeps_watermark(posts):
+    scraper, transport = make_scraper(posts)
+    transport.fail_after = 2
+
+    scan(scraper, deep=True)
+    assert watermark(scraper) is None
+
+    transport.fail_after = None
+    assert len(scan(scraper, deep=True)) == 600
+
+
+def test_x_search_cut_by_budget_is_incomplete():
+    def search_recent_tweets(max_results, next_token=None, **kwargs):
+        page = int(next_token or 0)
+        tweets = [
+            SimpleNamespace(id=page * 100 + i, text="need a tool", author_id=1, created_at=SimpleNamespace(isoformat=lambda: "2026-01-01T00:00:00"),
+                            public_metrics={})
+            for i in range(max_results)
+        ]
+        return SimpleNamespace(data=tweets, meta={'next_token': str(page + 1)} if page < 4 else {})
+
+    scraper, _ = make_scraper([], store=False)
+    scraper.twitter_client = SimpleNamespace(search_recent_tweets=search_recent_tweets)
+
+    tweets, completed = scraper._search_x_query("(saas) (need)", None, budget=150)
+    assert len(tweets) == 150 and not completed
+
+    tweets, completed = scraper._search_x_query("(saas) (need)", None, budget=1000)
+    assert len(tweets) == 500 and completed
@@ -0,0 +1,56 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from painscout.profiling import SHARED_PROFILER, ProfileRun, profiled
+
+
+def profiled_work():
+    return sum(range(1000))
+
+
+def unrelated_work():
+    return sum(range(1000))
+
+
+def functions(run):
+    return {name for _, _, name in run.stats.stats}
+
+
+@pytest.mark.skipif(SHARED_PROFILER, reason="one profiler sees every thread on Python 3.12+")
+def test_only_the_runs_own_threads_are_profiled(tmp_path):
+    run = ProfileRun(label="test", directory=str(tmp_path)).start()
+    try:
+        # Another session's thread, started while the run is active
+        other = threading.Thread(target=unrelated_work)
+        other.start()
+        other.join()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(profiled(profiled_work)).result()
+            # The worker's profiler is switched off once the call returns
+            assert pool.submit(sys.getprofile).result() is None
+    finally:
+        run.stop()
+
+    assert "profiled_work" in functions(run)
+    assert "unrelated_work" not in functions(run)
+
+
+def test_profiled_is_a_no_op_outside_a_run():
+    assert profiled(profiled_work) is profiled_work
+
+
+def test_nested_pools_are_profiled(tmp_path):
+    def outer():
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(profiled(profiled_work)).result()
+
+    with ProfileRun(label="test", directory=str(tmp_path)) as run:
+        thread = threading.Thread(target=profiled(outer))
+        thread.start()
+        thread.join()
+
+    assert "profiled_work" in functions(run)
+    assert run.path and open(run.summary_path).read().startswith("Profile 'test'")
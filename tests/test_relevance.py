@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from painscout.relevance import NOISE_PENALTY, WEIGHTS, filter_relevant, score_relevance
+
+KEYWORDS = ["invoice", "crm"]
+
+
+def posts(*rows):
+    return pd.DataFrame([{"title": title, "text": text, "score": score, "comments": 0} for title, text, score in rows])
+
+
+def test_score_adds_up_weighted_signals():
+    df = posts(
+        ("Invoice tool", "", 0),
+        ("Is there a CRM that handles invoice reminders?", "", 0),
+    )
+
+    scores = score_relevance(df, KEYWORDS)
+
+    assert scores.iloc[0] == pytest.approx(WEIGHTS["trigger"] / 2 + WEIGHTS["length"] * len("invoice tool ") / 200)
+    # Two triggers, complaint/request wording and a question mark
+    assert scores.iloc[1] > WEIGHTS["trigger"] + WEIGHTS["pain"] + WEIGHTS["question"]
+
+
+def test_noise_and_engagement():
+    quiet = score_relevance(posts(("I hate my CRM", "", 0)), KEYWORDS).iloc[0]
+    popular = score_relevance(posts(("I hate my CRM", "", 499)), KEYWORDS).iloc[0]
+    promo = score_relevance(posts(("Giveaway: I hate my CRM", "", 0)), KEYWORDS).iloc[0]
+
+    assert popular == pytest.approx(quiet + WEIGHTS["engagement"], abs=1e-3)
+    assert promo < quiet - NOISE_PENALTY + 0.05
+
+
+def test_filter_keeps_rows_at_threshold_and_reports_skip_ratio():
+    df = posts(
+        ("Our CRM sucks, looking for an alternative", "", 10),
+        ("Weekly thread: share your wins", "", 3),
+        ("Nice weather", "", 0),
+        ("Invoice software is too expensive, anyone recommend one?", "", 2),
+    )
+    threshold = score_relevance(df, KEYWORDS).sort_values().iloc[2]
+
+    kept, stats = filter_relevant(df, KEYWORDS, threshold=threshold)
+
+    assert kept.index.tolist() == [0, 3]
+    assert (kept['relevance'] >= threshold).all()
+    assert stats == {"total": 4, "kept": 2, "skipped": 2, "skip_ratio": 0.5, "threshold": threshold}
+
+
+def test_filter_on_empty_frame():
+    kept, stats = filter_relevant(pd.DataFrame(), KEYWORDS, threshold=0.3)
+
+    assert kept.empty and stats["skip_ratio"] == 0.0
@@ -0,0 +1,22 @@
+import fpdf
+import pandas as pd
+
+from painscout.reporter import PDFReport, Reporter, _Buffer
+
+
+def test_full_report_is_a_pdf():
+    df = pd.DataFrame({
+        "pain_point": [f"Pain {i}" for i in range(60)], "category": ["Pricing", "UI/UX"] * 30,
+        "urgency": "High", "sentiment_score": 7, "score": range(60), "comments": 1, "source": "Reddit",
+    })
+
+    data = Reporter.generate_full_report(df, {"total_posts": 60, "top_category": "Pricing", "high_urgency_count": 60})
+
+    assert data[:5] == b"%PDF-" and data.rstrip().endswith(b"%%EOF")
+
+
+def test_buffer_patch_only_on_checked_fpdf_versions(monkeypatch):
+    assert isinstance(PDFReport().buffer, _Buffer)
+
+    monkeypatch.setattr(fpdf, "FPDF_VERSION", "1.7.3")
+    assert not isinstance(PDFReport().buffer, _Buffer)
@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from painscout.schema import URGENCY, apply_schema
+
+
+def test_unordered_categorical_urgency_is_normalized():
+    df = pd.DataFrame({"urgency": pd.Categorical(["high", "Low", "bogus"])})
+
+    urgency = apply_schema(df)["urgency"]
+
+    assert urgency.dtype == URGENCY
+    assert urgency.tolist()[:2] == ["High", "Low"] and pd.isna(urgency.iloc[2])
+
+
+def test_columns_already_in_target_dtype_are_kept():
+    df = apply_schema(pd.DataFrame({"urgency": ["Medium"], "source": ["Reddit"], "score": [3]}))
+
+    again = apply_schema(df)
+
+    assert again is df
+    assert isinstance(df["source"].dtype, pd.CategoricalDtype) and df["score"].dtype == np.int32
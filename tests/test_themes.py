@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from painscout.themes import cluster_themes, summarize_themes, tfidf_matrix, theme_representatives
+
+TOPICS = {
+    "invoice": ["Invoice reminders never get sent to clients", "Sending invoice reminders by hand every week",
+                "Invoice reminders fail for overdue clients", "Need automatic invoice reminders for clients"],
+    "payroll": ["Payroll export breaks every quarter", "Payroll export to accounting keeps failing",
+                "Quarterly payroll export errors again", "Payroll export format is wrong for accounting"],
+}
+
+
+def posts():
+    rows = [(topic, title) for topic, titles in TOPICS.items() for title in titles]
+    return pd.DataFrame({"topic": [t for t, _ in rows], "title": [t for _, t in rows], "text": "",
+                         "score": range(len(rows)), "comments": 0})
+
+
+def test_tfidf_rows_are_normalized_without_stop_words():
+    matrix, terms = tfidf_matrix(pd.Series(["the invoice is late", "an invoice reminder", "late reminder"]))
+
+    assert "the" not in terms and "invoice reminder" in terms
+    assert np.allclose(np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1, 1.0)
+
+
+def test_kmeans_separates_topics_and_labels_them_by_top_terms():
+    df = posts()
+
+    themes, labels, representatives = cluster_themes(df, n_themes=2)
+
+    by_topic = themes.groupby(df['topic']).nunique()
+    assert by_topic.tolist() == [1, 1] and themes.nunique() == 2
+    for topic in TOPICS:
+        assert topic in labels[df['topic'] == topic].iloc[0]
+    assert sorted(df['topic'].iloc[representatives]) == ["invoice", "payroll"]
+
+
+def test_representatives_and_summary_count_every_post():
+    df = posts()
+    picked, themes = theme_representatives(df, n_themes=2)
+
+    assert picked['theme_posts'].tolist() == [4, 4]
+    summary = summarize_themes(df.assign(theme=themes, theme_label="x"))
+    assert summary['posts'].tolist() == [4, 4] and summary['engagement'].sum() == sum(range(8))
+
+
+def test_only_stop_words_gives_one_catch_all_theme():
+    df = pd.DataFrame({"title": ["the and of", "it is the"], "text": ""})
+
+    themes, labels, _ = cluster_themes(df, n_themes=2)
+
+    assert themes.tolist() == [0, 0] and labels.tolist() == ["misc", "misc"]
@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+
+import pytest
+
+from painscout import transport as transport_module
+from painscout.transport import AIMDLimiter, HttpTransport, TokenBucket
+
+
+class FakeClock:
+    """Stands in for the transport's `time` module: sleeping just advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeSession:
+    def __init__(self, responses, clock):
+        self.responses = list(responses)
+        self.clock = clock
+        self.sent_at = []
+
+    def get(self, url, params=None, timeout=None):
+        self.sent_at.append(self.clock.now)
+        status, headers = self.responses.pop(0)
+        return SimpleNamespace(status_code=status, headers=headers)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(transport_module, "time", clock)
+    return clock
+
+
+def make_transport(responses, clock, **kwargs):
+    options = dict(rate=1000, burst=1, max_retries=3, backoff_base=0, backoff_max=30)
+    options.update(kwargs)
+    transport = HttpTransport(**options)
+    transport._session = FakeSession(responses, clock)
+    return transport
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    for _ in range(5):
+        bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_bucket_pause_blocks_then_allows_one_probe(clock):
+    bucket = TokenBucket(rate=1, capacity=5)
+    bucket.pause(10)
+
+    bucket.acquire()
+    assert clock.now == pytest.approx(1010)
+    bucket.acquire()
+    assert clock.now == pytest.approx(1011)
+
+
+def test_429_pauses_for_retry_after_then_retries(clock):
+    transport = make_transport([(429, {"Retry-After": "7"}), (200, {})], clock)
+
+    response = transport.get("https://api.example.com/search")
+
+    assert response.status_code == 200
+    sent = transport._session.sent_at
+    assert len(sent) == 2 and sent[1] - sent[0] == pytest.approx(7)
+
+
+def test_server_errors_back_off_and_last_response_is_returned(clock, monkeypatch):
+    monkeypatch.setattr(transport_module.random, "uniform", lambda low, high: high)
+    transport = make_transport([(503, {})] * 3, clock, max_retries=2, backoff_base=1)
+
+    response = transport.get("https://api.example.com/search")
+
+    assert response.status_code == 503
+    assert clock.sleeps == [1, 2]
+
+
+def test_client_errors_are_not_retried(clock):
+    transport = make_transport([(404, {})], clock)
+
+    assert transport.get("https://api.example.com/missing").status_code == 404
+    assert len(transport._session.sent_at) == 1
+
+
+def test_retry_after_accepts_http_dates(clock):
+    retry_at = "Wed, 21 Oct 2099 07:28:00 GMT"
+
+    assert HttpTransport._retry_after(SimpleNamespace(headers={"Retry-After": retry_at})) > 0
+    assert HttpTransport._retry_after(SimpleNamespace(headers={"Retry-After": "soon"})) is None
+
+
+def test_aimd_grows_by_about_one_per_window(clock):
+    limiter = AIMDLimiter(initial=4, maximum=16)
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+
+    assert 4.9 < limiter.limit < 5
+    assert limiter.in_flight == 0
+
+
+def test_aimd_halves_once_per_cooldown_and_respects_bounds(clock):
+    limiter = AIMDLimiter(initial=8, minimum=2, maximum=8, cooldown=1.0)
+
+    for _ in range(3):
+        limiter.acquire()
+    for _ in range(3):
+        limiter.release(throttled=True)
+    assert limiter.limit == 4
+
+    clock.now += 1
+    limiter.acquire()
+    limiter.release(throttled=True)
+    clock.now += 1
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 8